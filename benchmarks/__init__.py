@@ -0,0 +1,12 @@
+from .seed import SCALES, seed_bench_data, clear_bench_data
+from .suite import run_suite, save_results, load_results, compare_results
+
+__all__ = [
+    "SCALES",
+    "seed_bench_data",
+    "clear_bench_data",
+    "run_suite",
+    "save_results",
+    "load_results",
+    "compare_results"
+]
@@ -0,0 +1,95 @@
+"""
+Command line entry point of the benchmark suite.
+
+Run it from the parent of this repo, against the docker-compose database
+(connection values come from `.env` like the GUI's defaults):
+
+    python -m omakase.benchmarks run --scale 1k --seed
+    python -m omakase.benchmarks run --scale 1k --runs 50 --only add_reservation cancel_reservation
+    python -m omakase.benchmarks compare old.json new.json --metric p99_ms
+"""
+
+import argparse
+import datetime
+import os
+import sys
+from ..gui.config import server_defaults
+from .seed import SCALES, seed_bench_data
+from .suite import compare_results, load_results, run_suite, save_results
+
+# Default folder of the JSON reports
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def _run(args):
+    """Seed if asked, run the suite and save the report."""
+    server = server_defaults()
+    seeded = None
+    if args.seed:
+        print(f"Seeding {SCALES[args.scale]:,} reservations...")
+        seeded = seed_bench_data(server, SCALES[args.scale])
+    report = run_suite(server, args.runs, args.only, args.scale)
+    report["seeded"] = seeded
+    stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+    path = args.output or os.path.join(RESULTS_DIR,
+                                       f"{args.scale}-{stamp}.json")
+    save_results(report, path)
+
+    print(f"{'case':<26}{'p50':>10}{'p95':>10}{'p99':>10}"
+          f"{'queries':>9}{'conns':>7}{'errors':>8}")
+    for name, r in report["results"].items():
+        print(f"{name:<26}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}"
+              f"{r['p99_ms']:>10.2f}{r['queries_per_call']:>9.2f}"
+              f"{r['connections_per_call']:>7.2f}{r['errors']:>8}")
+    print(f"Saved to {path}")
+    return 0
+
+
+def _compare(args):
+    """Print the change of one metric between two reports."""
+    old, new = load_results(args.old), load_results(args.new)
+    if old.get("format") != new.get("format"):
+        print(f"warning: report formats differ ({old.get('format')} and "
+              f"{new.get('format')}), some cases are not comparable")
+    rows = compare_results(old, new, args.metric)
+    print(f"{'case':<26}{'old':>10}{'new':>10}{'change':>9}")
+    for name, before, after, change in rows:
+        before = "-" if before is None else f"{before:.2f}"
+        after = "-" if after is None else f"{after:.2f}"
+        change = "-" if change is None else f"{change:+.1f}%"
+        print(f"{name:<26}{before:>10}{after:>10}{change:>9}")
+    return 0
+
+
+def main(argv=None):
+    """Parse the command line and run a subcommand."""
+    parser = argparse.ArgumentParser(prog="python -m omakase.benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="time the hot paths")
+    run.add_argument("--scale", choices=list(SCALES), default="1k",
+                     help="data set size, recorded in the report")
+    run.add_argument("--seed", action="store_true",
+                     help="replace the bench data before running")
+    run.add_argument("--runs", type=int, default=20,
+                     help="measured calls per case (default 20)")
+    run.add_argument("--only", nargs="+", metavar="CASE",
+                     help="run only these cases")
+    run.add_argument("--output", help="report path (default results/)")
+    run.set_defaults(handler=_run)
+
+    compare = commands.add_parser("compare", help="diff two reports")
+    compare.add_argument("old")
+    compare.add_argument("new")
+    compare.add_argument("--metric", default="p95_ms",
+                         help="per-case field to compare (default p95_ms)")
+    compare.set_defaults(handler=_compare)
+
+    args = parser.parse_args(argv)
+    if args.command == "run" and args.runs < 1:
+        parser.error("--runs must be at least 1")
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
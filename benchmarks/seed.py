@@ -0,0 +1,138 @@
+"""
+Synthetic data for the benchmark suite.
+
+Seeding adds its own rooms, diners, allergies and reservations next to the
+starter data, all named with the `Bench` prefix, so it can be repeated
+(or removed with `clear_bench_data`) without touching real rows. Bench
+reservations fill every service start of every bench room from three days
+ahead on; starts are spaced by the longest experience duration and every
+diner is used once per start, so the seeded rows never overlap.
+"""
+
+import datetime
+import random
+from ..dal import DBconnection, clear_caches, clear_indexes, get_service_policy
+
+# Reservations per scale name
+SCALES = {
+    "1k": 1_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+}
+ROOM_PREFIX = "Bench Room "
+DINER_PREFIX = "Bench Diner "
+# Rows per multi-row INSERT and per commit
+BATCH_SIZE = 1000
+
+
+def clear_bench_data(server):
+    """
+    Delete every bench room and diner.
+
+    Their reservations and allergies go with them through the cascading
+    foreign keys.
+
+    Args:
+        server (dict): Connection kwargs for `mysql.connector.connect`.
+    """
+    db = DBconnection(server)
+    cur = db.execute_query("DELETE FROM rooms WHERE room LIKE %s",
+                           [ROOM_PREFIX + "%"])
+    cur.close()
+    cur = db.execute_query("DELETE FROM diners WHERE diner LIKE %s",
+                           [DINER_PREFIX + "%"])
+    cur.close()
+    db.commit()
+    db.disconnect()
+    clear_caches()
+    clear_indexes()
+
+
+def _insert_many(db, query, rows):
+    """Insert `rows` with `executemany`, committing every `BATCH_SIZE` rows."""
+    cur = db.cursor()
+    for i in range(0, len(rows), BATCH_SIZE):
+        cur.executemany(query, rows[i:i + BATCH_SIZE])
+        db.commit()
+    cur.close()
+
+
+def _reservation_rows(count, rooms, diners, policy, rng):
+    """Yield `count` non-overlapping `(dtime, room, diner_id, group)` rows."""
+    day = datetime.date.today() + datetime.timedelta(days=3)
+    made = 0
+    while made < count:
+        for start in policy.starts(day, policy.longest):
+            for room in rooms:
+                if made == count:
+                    return
+                # Consecutive diners within one start, so none is booked twice
+                yield (start, room, diners[made % len(diners)],
+                       rng.randint(1, 6))
+                made += 1
+        day += datetime.timedelta(days=1)
+
+
+def seed_bench_data(server, reservations, rooms=None, diners=None, seed_value=2025):
+    """
+    Replace the bench data with a fresh synthetic data set.
+
+    Args:
+        server (dict): Connection kwargs for `mysql.connector.connect`.
+        reservations (int): Number of bench reservations to create.
+        rooms (int, optional): Number of bench rooms. Defaults to one per
+            5,000 reservations, between 10 and 200.
+        diners (int, optional): Number of bench diners. Defaults to one per
+            100 reservations, at least twice the rooms and at most 10,000.
+        seed_value (int): Seed of the random group sizes.
+
+    Returns:
+        dict: Counts of the seeded rooms, diners, allergies and reservations.
+
+    Raises:
+        ValueError: If the service hours leave every weekday closed.
+    """
+    rooms = rooms or max(10, min(200, reservations // 5000))
+    diners = max(diners or min(10_000, reservations // 100), rooms * 2)
+    rng = random.Random(seed_value)
+    policy = get_service_policy(server)
+    if not policy.hours:
+        raise ValueError("no service hours to place reservations in")
+    clear_bench_data(server)
+
+    db = DBconnection(server)
+    cur = db.execute_query("SELECT MIN(id) FROM prices")
+    class_id = cur.fetchone()[0]
+    cur.close()
+
+    room_names = [f"{ROOM_PREFIX}{i:03d}" for i in range(1, rooms + 1)]
+    _insert_many(db, "INSERT INTO rooms (room, TVProvided, staff, classId) "
+                     "VALUES (%s, %s, 'Owner', %s)",
+                 [(name, i % 2, class_id)
+                  for i, name in enumerate(room_names)])
+    _insert_many(db, "INSERT INTO diners (diner, phone) VALUES (%s, %s)",
+                 [(f"{DINER_PREFIX}{i:05d}",
+                   f"555-{i // 10000:03d}-{i % 10000:04d}")
+                  for i in range(1, diners + 1)])
+    cur = db.execute_query("SELECT id FROM diners WHERE diner LIKE %s "
+                           "ORDER BY id", [DINER_PREFIX + "%"])
+    diner_ids = [diner_id for (diner_id,) in cur.fetchall()]
+    cur.close()
+    # Every tenth diner has an allergy, for the allergy screens
+    allergies = [(diner_id, "Nuts", "Mild") for diner_id in diner_ids[::10]]
+    _insert_many(db, "INSERT INTO allergies (dinerId, `type`, `level`) "
+                     "VALUES (%s, %s, %s)", allergies)
+    _insert_many(db, "INSERT INTO reservations "
+                     "(dateAndTime, room, dinerId, totalDiners) "
+                     "VALUES (%s, %s, %s, %s)",
+                 list(_reservation_rows(reservations, room_names, diner_ids,
+                                        policy, rng)))
+    db.disconnect()
+    clear_caches()
+    clear_indexes()
+    return {
+        "rooms": rooms,
+        "diners": diners,
+        "allergies": len(allergies),
+        "reservations": reservations,
+    }
@@ -0,0 +1,330 @@
+"""
+Timed runs of the DAL and BLL hot paths.
+
+Every case calls a public BLL function (which goes through the DAL, the
+pool and the caches like the GUI does) `runs` times and records:
+    - p50 / p95 / p99 and mean latency in milliseconds,
+    - statements sent to MySQL per call (`Questions` status counter),
+    - new MySQL connections opened per call (`Connections` counter),
+    - statements and pool checkouts per call as the DAL's own
+      instrumentation counts them (`track_request`).
+
+The status counters are global, so those numbers are only exact on a
+server that nothing else is using, such as the docker-compose database.
+They are read on a separate, unpooled connection whose own statements are
+measured once and subtracted.
+"""
+
+import datetime
+import json
+import math
+import os
+import platform
+import tempfile
+import time
+from collections import namedtuple
+import mysql.connector
+from .. import bll
+from ..dal import track_request
+from .seed import DINER_PREFIX, ROOM_PREFIX
+
+# Version of the result layout, bumped when fields change meaning.
+#   2: get_all_* calls only count as successful when they return rows;
+#      earlier reports timed readers that came back empty while instrumented
+FORMAT = 2
+
+# A benchmark case: `call(i)` runs iteration i; `check(result)` tells
+# whether it succeeded; `warmup` runs one unmeasured call first
+Case = namedtuple("Case", ["name", "call", "check", "warmup"])
+
+
+def _ok(result):
+    """Default success check: BLL functions signal failure with False."""
+    return result is not False
+
+
+class StatusProbe:
+    """
+    Reads the server's statement and connection counters.
+
+    Attributes:
+        con (mysql.connector.connection.MySQLConnection): Dedicated
+            connection, kept out of the DAL pool.
+        overhead (int): Statements counted for one `read()` itself.
+    """
+    def __init__(self, server):
+        self.con = mysql.connector.connect(**server)
+        self.overhead = 0
+        first = self.read()
+        second = self.read()
+        self.overhead = second[0] - first[0]
+
+    def read(self):
+        """
+        Read the counters.
+
+        Returns:
+            tuple[int, int]: `(questions, connections)` since server start.
+        """
+        cur = self.con.cursor()
+        cur.execute("SHOW GLOBAL STATUS "
+                    "WHERE Variable_name IN ('Questions', 'Connections')")
+        values = {name: int(value) for (name, value) in cur.fetchall()}
+        cur.close()
+        return values["Questions"], values["Connections"]
+
+    def server_version(self):
+        """Return the MySQL version string."""
+        return self.con.get_server_info()
+
+    def close(self):
+        """Close the probe connection."""
+        self.con.close()
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile.
+
+    Args:
+        values (list[float]): Samples, in any order.
+        pct (float): Percentile between 0 and 100.
+
+    Returns:
+        float: The sample at rank `ceil(pct / 100 * n)`.
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def measure(case, runs, probe):
+    """
+    Run one case and summarize its samples.
+
+    Args:
+        case (Case): The case to run.
+        runs (int): Number of measured calls.
+        probe (StatusProbe): Counter reader.
+
+    Returns:
+        dict: Latency percentiles in milliseconds, mean statements,
+        connections and pool checkouts per call, and the number of failed
+        calls.
+    """
+    if case.warmup:
+        case.call(-1)
+    latencies = []
+    queries = connections = errors = 0
+    dal_queries = checkouts = 0
+    for i in range(runs):
+        before = probe.read()
+        with track_request(case.name) as stats:
+            start = time.perf_counter()
+            try:
+                ok = case.check(case.call(i))
+            except Exception:
+                ok = False
+            elapsed = time.perf_counter() - start
+        after = probe.read()
+        latencies.append(elapsed * 1000)
+        queries += after[0] - before[0] - probe.overhead
+        connections += after[1] - before[1]
+        dal_queries += stats.queries
+        checkouts += stats.checkouts
+        errors += not ok
+    return {
+        "runs": runs,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "mean_ms": round(sum(latencies) / runs, 3),
+        "queries_per_call": round(queries / runs, 2),
+        "connections_per_call": round(connections / runs, 2),
+        "dal_queries_per_call": round(dal_queries / runs, 2),
+        "checkouts_per_call": round(checkouts / runs, 2),
+        "errors": errors,
+    }
+
+
+def _targets(server, runs):
+    """
+    Pick the seeded rows the cases look up and free slots to book.
+
+    Args:
+        server (dict): Connection parameters for the database.
+        runs (int): Number of free slots needed.
+
+    Returns:
+        dict: Bench room, diner and class names, the latest reservation
+        `(dtime, room)` and `runs` free start times after it.
+
+    Raises:
+        RuntimeError: If no bench data was seeded or every weekday is
+            closed.
+    """
+    room = f"{ROOM_PREFIX}001"
+    found = bll.get_searched_room(server, room)
+    page, _ = bll.get_reservations_page(server, None, 1, "desc")
+    if not found or not page:
+        raise RuntimeError("no bench data, run with --seed first")
+    latest = datetime.datetime.strptime(page[0][0], "%Y-%m-%d %H:%M:%S")
+    # Every slot after the latest reservation is free
+    policy = bll.get_service_policy(server)
+    if not policy.hours:
+        raise RuntimeError("no service hours to book in")
+    slots = []
+    day = latest.date() + datetime.timedelta(days=1)
+    while len(slots) < runs:
+        slots.extend(policy.starts(day, policy.longest)[:1])
+        day += datetime.timedelta(days=1)
+    return {
+        "room": room,
+        "diner": f"{DINER_PREFIX}00001",
+        "class": found[0][2],
+        "reservation": (latest, page[0][1]),
+        "slots": slots,
+    }
+
+
+def build_cases(server, runs, export_dir):
+    """
+    List the benchmark cases in the order they run.
+
+    `cancel_reservation` cancels the bookings made by `add_reservation`,
+    so it only succeeds when both run. The `get_all_*` readers must
+    return rows, since the bench data is seeded.
+
+    Args:
+        server (dict): Connection parameters for the database.
+        runs (int): Number of measured calls per case.
+        export_dir (str): Directory for the exported CSV files.
+
+    Returns:
+        list[Case]: The cases.
+    """
+    t = _targets(server, runs)
+    dtime, res_room = t["reservation"]
+    export_path = os.path.join(export_dir, "details.csv")
+    return [
+        Case("get_all_diners",
+             lambda i: bll.get_all_diners(server), bool, True),
+        Case("get_all_prices",
+             lambda i: bll.get_all_prices(server), bool, True),
+        Case("get_all_rooms", lambda i: bll.get_all_rooms(server), bool, True),
+        Case("get_all_allergies",
+             lambda i: bll.get_all_allergies(server), bool, True),
+        Case("get_all_reservations",
+             lambda i: bll.get_all_reservations(server), bool, True),
+        Case("get_all_details",
+             lambda i: bll.get_all_details(server), bool, True),
+        Case("get_all_revenues",
+             lambda i: bll.get_all_revenues(server), bool, True),
+        Case("get_searched_diner",
+             lambda i: bll.get_searched_diner(server, t["diner"]), bool, True),
+        Case("get_searched_class",
+             lambda i: bll.get_searched_class(server, t["class"]), bool, True),
+        Case("get_searched_room",
+             lambda i: bll.get_searched_room(server, t["room"]), bool, True),
+        Case("get_searched_allergy",
+             lambda i: bll.get_searched_allergy(server, t["diner"]), _ok, True),
+        Case("get_searched_reservation",
+             lambda i: bll.get_searched_reservation(server, dtime, res_room),
+             bool, True),
+        Case("get_searched_details",
+             lambda i: bll.get_searched_details(server, dtime, res_room),
+             bool, True),
+        Case("add_reservation",
+             lambda i: bll.add_reservation(server, t["slots"][i], t["room"],
+                                           t["diner"], 2),
+             lambda res: res is True, False),
+        Case("cancel_reservation",
+             lambda i: bll.cancel_reservation(server, t["slots"][i], t["room"]),
+             lambda res: res is True, False),
+        Case("export_details",
+             lambda i: bll.export_details(server, export_path),
+             lambda res: res[1], True),
+    ]
+
+
+def run_suite(server, runs=20, only=None, scale=None):
+    """
+    Run the benchmark cases against a seeded database.
+
+    Args:
+        server (dict): Connection parameters for the database.
+        runs (int): Number of measured calls per case. Defaults to 20.
+        only (Iterable[str], optional): Run only the cases with these names.
+        scale (str, optional): Name of the seeded scale, recorded as is.
+
+    Returns:
+        dict: Environment details and one result dict per case (see
+        `measure`), ready for `save_results`.
+    """
+    probe = StatusProbe(server)
+    try:
+        with tempfile.TemporaryDirectory() as export_dir:
+            cases = build_cases(server, runs, export_dir)
+            if only:
+                cases = [case for case in cases if case.name in set(only)]
+            results = {case.name: measure(case, runs, probe)
+                       for case in cases}
+        mysql_version = probe.server_version()
+    finally:
+        probe.close()
+    return {
+        "format": FORMAT,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "scale": scale,
+        "runs": runs,
+        "python": platform.python_version(),
+        "mysql": mysql_version,
+        "host": server.get("host"),
+        "results": results,
+    }
+
+
+def save_results(report, path):
+    """
+    Write a `run_suite` report as JSON.
+
+    Args:
+        report (dict): The report.
+        path (str): Target file; missing directories are created.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2, sort_keys=True)
+
+
+def load_results(path):
+    """Read a report written by `save_results`."""
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def compare_results(old, new, metric="p95_ms"):
+    """
+    Compare one metric of two reports, case by case.
+
+    Args:
+        old (dict): Baseline report.
+        new (dict): Report to check.
+        metric (str): A key of the per-case results. Defaults to "p95_ms".
+
+    Returns:
+        list[tuple[str, float | None, float | None, float | None]]:
+        `(case, old, new, change_pct)` for every case of either report;
+        values missing in one report are None.
+    """
+    rows = []
+    for name in sorted(set(old["results"]) | set(new["results"])):
+        before = old["results"].get(name, {}).get(metric)
+        after = new["results"].get(name, {}).get(metric)
+        change = None
+        if before and after is not None:
+            change = round((after - before) / before * 100, 1)
+        rows.append((name, before, after, change))
+    return rows
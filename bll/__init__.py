@@ -2,6 +2,7 @@
 from .diners_service import (
     get_diner_id,
     get_all_diners,
+    get_diners_page,
     get_searched_diner,
     add_diner,
     delete_diner,
@@ -10,6 +11,7 @@ from .diners_service import (
 # Prices
 from .prices_service import (
     get_all_prices,
+    get_prices_page,
     get_searched_class,
     add_class,
     update_class,
@@ -19,6 +21,7 @@ from .prices_service import (
 from .rooms_service import (
     room_existing,
     get_all_rooms,
+    get_rooms_page,
     get_searched_room,
     add_room,
     update_room,
@@ -27,6 +30,7 @@ from .rooms_service import (
 # Allergies
 from .allergies_service import (
     get_all_allergies,
+    get_allergies_page,
     get_searched_allergy,
     add_allergy,
     delete_allergy,
@@ -36,38 +40,50 @@ from .allergies_service import (
 from .reservations_service import (
     res_existing,
     get_all_reservations,
+    get_reservations_page,
     get_searched_reservation,
     add_reservation,
     cancel_reservation,
+    get_service_policy,
 )
+from .import_service import import_reservations
+
+# Availability
+from .availability_service import find_available_slots
 
 # Reports (Views + Export)
 from .views_service import (
     get_all_details,
+    get_details_page,
     get_searched_details,
     get_all_revenues,
+    get_revenues_range,
+    get_daily_revenues,
 )
 from .csv_service import (
     export_details,
 )
 
 # Connection
-from .connection_service import connected_db
+from .connection_service import connected_db, release_connections, get_table_versions, run_tracked
 __all__ = [
     # Diners
-    "get_diner_id", "get_all_diners", "get_searched_diner", "add_diner", "delete_diner",
+    "get_diner_id", "get_all_diners", "get_diners_page", "get_searched_diner", "add_diner", "delete_diner",
     # Prices
-    "get_all_prices", "get_searched_class", "add_class", "update_class",
+    "get_all_prices", "get_prices_page", "get_searched_class", "add_class", "update_class",
     # Rooms
-    "room_existing", "get_all_rooms", "get_searched_room", "add_room", "update_room",
+    "room_existing", "get_all_rooms", "get_rooms_page", "get_searched_room", "add_room", "update_room",
     # Allergies
-    "get_all_allergies", "get_searched_allergy", "add_allergy", "delete_allergy",
+    "get_all_allergies", "get_allergies_page", "get_searched_allergy", "add_allergy", "delete_allergy",
     # Reservations
-    "res_existing", "get_all_reservations", "get_searched_reservation", "add_reservation", "cancel_reservation",
+    "res_existing", "get_all_reservations", "get_reservations_page", "get_searched_reservation", "add_reservation", "cancel_reservation", "get_service_policy",
+    "import_reservations",
+    # Availability
+    "find_available_slots",
     # Reports
-    "get_all_details", "get_searched_details", "get_all_revenues",
+    "get_all_details", "get_details_page", "get_searched_details", "get_all_revenues", "get_revenues_range", "get_daily_revenues",
     # CSV Export
     "export_details",
     # Connection to Database
-    "connected_db"
+    "connected_db", "release_connections", "get_table_versions", "run_tracked"
 ]
@@ -26,12 +26,31 @@ def get_all_allergies(server):
     return Allergies.get_all_allergies(server)
 
 
+def get_allergies_page(server, after_key=None, limit=100, order="asc"):
+    """
+    Retrieve one page of allergy records with keyset pagination.
+
+    Args:
+        server (dict): Connection parameters for the database.
+        after_key (int, optional): Key of the last row of the previous
+            page, as returned with it. None starts from the first row.
+        limit (int): Maximum number of rows to return. Defaults to 100.
+        order (str): "asc" or "desc". Defaults to "asc".
+
+    Returns:
+        tuple[list, int | None]: Rows in the same shape as
+        `get_all_allergies` and the `after_key` of the next page (None on the
+        last page).
+    """
+    return Allergies.get_page(server, after_key, limit, order)
+
+
 def get_searched_allergy(server, name):
     """
     Search for all allergy records of a specific diner.
 
-    First checks whether the diner exists, then retrieves the associated
-    allergy records.
+    Retrieves the allergy records first. Only when none are found does it
+    check whether the diner exists.
 
     Args:
         server (dict): Connection parameters for the database.
@@ -44,12 +63,12 @@ def get_searched_allergy(server, name):
             - 0 if the diner exists but has no allergy records.
             - None if the diner does not exist in the diners table.
     """
-    res1 = get_diner_id(server, name)
-    if res1 == -1:
+    res = Allergies.get_searched_allergy(server, name)
+    if res:
+        return res
+    if get_diner_id(server, name) == -1:
         return None  # diner not found
-
-    res2 = Allergies.get_searched_allergy(server, name)
-    return 0 if len(res2) == 0 else res2
+    return 0
 
 
 def add_allergy(server, diner, allergy_type, allergy_level):
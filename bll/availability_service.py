@@ -0,0 +1,111 @@
+"""
+Business Logic Layer (BLL) for Availability.
+
+Answers "when is a room free for this party?" without trial bookings.
+All rooms and their reservations for the requested days are read in one
+query; each room's booked intervals are then swept together with the
+candidate slots, so a month-wide search costs a single round-trip plus a
+linear pass in Python. Service hours and durations come from the cached
+service policy.
+"""
+
+from datetime import date, datetime, timedelta
+from ..dal import Reservations, ServicePolicy, get_service_policy
+
+# Distance between two candidate start times
+SLOT_STEP = timedelta(minutes=30)
+
+
+def _as_date(value):
+    """Return the date part of a `date` or `datetime`."""
+    return value.date() if isinstance(value, datetime) else value
+
+
+def candidate_starts(first_day: date, last_day: date, policy=None):
+    """
+    List every allowed start time between two days.
+
+    Starts are within the service hours of their weekday and at least
+    2 days in the future, like `check_booking_rules` requires.
+
+    Args:
+        first_day (datetime.date): First day of the search.
+        last_day (datetime.date): Last day of the search (inclusive).
+        policy (ServicePolicy, optional): Service hours to use. Defaults
+            to `ServicePolicy.default()`.
+
+    Returns:
+        list[datetime.datetime]: Start times in ascending order.
+    """
+    policy = policy or ServicePolicy.default()
+    earliest = datetime.now() + timedelta(days=2)
+    starts = []
+    day = first_day
+    while day <= last_day:
+        starts.extend(slot for slot in policy.starts(day, SLOT_STEP)
+                      if slot >= earliest)
+        day += timedelta(days=1)
+    return starts
+
+
+def find_available_slots(server, date_range, party_size, class_name=None,
+                         tv=None):
+    """
+    Find every free room and start time for a party.
+
+    A slot is free when no reservation of the room overlaps the slot's
+    start plus the room's duration, the same rule `add_reservation`
+    enforces.
+
+    Args:
+        server (dict): Connection parameters for the database.
+        date_range (tuple[datetime.date, datetime.date]): First and last
+            day to search (both inclusive).
+        party_size (int): Number of people.
+        class_name (str, optional): Only rooms of this class.
+        tv (bool, optional): Only rooms with (True) or without (False) a
+            TV. None accepts both.
+
+    Returns:
+        list[tuple[datetime.datetime, str]] | int:
+            - `(start, room)` pairs ordered by start time, then room.
+            - -1 -> invalid date range (last day before first day).
+            - -2 -> invalid party size (<= 0).
+    """
+    first_day, last_day = (_as_date(d) for d in date_range)
+    if last_day < first_day:
+        return -1  # invalid date range
+    if party_size <= 0:
+        return -2  # invalid group size
+
+    policy = get_service_policy(server)
+    starts = candidate_starts(first_day, last_day, policy)
+    if not starts:
+        return []
+    bookings = Reservations.get_room_bookings(
+        server, starts[0], starts[-1] + policy.longest, class_name, tv)
+
+    # Sweep: per room, skip the bookings that end before the slot; a
+    # later one blocks the slot if it starts before the slot ends. Ends
+    # are not sorted when durations changed, so the skip stops at the
+    # first booking still running and the check scans from there.
+    rooms = sorted(bookings)
+    position = dict.fromkeys(rooms, 0)
+    free = []
+    for slot in starts:
+        for room in rooms:
+            booked = bookings[room]
+            i = position[room]
+            while i < len(booked) and booked[i][1] <= slot:
+                i += 1
+            position[room] = i
+            end = slot + policy.duration(room)
+            busy = False
+            while i < len(booked) and booked[i][0] < end:
+                if booked[i][1] > slot:
+                    busy = True
+                    break
+                i += 1
+            if not busy:
+                free.append((slot, room))
+    return free
@@ -1,4 +1,4 @@
-from ..dal import DBconnection
+from ..dal import DBconnection, TableVersions, close_all_pools, track_request
 # Test server if it is connectable
 def connected_db(server):
     """
@@ -21,10 +21,59 @@ def connected_db(server):
               that includes the reason for the failure.
     """
     try:
-        DBconnection(server)
+        # Hand the test connection back so the pool can reuse it
+        DBconnection(server).disconnect()
         mes = "Successfully connected with Omakase database!\n"
         return server, mes
     except Exception as e:
         # Error message will be displayed in the GUI layer
         return (f"Failed to connect!\n"
-                f"Reason: {e}")
\ No newline at end of file
+                f"Reason: {e}")
+
+# Close pooled connections when the program exits
+def release_connections():
+    """
+    Close every pooled database connection.
+
+    Called by the GUI layer before the application exits so the MySQL
+    server does not have to wait for idle sessions to time out.
+    """
+    close_all_pools()
+
+# Detect tables written since rows were loaded
+def get_table_versions(server, tables):
+    """
+    Get the write counters of the given tables.
+
+    The GUI layer compares them with the counters read when a screen was
+    loaded to decide whether the screen must be refreshed.
+
+    Args:
+        server (dict): Connection parameters for the database.
+        tables (Iterable[str]): Table names the screen reads from.
+
+    Returns:
+        dict[str, int] | None: Version per table, or None if the
+        versions are unavailable (then every screen counts as stale).
+    """
+    return TableVersions.get_versions(server, tables)
+
+# Count the database work of one call for the performance panel
+def run_tracked(func, *args):
+    """
+    Run a BLL function and count the database work it does.
+
+    Must run on the thread that does the database calls, since the
+    counting follows the current thread.
+
+    Args:
+        func (Callable): The BLL function, e.g. `get_diners_page`.
+        *args: Arguments for `func`.
+
+    Returns:
+        tuple[Any, RequestStats]: The result of `func` and its statement,
+        row, round-trip and connection totals.
+    """
+    with track_request(func.__name__) as stats:
+        result = func(*args)
+    return result, stats
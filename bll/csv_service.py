@@ -1,28 +1,56 @@
 import csv
+import datetime
+import gzip
+import os
+from mysql.connector import Error
 from ..dal import CreateCSV
 
 """
 Business Logic Layer (BLL) for CSV Export.
 
 This module provides an advanced feature that exports the `alldetails`
-view to a CSV file. It wraps the DAL `CreateCSV` class, handles error
-cases, and ensures user-friendly messages are returned to the GUI or
-other application layers.
+view to a CSV file. It streams rows from the DAL `CreateCSV` class into
+the file, handles error cases, and ensures user-friendly messages are
+returned to the GUI or other application layers.
+
+Exports can be limited to a range of dining times, or to the reservations
+created since the previous incremental export (for nightly jobs), and can
+be written gzip-compressed.
 """
 
+# Name of the high-water mark used by incremental exports
+WATERMARK_JOB = "export_details"
+# How far the upper bound of an incremental export stays behind the server
+# clock. `createdAt` is set at insert, not at commit, so a row of a write
+# transaction still open at `NOW(6)` would be invisible to the export and
+# then skipped by the moved watermark. The lag must exceed the longest
+# write transaction (e.g. a large CSV import).
+WATERMARK_LAG = datetime.timedelta(minutes=15)
+
 
-def export_details(server, file_path):
+def export_details(server, file_path, start=None, end=None, since_last=False,
+                   compress=False):
     """
     Export reservation details to a CSV file.
 
-    Retrieves data from the DAL `CreateCSV.export_details` method, then
-    attempts to write the results to the specified file path. Handles
-    common file I/O errors gracefully and returns messages suitable for
-    end-user display.
+    Streams rows from the DAL `CreateCSV.stream_details` generator straight
+    into the csv writer, so memory use stays constant no matter how large
+    the history is. Handles common file I/O errors gracefully and returns
+    messages suitable for end-user display.
 
     Args:
         server (dict): Connection parameters for the database.
         file_path (str): Full path to the CSV file to be created.
+        start (datetime.datetime | datetime.date, optional): Export only
+            reservations dining at or after this time.
+        end (datetime.datetime | datetime.date, optional): Export only
+            reservations dining before this time.
+        since_last (bool, optional): Export only reservations created since
+            the previous successful `since_last` export, then move the
+            high-water mark forward. Reservations of the last
+            `WATERMARK_LAG` are left for the next run. Defaults to False.
+        compress (bool, optional): Write a gzip-compressed file. Paths
+            ending in ".gz" are always compressed. Defaults to False.
 
     Returns:
         tuple[str, bool]:
@@ -33,28 +61,92 @@ def export_details(server, file_path):
                 * Insufficient permissions.
                 * Value parsing/conversion errors.
                 * CSV writer errors.
+                * Database errors while streaming; the partly written
+                  file is removed.
+                * The high-water mark of a `since_last` export could not
+                  be saved; the file is complete, but the next run
+                  exports the same reservations again.
     """
-    res = CreateCSV.export_details(server)
+    created_after = created_until = None
+    if since_last:
+        # Fix the upper bound first so rows added during the export are
+        # left for the next run; it trails the server clock so rows of
+        # transactions still open are not skipped
+        try:
+            created_after = CreateCSV.get_watermark(server, WATERMARK_JOB)
+            created_until = (CreateCSV.get_server_time(server)
+                             - WATERMARK_LAG)
+        except Error:
+            return "Error occurred while loading data. Please contact tech support", False
+        if created_after is not None and created_until <= created_after:
+            return "No reservation details data return", False
+    if compress or file_path.endswith(".gz"):
+        opener = gzip.open
+        mode = "wt"
+    else:
+        opener = open
+        mode = "w"
+
+    rows = CreateCSV.stream_details(server, start, end, created_after,
+                                    created_until)
+    try:
+        # Read the headers and the first row before creating the file
+        header = next(rows, None)
+        first = next(rows, None)
+    except Error:
+        header = None
 
-    if len(res) == 0:
+    if header is None:
+        rows.close()
         return "Error occurred while loading data. Please contact tech support", False
-    elif len(res) == 1:
+    elif first is None:
+        rows.close()
         return "No reservation details data return", False
     else:
+        created = False
         try:
-            with open(file_path, "w", newline='', encoding="utf-8") as file:
+            with opener(file_path, mode, newline='', encoding="utf-8") as file:
+                created = True
                 write_data = csv.writer(file)
-                write_data.writerows(res)
-                return f"The details file was successfully exported to {file_path}.", True
+                write_data.writerow(header)
+                write_data.writerow(first)
+                # Rows are written as they arrive from the database
+                write_data.writerows(rows)
         except FileNotFoundError:
-            return ("Failed to export: Invalid path, no such directory or file. "
+            result = ("Failed to export: Invalid path, no such directory or file. "
             "Please enter valid path.", False)
         except PermissionError:
-            return ("Failed to export: program does not have the necessary "
+            result = ("Failed to export: program does not have the necessary "
             "permissions ", False)
         except ValueError:
-            return ("Failed to export: data cannot be properly parsed or "
+            result = ("Failed to export: data cannot be properly parsed or "
             "converted", False)
         except csv.Error:
-            return ("Failed to export: other type failure occurred. Please contact"
+            result = ("Failed to export: other type failure occurred. Please contact"
                     " tech support.", False)
+        except Error:
+            # Database errors raised while streaming the remaining rows
+            result = ("Failed to export: error occurred while loading data. "
+                      "Please contact tech support.", False)
+        except OSError:
+            result = ("Failed to export: the file could not be written. "
+                      "Please check the disk and the path.", False)
+        else:
+            result = None
+        finally:
+            rows.close()
+
+        if result is not None:
+            # Do not leave a truncated file that looks like a valid export
+            if created:
+                try:
+                    os.remove(file_path)
+                except OSError:
+                    pass
+            return result
+        if since_last and not CreateCSV.set_watermark(server, WATERMARK_JOB,
+                                                       created_until):
+            return (f"The details file was exported to {file_path}, but the "
+                    "export position could not be saved. The next incremental "
+                    "export will repeat these reservations.", False)
+        return f"The details file was successfully exported to {file_path}.", True
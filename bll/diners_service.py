@@ -32,6 +32,24 @@ def get_all_diners(server):
     """
     return Diners.get_all_diners(server)
 
+def get_diners_page(server, after_key=None, limit=100, order="asc"):
+    """
+    Retrieve one page of diners with keyset pagination.
+
+    Args:
+        server (dict): Connection parameters for the database.
+        after_key (int, optional): Key of the last row of the previous
+            page, as returned with it. None starts from the first row.
+        limit (int): Maximum number of rows to return. Defaults to 100.
+        order (str): "asc" or "desc". Defaults to "asc".
+
+    Returns:
+        tuple[list, int | None]: Rows in the same shape as
+        `get_all_diners` and the `after_key` of the next page (None on the
+        last page).
+    """
+    return Diners.get_page(server, after_key, limit, order)
+
 def get_searched_diner(server, name):
     """
     Search for a diner by exact name.
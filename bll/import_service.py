@@ -0,0 +1,98 @@
+"""
+Business Logic Layer (BLL) for bulk reservation imports.
+
+This module loads many reservations at once, for example when migrating
+a partner's booking book. The business rules of `add_reservation` are
+checked in Python, then the DAL checks overlaps with one set-based query
+and inserts the accepted rows in a single transaction.
+"""
+
+import csv
+import os
+from datetime import datetime
+from .reservations_service import check_booking_rules, get_service_policy
+from ..dal import Reservations
+
+# Accepted datetime formats, the first one matches the CSV export
+DATETIME_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M")
+# Columns required in an imported CSV file (same names as the CSV export)
+CSV_COLUMNS = ("dateAndTime", "room", "diner", "totalDiners")
+
+
+def _parse_datetime(value):
+    """Convert a datetime or a string in one of `DATETIME_FORMATS`."""
+    if isinstance(value, datetime):
+        return value
+    for fmt in DATETIME_FORMATS:
+        try:
+            return datetime.strptime(str(value).strip(), fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"invalid datetime: {value}")
+
+
+def _read_csv(file_path):
+    """Yield `(dtime, room, diner, group)` tuples from a CSV file."""
+    with open(file_path, newline='', encoding="utf-8") as file:
+        for record in csv.DictReader(file):
+            yield tuple(record.get(column) for column in CSV_COLUMNS)
+
+
+def import_reservations(server, rows):
+    """
+    Import many reservations in one transaction.
+
+    Each row is validated like `add_reservation`: the datetime must be at
+    least two days ahead and within the service hours, the group size must
+    be positive, and neither the room nor the diner may overlap an existing
+    reservation or another row of the same import.
+
+    Args:
+        server (dict): Connection parameters for the database.
+        rows (Iterable[tuple] | str | os.PathLike): Either an iterable of
+            `(dtime, room, diner, group)` tuples, where `dtime` may be a
+            `datetime` or a "YYYY-MM-DD HH:MM[:SS]" string, or the path of a
+            CSV file with the columns `dateAndTime`, `room`, `diner` and
+            `totalDiners` (extra columns, as in the details export, are
+            ignored).
+
+    Returns:
+        list[tuple[int, bool | int]]: One `(row_number, result)` pair per
+        input row, numbered from 1 in input order. Results are:
+            - True  -> reservation imported.
+            - -1    -> invalid date/time.
+            - -2    -> invalid group size (<= 0).
+            - -3…-8 -> diner/room not found or overlaps, as in
+              `add_reservation`.
+            - -9    -> malformed row (missing field, unreadable datetime
+              or non-integer group size).
+            - False -> database error occurred, nothing was imported.
+
+    Raises:
+        OSError: If `rows` is a path that cannot be read.
+    """
+    if isinstance(rows, (str, os.PathLike)):
+        rows = _read_csv(rows)
+
+    policy = get_service_policy(server)
+    results = {}
+    valid = []
+    for number, row in enumerate(rows, start=1):
+        try:
+            dtime, room, diner, group = row
+            dtime = _parse_datetime(dtime)
+            group = int(group)
+            room = room.strip()
+            diner = diner.strip()
+        except (TypeError, ValueError, AttributeError):
+            results[number] = -9  # malformed row
+            continue
+
+        mes = check_booking_rules(dtime, group, policy)
+        if mes is not None:
+            results[number] = mes
+        else:
+            valid.append((number, dtime, room, diner, group))
+
+    results.update(Reservations.import_reservations(server, valid))
+    return sorted(results.items())
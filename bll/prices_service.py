@@ -16,11 +16,29 @@ def get_all_prices(server):
         server (dict): Connection parameters for the database.
 
     Returns:
-        list[list]: A list of `[classId, name, formatted_price]` for all
-        classes, where `formatted_price` is a string like "$100.00".
+        list[PriceRow]: A list of `(id, class_name, cost_per_person)` rows
+        for all classes, with the cost as a `Decimal`.
     """
     return Prices.get_all_prices(server)
 
+def get_prices_page(server, after_key=None, limit=100, order="asc"):
+    """
+    Retrieve one page of pricing classes with keyset pagination.
+
+    Args:
+        server (dict): Connection parameters for the database.
+        after_key (int, optional): Key of the last row of the previous
+            page, as returned with it. None starts from the first row.
+        limit (int): Maximum number of rows to return. Defaults to 100.
+        order (str): "asc" or "desc". Defaults to "asc".
+
+    Returns:
+        tuple[list, int | None]: Rows in the same shape as
+        `get_all_prices` and the `after_key` of the next page (None on the
+        last page).
+    """
+    return Prices.get_page(server, after_key, limit, order)
+
 def get_searched_class(server, name):
     """
     Search for a pricing class by exact name.
@@ -31,7 +49,7 @@ def get_searched_class(server, name):
 
     Returns:
         list[list] | None:
-            - A list of `[id, name, costPerPerson]` if matches are found.
+            - A list of `PriceRow` if matches are found.
             - None if no class matches the given name.
     """
     res = Prices.get_searched_class(server, name)
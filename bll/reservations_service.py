@@ -1,6 +1,7 @@
-from datetime import datetime, time, timedelta
+from datetime import datetime, timedelta
 from .rooms_service import room_existing
-from ..dal import Reservations
+from ..dal import Reservations, ServicePolicy
+from ..dal import get_service_policy as _load_policy
 
 """
 Business Logic Layer (BLL) for Reservations.
@@ -42,12 +43,31 @@ def get_all_reservations(server):
     return Reservations.get_all_reservations(server)
 
 
+def get_reservations_page(server, after_key=None, limit=100, order="asc"):
+    """
+    Retrieve one page of reservations with keyset pagination.
+
+    Args:
+        server (dict): Connection parameters for the database.
+        after_key (tuple, optional): Key of the last row of the previous
+            page, as returned with it. None starts from the first row.
+        limit (int): Maximum number of rows to return. Defaults to 100.
+        order (str): "asc" or "desc". Defaults to "asc".
+
+    Returns:
+        tuple[list, tuple | None]: Rows in the same shape as
+        `get_all_reservations` and the `after_key` of the next page (None on the
+        last page).
+    """
+    return Reservations.get_page(server, after_key, limit, order)
+
+
 def get_searched_reservation(server, dtime, room):
     """
     Search for a reservation by datetime and room.
 
-    Performs additional checks to ensure the room exists before
-    querying reservations.
+    The keyed search runs first. Only when nothing matches is the room
+    checked, to tell a missing room apart from a free time slot.
 
     Args:
         server (dict): Connection parameters for the database.
@@ -60,14 +80,60 @@ def get_searched_reservation(server, dtime, room):
             - 0 if the room exists but no reservation matches.
             - None if the room does not exist in the rooms table.
     """
-    res1 = room_existing(server, room)
-    if res1 == -1:
+    res = Reservations.get_searched_reservation(server, dtime, room)
+    if res:
+        return res
+    if room_existing(server, room) == -1:
         return None  # room not found
+    return 0  # no record
 
-    res2 = res_existing(server, dtime, room)
-    if res2 == -1:
-        return 0  # no record
-    return Reservations.get_searched_reservation(server, dtime, room)
+
+def get_service_policy(server):
+    """
+    Get the experience durations and service hours in effect.
+
+    The policy is cached with the other reference data and reloaded
+    after writes to the prices, rooms or service hours.
+
+    Args:
+        server (dict): Connection parameters for the database.
+
+    Returns:
+        ServicePolicy: Duration per room and booking window per weekday.
+    """
+    return _load_policy(server)
+
+
+def check_booking_rules(dtime: datetime, group, policy=None):
+    """
+    Check the booking window and group size rules of a reservation.
+
+    Rules:
+        - Booking date must be at least 2 days in advance.
+        - Reservations must start within the service hours of their
+          weekday (17:00 - 21:30 daily unless configured otherwise).
+        - Group size must be positive.
+
+    Args:
+        dtime (datetime.datetime): Desired reservation datetime.
+        group (int): Number of people.
+        policy (ServicePolicy, optional): Service hours to check against.
+            Defaults to `ServicePolicy.default()`.
+
+    Returns:
+        int | None:
+            - -1   -> invalid date/time (too soon or outside allowed hours).
+            - -2   -> invalid group size (<= 0).
+            - None -> both rules are satisfied.
+    """
+    policy = policy or ServicePolicy.default()
+    valid_date = datetime.now() + timedelta(days=2)
+
+    if dtime < valid_date or not policy.is_service_time(dtime):
+        return -1  # invalid time/date
+    if group <= 0:
+        return -2  # invalid group size
+    return None
 
 
 def add_reservation(server, dtime: datetime, room, diner, group):
@@ -76,9 +142,10 @@ def add_reservation(server, dtime: datetime, room, diner, group):
 
     Rules:
         - Booking date must be at least 2 days in advance.
-        - Each omakase experience lasts 1.5 hours.
-        - Store hours are 17:00 - 23:00; reservations must start
-          between 17:00 and 21:30.
+        - Each omakase experience lasts the duration of the room's
+          class (1.5 hours by default).
+        - Reservations must start within the service hours of their
+          weekday (17:00 - 21:30 by default).
         - Group size must be positive.
         - Overlapped reservations are not allowed.
 
@@ -97,15 +164,8 @@ def add_reservation(server, dtime: datetime, room, diner, group):
             - -3…-8 -> DAL-layer codes for diner/room not found or overlaps.
             - False -> database error occurred.
     """
-    start = time(17, 0)
-    end = time(21, 30)
-    valid_date = datetime.now() + timedelta(days=2)
-
-    if dtime < valid_date or dtime.time() < start or dtime.time() > end:
-        mes = -1  # invalid time/date
-    elif group <= 0:
-        mes = -2  # invalid group size
-    else:
+    mes = check_booking_rules(dtime, group, _load_policy(server))
+    if mes is None:
         mes = Reservations.add_reservation(server, dtime, room, diner, group)
 
     return mes
@@ -117,7 +177,9 @@ def cancel_reservation(server, dtime, room):
 
     Args:
         server (dict): Connection parameters for the database.
-        dtime (datetime.datetime): Target reservation datetime.
+        dtime (datetime.datetime | str): Target reservation datetime, or
+            its text as shown in the tree view ("YYYY-MM-DD HH:MM:SS").
+            Text is parsed here, so the DAL's booking index stays loaded.
         room (str): Room name.
 
     Returns:
@@ -126,4 +188,13 @@ def cancel_reservation(server, dtime, room):
             - -1    -> reservation not found.
             - False -> database error occurred.
     """
+    if isinstance(dtime, str):
+        # The DAL's booking index is keyed by datetime; a string would
+        # make it drop every indexed booking
+        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
+            try:
+                dtime = datetime.strptime(dtime.strip(), fmt)
+                break
+            except ValueError:
+                continue
     return Reservations.cancel_reservation(server, dtime, room)
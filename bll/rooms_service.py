@@ -38,6 +38,25 @@ def get_all_rooms(server):
     return Rooms.get_all_rooms(server)
 
 
+def get_rooms_page(server, after_key=None, limit=100, order="asc"):
+    """
+    Retrieve one page of rooms with keyset pagination.
+
+    Args:
+        server (dict): Connection parameters for the database.
+        after_key (str, optional): Key of the last row of the previous
+            page, as returned with it. None starts from the first row.
+        limit (int): Maximum number of rows to return. Defaults to 100.
+        order (str): "asc" or "desc". Defaults to "asc".
+
+    Returns:
+        tuple[list, str | None]: Rows in the same shape as
+        `get_all_rooms` and the `after_key` of the next page (None on the
+        last page).
+    """
+    return Rooms.get_page(server, after_key, limit, order)
+
+
 def get_searched_room(server, name):
     """
     Search for a room by exact name.
@@ -1,5 +1,4 @@
 from .rooms_service import room_existing
-from .reservations_service import res_existing
 from ..dal import AllDetails
 from ..dal import Revenues
 
@@ -22,20 +21,37 @@ def get_all_details(server):
         server (dict): Connection parameters for the database.
 
     Returns:
-        list[tuple]: A list of rows from the `alldetails` view, typically
-        including (date_time, room, diner, phone, class_name, group,
-        staff, allergy_info, bill).
+        list[DetailRow]: A list of rows from the `alldetails` view with
+        numeric `cost_per_person` and `bill` fields.
     """
     return AllDetails.get_all_details(server)
 
 
+def get_details_page(server, after_key=None, limit=100, order="asc"):
+    """
+    Retrieve one page of reservation details with keyset pagination.
+
+    Args:
+        server (dict): Connection parameters for the database.
+        after_key (tuple, optional): Key of the last row of the previous
+            page, as returned with it. None starts from the first row.
+        limit (int): Maximum number of rows to return. Defaults to 100.
+        order (str): "asc" or "desc". Defaults to "asc".
+
+    Returns:
+        tuple[list, tuple | None]: Rows in the same shape as
+        `get_all_details` and the `after_key` of the next page (None on the
+        last page).
+    """
+    return AllDetails.get_page(server, after_key, limit, order)
+
+
 def get_searched_details(server, dtime, room):
     """
     Search for reservation details by datetime and room.
 
-    Checks:
-        - Room existence in the rooms table.
-        - Reservation existence in the reservations table.
+    The keyed search runs first. When nothing matches, the room
+    existence in the rooms table decides between `None` and `0`.
 
     Args:
         server (dict): Connection parameters for the database.
@@ -44,19 +60,16 @@ def get_searched_details(server, dtime, room):
 
     Returns:
         list[list] | int | None:
-            - A list of `[date_time, room, diner, phone, class_name,
-              group, staff, allergy_info, bill]` if found.
+            - A list of `DetailRow` if found.
             - 0 if the room exists but no reservation matches.
             - None if the room does not exist in the rooms table.
     """
-    res1 = room_existing(server, room)
-    if res1 == -1:
+    res = AllDetails.get_searched_detail(server, dtime, room)
+    if res:
+        return res
+    if room_existing(server, room) == -1:
         return None  # room not found
-
-    res2 = res_existing(server, dtime, room)
-    if res2 == -1:
-        return 0  # no reservation found
-    return AllDetails.get_searched_detail(server, dtime, room)
+    return 0  # no reservation found
 
 
 # ============= Total Revenue By Class View ===============
@@ -72,3 +85,33 @@ def get_all_revenues(server):
         typically containing (class_name, total_revenue).
     """
     return Revenues.get_all_revenues(server)
+
+
+def get_revenues_range(server, offset=0, limit=100):
+    """
+    Retrieve one page of revenue rows by class.
+
+    Args:
+        server (dict): Connection parameters for the database.
+        offset (int): Number of rows to skip. Defaults to 0.
+        limit (int): Maximum number of rows to return. Defaults to 100.
+
+    Returns:
+        list: Rows in the same shape as `get_all_revenues`.
+    """
+    return Revenues.get_range(server, offset, limit)
+
+
+def get_daily_revenues(server, start=None, end=None):
+    """
+    Retrieve revenue per class and day, optionally within a date range.
+
+    Args:
+        server (dict): Connection parameters for the database.
+        start (datetime.date, optional): First day to include.
+        end (datetime.date, optional): Last day to include.
+
+    Returns:
+        list[tuple]: Rows of (day, class_name, total_diners, revenue).
+    """
+    return Revenues.get_daily_revenues(server, start, end)
@@ -1,12 +1,23 @@
 from .all_details import AllDetails
 from .allergies import Allergies
+from .cache import configure_cache, clear_caches
 from .create_csv import CreateCSV
 from .connection import DBconnection
 from .diners import Diners
+from .instrumentation import (
+    QueryEvent, RequestStats, LoggingSink, RingBufferSink, JsonlSink,
+    add_sink, remove_sink, clear_sinks, track_request, tracked,
+)
+from .interval_index import configure_index, clear_indexes
+from .policy import ServicePolicy, get_service_policy
+from .pool import configure_pool, close_all_pools
 from .prices import Prices
 from .reservations import Reservations
 from .revenue import Revenues
 from .rooms import Rooms
+from .rows import DetailRow, PriceRow
+from .table_versions import TableVersions
+from .unit_of_work import UnitOfWork
 
 __all__ = [
     "AllDetails",
@@ -17,5 +28,27 @@ __all__ = [
     "Prices",
     "Reservations",
     "Revenues",
-    "Rooms"
+    "Rooms",
+    "DetailRow",
+    "PriceRow",
+    "QueryEvent",
+    "RequestStats",
+    "LoggingSink",
+    "RingBufferSink",
+    "JsonlSink",
+    "ServicePolicy",
+    "TableVersions",
+    "UnitOfWork",
+    "configure_pool",
+    "close_all_pools",
+    "configure_cache",
+    "clear_caches",
+    "configure_index",
+    "clear_indexes",
+    "get_service_policy",
+    "add_sink",
+    "remove_sink",
+    "clear_sinks",
+    "track_request",
+    "tracked"
 ]
\ No newline at end of file
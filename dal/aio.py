@@ -0,0 +1,147 @@
+"""
+Asyncio front end for the Data Access Layer (DAL).
+
+Every DAL class is mirrored here with the same methods and arguments, but
+each method is a coroutine:
+
+    rows = await aio.Reservations.get_all_reservations(server)
+
+The calls run on a dedicated thread pool, so they keep using the pooled
+connections, stored procedures and transactions of the synchronous DAL
+while the event loop stays free. A `session` (UnitOfWork) may be passed
+to consecutive awaited calls; they run one after another, never at the
+same time, which is what a MySQL connection requires.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from . import all_details, allergies, diners, prices, reservations, revenue, rooms
+
+# Default executor settings, changed through `configure_executor`
+_settings = {
+    "max_workers": 5,   # matches the default connection pool size
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Get the thread pool that runs DAL calls, creating it on first use.
+
+    Returns:
+        concurrent.futures.ThreadPoolExecutor: The shared executor.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_settings["max_workers"],
+                thread_name_prefix="omakase-dal")
+        return _executor
+
+
+def configure_executor(max_workers=None):
+    """
+    Change the executor settings.
+
+    The running executor finishes its queued calls and is replaced by a
+    new one on the next call.
+
+    Args:
+        max_workers (int, optional): Number of DAL calls run in parallel.
+    """
+    global _executor
+    with _executor_lock:
+        if max_workers is not None:
+            _settings["max_workers"] = max_workers
+        old, _executor = _executor, None
+    if old is not None:
+        old.shutdown(wait=False)
+
+
+def shutdown_executor(wait=True):
+    """
+    Stop the executor, e.g. when the application exits.
+
+    Args:
+        wait (bool): Whether to wait for running calls to finish.
+    """
+    global _executor
+    with _executor_lock:
+        old, _executor = _executor, None
+    if old is not None:
+        old.shutdown(wait=wait)
+
+
+async def run(func, *args, **kwargs):
+    """
+    Run a synchronous function on the DAL executor and await its result.
+
+    Also used for BLL functions, which call the DAL synchronously.
+
+    Args:
+        func (Callable): The function to run.
+        *args: Positional arguments for `func`.
+        **kwargs: Keyword arguments for `func`.
+
+    Returns:
+        Any: The return value of `func`.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_executor(), functools.partial(func, *args, **kwargs))
+
+
+class _AsyncDAL:
+    """
+    Expose the public static methods of a DAL class as coroutines.
+
+    Args:
+        cls (type): The synchronous DAL class, e.g. `Diners`.
+    """
+    def __init__(self, cls):
+        self._cls = cls
+        self.__doc__ = cls.__doc__
+
+    def __getattr__(self, name):
+        method = getattr(self._cls, name)
+        if name.startswith("_") or not callable(method):
+            raise AttributeError(name)
+
+        @functools.wraps(method)
+        async def wrapper(*args, **kwargs):
+            return await run(method, *args, **kwargs)
+
+        # Cache the wrapper so later lookups skip __getattr__
+        setattr(self, name, wrapper)
+        return wrapper
+
+    def __dir__(self):
+        return [n for n in dir(self._cls) if not n.startswith("_")]
+
+
+AllDetails = _AsyncDAL(all_details.AllDetails)
+Allergies = _AsyncDAL(allergies.Allergies)
+Diners = _AsyncDAL(diners.Diners)
+Prices = _AsyncDAL(prices.Prices)
+Reservations = _AsyncDAL(reservations.Reservations)
+Revenues = _AsyncDAL(revenue.Revenues)
+Rooms = _AsyncDAL(rooms.Rooms)
+
+__all__ = [
+    "AllDetails",
+    "Allergies",
+    "Diners",
+    "Prices",
+    "Reservations",
+    "Revenues",
+    "Rooms",
+    "configure_executor",
+    "get_executor",
+    "run",
+    "shutdown_executor",
+]
@@ -1,35 +1,63 @@
 import datetime
 from .connection import DBconnection
+from .paging import keyset_page
+from .rows import DetailRow
 # AllDetails View
 class AllDetails:
     """
-    A class to interact with the `alldetails` view.
+    A class to interact with the `all_details_raw` view.
 
-    The `alldetails` view aggregates information across reservations,
-    diners, classes, rooms, staff, and billing. It is typically used
-    for reporting or exporting complete reservation records.
+    The `all_details_raw` view aggregates information across reservations,
+    diners, classes, rooms, staff, and billing, with the cost per person
+    and the bill kept numeric. It is typically used for reporting
+    complete reservation records.
     """
     @staticmethod
     def get_all_details(server):
         """
-        Retrieve all records from the `alldetails` view.
+        Retrieve all records from the `all_details_raw` view.
 
         Args:
             server (dict): Connection kwargs for `mysql.connector.connect`.
 
         Returns:
-            list[tuple]: A list of rows, where each row typically contains:
-                (date_time, room, diner, phone, class_name,
-                 group_size, staff, allergy_info, bill_total)
+            list[DetailRow]: A list of rows with the datetime as
+                `datetime.datetime` and the cost per person and bill
+                as `Decimal`.
         """
         db = DBconnection(server)
-        query = "SELECT * FROM all_details"
+        query = "SELECT * FROM all_details_raw"
         cur = db.execute_query(query)
-        res = cur.fetchall()
+        res = list(map(DetailRow._make, cur.fetchall()))
         cur.close()
         db.disconnect()
         return res
 
+    @staticmethod
+    def get_page(server, after_key=None, limit=100, order="asc"):
+        """
+        Retrieve one page of reservation details with keyset pagination.
+
+        Pages are ordered by the `(dateAndTime, room)` key and start right
+        after `after_key`, so every page costs one index range scan however
+        deep into the table it is.
+
+        Args:
+            server (dict): Connection kwargs for `mysql.connector.connect`.
+            after_key (tuple[datetime, str], optional): Key of the last row of
+                the previous page. None starts from the first row.
+            limit (int): Maximum number of rows to return. Defaults to 100.
+            order (str): "asc" or "desc". Defaults to "asc".
+
+        Returns:
+            tuple[list, tuple[datetime, str] | None]: The page, a list of
+                `DetailRow` with numeric cost and bill, and the `after_key` of
+                the next page, or None on the last page.
+        """
+        select = "SELECT * FROM all_details_raw"
+        return keyset_page(server, select, ["dateAndTime", "room"], after_key,
+                           limit, order, make_row=DetailRow._make)
+
     @staticmethod
     def get_searched_detail(server, dtime: datetime, room_name):
         """
@@ -41,25 +69,19 @@ class AllDetails:
             room_name (str): Room name to filter by.
 
         Returns:
-            list[list]: A list of matching rows formatted as:
-                [date_time_str, room, diner, phone, class_name,
-                 group_size, staff, allergy_info, bill_total]
+            list[DetailRow]: A list of matching rows.
             Returns an empty list if no matches.
 
         Notes:
-            - Datetime comparison is performed as a string in the format
-              "YYYY-MM-DD HH:MM:SS".
-            - This method fetches all rows from the view and filters
-              client-side.
+            - The filter is pushed into MySQL. The view is merged into the
+              query, so the predicate reaches the `(dateAndTime, room)`
+              primary key of `reservations` instead of scanning the view.
         """
-        cache = []
-        res = AllDetails.get_all_details(server)
-        for (date_time, room, diner, phone, class_name, group, staff,
-             allergy, bill) in res:
-            # In sql, the date time is in YYYY-MM-DD HH:MM:SS format
-            # Convert the string before comparison
-            if (str(date_time) == dtime.strftime("%Y-%m-%d %H:%M:%S")
-                    and room == room_name):
-                cache.append([str(date_time), room, diner, phone, class_name,
-                              group, staff, allergy, bill])
+        db = DBconnection(server)
+        query = ("SELECT * FROM all_details_raw "
+                 "WHERE dateAndTime = %s AND room = %s")
+        cur = db.execute_query(query, [dtime, room_name])
+        cache = list(map(DetailRow._make, cur.fetchall()))
+        cur.close()
+        db.disconnect()
         return cache
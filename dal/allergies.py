@@ -1,5 +1,7 @@
 from mysql.connector import Error
 from .connection import DBconnection
+from .paging import keyset_page
+from .unit_of_work import UnitOfWork
 from .diners import Diners
 # Allergies Table
 class Allergies:
@@ -9,7 +11,7 @@ class Allergies:
     It manages interactions including retrieval, search, insertion and deletion.
     """
     @staticmethod
-    def get_allergy_id(server, diner, allergy_type):
+    def get_allergy_id(server, diner, allergy_type, session=None):
         """
         Get the allergy record ID for a diner/type pair.
 
@@ -17,11 +19,13 @@ class Allergies:
             server (dict): Connection kwargs for `mysql.connector.connect`.
             diner (str): Diner's name.
             allergy_type (str): Allergy category (e.g., 'Dairy', 'Shellfish').
+            session (UnitOfWork, optional): Open unit of work to run the
+                lookup on. Defaults to a new pooled connection.
 
         Returns:
             int: The allergy ID if found; `-1` if not found.
         """
-        db = DBconnection(server)
+        db = session or DBconnection(server)
         query = "SELECT get_allergy_id(%s, %s)"
         cur = db.execute_query(query, [diner, allergy_type])
         res = cur.fetchone()[0]
@@ -41,7 +45,7 @@ class Allergies:
             list[tuple]: A list of tuples representing allergy rows.
         """
         db = DBconnection(server)
-        cur = db.con.cursor()
+        cur = db.cursor()
         cur.callproc("get_all_allergies")
         cache = []
         for allergies in cur.stored_results():
@@ -51,11 +55,42 @@ class Allergies:
         db.disconnect()
         return cache
 
+    @staticmethod
+    def get_page(server, after_key=None, limit=100, order="asc"):
+        """
+        Retrieve one page of allergy records with keyset pagination.
+
+        Pages are ordered by the `id` key and start right after
+        `after_key`, so every page costs one index range scan however deep
+        into the table it is.
+
+        Args:
+            server (dict): Connection kwargs for `mysql.connector.connect`.
+            after_key (int, optional): Key of the last row of the previous
+                page. None starts from the first row.
+            limit (int): Maximum number of rows to return. Defaults to 100.
+            order (str): "asc" or "desc". Defaults to "asc".
+
+        Returns:
+            tuple[list, int | None]: The page, a list of
+                `(id, diner, type, level)` rows, and the `after_key` of the
+                next page, or None on the last page.
+        """
+        select = (
+            "SELECT a.id, diner, `type`, `level` "
+            "FROM allergies a JOIN diners d ON a.dinerId = d.id"
+        )
+        return keyset_page(server, select, ["a.id"], after_key, limit, order)
+
     @staticmethod
     def get_searched_allergy(server, diner_name):
         """
         Filter allergy records by diner name (exact match).
 
+        The filter runs in MySQL: the unique diner name resolves to one
+        diner id, which is then matched through the `dinerId` foreign key
+        index.
+
         Args:
             server (dict): Connection kwargs for `mysql.connector.connect`.
             diner_name (str): Diner's name to match.
@@ -64,23 +99,34 @@ class Allergies:
             list[list]: A list of `[id, diner, allergy_type, level]`
             records for the given diner. Empty list if none.
         """
-        cache = []
-        res = Allergies.get_all_allergies(server)
-        for (i, diner, allergy_type, level) in res:
-            if diner == diner_name:
-                cache.append([i, diner, allergy_type, level])
+        db = DBconnection(server)
+        query = (
+            "SELECT a.id, diner, `type`, `level` "
+            "FROM allergies a JOIN diners d ON a.dinerId = d.id "
+            "WHERE diner = %s ORDER BY a.id"
+        )
+        cur = db.execute_query(query, [diner_name])
+        cache = [[i, diner, allergy_type, level]
+                 for (i, diner, allergy_type, level) in cur.fetchall()]
+        cur.close()
+        db.disconnect()
         return cache
 
     @staticmethod
-    def add_Allergy(server, diner_name, allergy_type, allergy_level):
+    def add_Allergy(server, diner_name, allergy_type, allergy_level,
+                    session=None):
         """
         Add a new allergy record for a diner.
 
+        The diner and allergy lookups and the insertion share one
+        connection and one transaction.
+
         Args:
             server (dict): Connection kwargs for `mysql.connector.connect`.
             diner_name (str): Diner's name.
             allergy_type (str): Allergy category.
             allergy_level (str): Severity level.
+            session (UnitOfWork, optional): Open unit of work to join.
 
         Returns:
             bool | int:
@@ -90,40 +136,41 @@ class Allergies:
                 * -3    -> allergy already exists for diner
                 * False -> database error occurred
         """
-        db = DBconnection(server)
-        cur = db.con.cursor()
         # Though GUI has implemented the dropdown boxes, these types and
         # levels checks work as safety guard
         # If allergy type is other, the server will call diner to confirm 
         types = ['Dairy','Shellfish','Nuts','Eggs','Sesame','Wheat','Soy', 'Other']
         levels = ['Sensitive','Mild','Severe']
-        try:
-            diner_id = Diners.get_diner_id(server, diner_name)
-            allergy_id = Allergies.get_allergy_id(server,diner_name, allergy_type)
-
-            if allergy_type not in types or allergy_level not in levels:
-                # allergy type or level not on the related lists
-                mes = -1
-            elif diner_id == -1:
-                # Diner not on the diners table
-                mes = -2
-            elif allergy_id != -1:
-                # Allergy already exists for that diner
-                mes = -3
-            else:
-                cur.callproc("add_allergy",
-                             [diner_name, allergy_type, allergy_level])
-                db.commit()
-                mes = True
-        except Error:
+        with session or UnitOfWork(server) as db:
+            cur = db.cursor()
+            try:
+                diner_id = Diners.get_diner_id(server, diner_name, session=db)
+                allergy_id = Allergies.get_allergy_id(server, diner_name,
+                                                      allergy_type, session=db)
+
+                if allergy_type not in types or allergy_level not in levels:
+                    # allergy type or level not on the related lists
+                    mes = -1
+                elif diner_id == -1:
+                    # Diner not on the diners table
+                    mes = -2
+                elif allergy_id != -1:
+                    # Allergy already exists for that diner
+                    mes = -3
+                else:
+                    cur.callproc("add_allergy",
+                                 [diner_name, allergy_type, allergy_level])
+                    db.commit()
+                    mes = True
+            except Error:
                 # Failed
+                db.rollback()
                 mes = False
-        cur.close()
-        db.disconnect()
+            cur.close()
         return mes
 
     @staticmethod
-    def delete_allergy(server, diner_name, allergy_type):
+    def delete_allergy(server, diner_name, allergy_type, session=None):
         """
         Delete a diner's allergy record by type.
 
@@ -131,6 +178,7 @@ class Allergies:
             server (dict): Connection kwargs for `mysql.connector.connect`.
             diner_name (str): Diner's name.
             allergy_type (str): Allergy category to delete.
+            session (UnitOfWork, optional): Open unit of work to join.
 
         Returns:
             bool | int:
@@ -138,23 +186,23 @@ class Allergies:
                 * -1    -> allergy record not found
                 * False -> database error occurred
         """
-        db = DBconnection(server)
-        cur = db.con.cursor()
-        try:
-            allergy_id = Allergies.get_allergy_id(server, diner_name,
-                                                  allergy_type)
-            if allergy_id != -1:
-                cur.callproc("delete_allergy",
-                             [diner_name, allergy_type])
-                db.commit()
-                # Successfully deleted
-                mes = True
-            else:
-                # Allergy record not on file
-                mes = -1
-        except Error:
-            # Failed
-            mes = False
-        cur.close()
-        db.disconnect()
+        with session or UnitOfWork(server) as db:
+            cur = db.cursor()
+            try:
+                allergy_id = Allergies.get_allergy_id(server, diner_name,
+                                                      allergy_type, session=db)
+                if allergy_id != -1:
+                    cur.callproc("delete_allergy",
+                                 [diner_name, allergy_type])
+                    db.commit()
+                    # Successfully deleted
+                    mes = True
+                else:
+                    # Allergy record not on file
+                    mes = -1
+            except Error:
+                # Failed
+                db.rollback()
+                mes = False
+            cur.close()
         return mes
@@ -0,0 +1,254 @@
+"""
+Read-through cache for the reference tables of the Data Access Layer (DAL).
+
+Validation lookups such as `Prices.get_class_id`, `Rooms.get_room_existence`
+and `Diners.get_diner_id` run on almost every write, while the rows they
+look up rarely change. Their results are kept here, keyed by server, table
+and name, so repeated checks cost no round-trip.
+
+Entries expire after `ttl` seconds and the least recently used entries are
+evicted beyond `max_size` per table. The DAL's own write methods call
+`invalidate_cache` for the table they changed once their transaction has
+committed (see `UnitOfWork.after_commit`). Changes made by other
+processes are picked up through the opt-in `poll_interval`: the
+`cache_version_totals` view over the trigger-bumped counters is read once per
+interval and the tables whose version moved are dropped.
+
+A cache can also hold values derived from several tables (such as the
+service policy); `depends_on` registers those tables, so writing any of
+them drops the derived cache as well.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from mysql.connector import Error
+from .connection import DBconnection
+from .pool import server_key
+
+# Default cache settings, changed through `configure_cache`
+_settings = {
+    "ttl": 300.0,            # seconds an entry stays valid
+    "max_size": 1024,        # maximum number of entries kept per table
+    "poll_interval": None,   # seconds between version polls (None = off)
+}
+
+_caches = {}
+# cache name -> tables its values are derived from
+_dependencies = {}
+_versions = {}
+_last_poll = {}
+_lock = threading.Lock()
+
+
+class ReferenceCache:
+    """
+    A TTL and LRU bounded mapping of names to lookup results for one table.
+
+    Every `clear` bumps `generation`, so a lookup that started before an
+    invalidation does not store its (possibly stale) result afterwards.
+
+    Attributes:
+        ttl (float): Seconds an entry stays valid.
+        max_size (int): Maximum number of entries kept.
+        generation (int): Number of times the cache was cleared.
+    """
+    def __init__(self, ttl=300.0, max_size=1024):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.generation = 0
+        # name -> (value, stored_at), least recently used first
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        """
+        Look up a name.
+
+        Args:
+            name (str): The key of the entry.
+
+        Returns:
+            tuple[bool, object]: `(True, value)` on a hit,
+            `(False, None)` on a miss or an expired entry.
+        """
+        with self._lock:
+            item = self._entries.get(name)
+            if item is None:
+                return False, None
+            if time.monotonic() - item[1] > self.ttl:
+                del self._entries[name]
+                return False, None
+            self._entries.move_to_end(name)
+            return True, item[0]
+
+    def put(self, name, value, generation):
+        """
+        Store a lookup result unless the cache was cleared meanwhile.
+
+        Args:
+            name (str): The key of the entry.
+            value (object): The lookup result.
+            generation (int): `generation` read before the lookup ran.
+        """
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[name] = (value, time.monotonic())
+            self._entries.move_to_end(name)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+
+
+def _get_cache(server, table):
+    """Get the cache of one table for a server, creating it on first use."""
+    key = (server_key(server), table)
+    with _lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = ReferenceCache(_settings["ttl"], _settings["max_size"])
+            _caches[key] = cache
+        return cache
+
+
+def depends_on(cache_name, tables):
+    """
+    Declare that a cache holds values derived from other tables.
+
+    Args:
+        cache_name (str): Name used as `table` in `cached_lookup`.
+        tables (Iterable[str]): Tables whose writes make it stale.
+    """
+    with _lock:
+        _dependencies[cache_name] = frozenset(tables)
+
+
+def _affected(table):
+    """Return the cache names to drop when `table` was written."""
+    with _lock:
+        return [table] + [name for name, tables in _dependencies.items()
+                          if table in tables]
+
+
+def cached_lookup(server, table, name, loader, session=None):
+    """
+    Return the cached result for a name, loading it on a miss.
+
+    A value loaded inside a caller's unit of work may come from rows that
+    are not committed yet, so it is only cached once the unit commits and
+    never if it rolls back.
+
+    Args:
+        server (dict): Connection kwargs for `mysql.connector.connect`.
+        table (str): Reference table the name belongs to.
+        name (str): The name to look up.
+        loader (Callable[[], object]): Runs the lookup against MySQL.
+        session (UnitOfWork, optional): The unit of work `loader` runs on.
+
+    Returns:
+        object: The cached or freshly loaded result.
+    """
+    poll_versions(server)
+    cache = _get_cache(server, table)
+    hit, value = cache.get(name)
+    if hit:
+        return value
+    generation = cache.generation
+    value = loader()
+    if session is None:
+        cache.put(name, value, generation)
+    else:
+        # Dropped by the generation check if the table was written since
+        session.after_commit(lambda: cache.put(name, value, generation))
+    return value
+
+
+def invalidate_cache(server, table):
+    """
+    Drop the cached lookups of one table after it was written.
+
+    Args:
+        server (dict): Connection kwargs for `mysql.connector.connect`.
+        table (str): The table that changed.
+    """
+    for name in _affected(table):
+        _get_cache(server, name).clear()
+
+
+def poll_versions(server):
+    """
+    Drop tables that other processes changed, if polling is enabled.
+
+    Reads `cache_version_totals` at most once per `poll_interval`. Errors (for
+    example a database without the table) leave the cache untouched.
+
+    Args:
+        server (dict): Connection kwargs for `mysql.connector.connect`.
+    """
+    interval = _settings["poll_interval"]
+    if interval is None:
+        return
+    key = server_key(server)
+    now = time.monotonic()
+    with _lock:
+        if now - _last_poll.get(key, float("-inf")) < interval:
+            return
+        _last_poll[key] = now
+    try:
+        db = DBconnection(server)
+        cur = db.execute_query(
+            "SELECT tableName, version FROM cache_version_totals")
+        versions = dict(cur.fetchall())
+        cur.close()
+        db.disconnect()
+    except Error:
+        return
+    with _lock:
+        previous = _versions.get(key)
+        _versions[key] = versions
+        moved = {t for t in versions
+                 if previous is None or previous.get(t) != versions[t]}
+        caches = [cache for (k, t), cache in _caches.items()
+                  if k == key and (previous is None or t in moved
+                                   or moved & _dependencies.get(t, set()))]
+    for cache in caches:
+        cache.clear()
+
+
+def configure_cache(ttl=None, max_size=None, poll_interval=None):
+    """
+    Change the cache settings for existing and future caches.
+
+    Args:
+        ttl (float, optional): Seconds an entry stays valid.
+        max_size (int, optional): Maximum number of entries per table.
+        poll_interval (float, optional): Seconds between reads of the
+            `cache_version_totals` view. Pass 0 to poll on every lookup and
+            False to turn polling off.
+    """
+    changes = {"ttl": ttl, "max_size": max_size}
+    changes = {k: v for k, v in changes.items() if v is not None}
+    with _lock:
+        _settings.update(changes)
+        if poll_interval is not None:
+            _settings["poll_interval"] = (None if poll_interval is False
+                                          else poll_interval)
+        for cache in _caches.values():
+            for name, value in changes.items():
+                setattr(cache, name, value)
+
+
+def clear_caches():
+    """Drop every cached lookup, e.g. when switching databases."""
+    with _lock:
+        caches = list(_caches.values())
+        _versions.clear()
+        _last_poll.clear()
+    for cache in caches:
+        cache.clear()
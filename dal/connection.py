@@ -1,4 +1,6 @@
-import mysql.connector
+import time
+from .instrumentation import TimedCursor, emit, is_active
+from .pool import get_pool
 
 class DBconnection:
     """
@@ -9,6 +11,14 @@ class DBconnection:
     disconnect. It is designed to be used within the DAL layer to standardize 
     database interactions.
 
+    Connections are borrowed from the process-wide pool of the given server
+    and handed back on `disconnect()`, so repeated DAL calls reuse the same
+    authenticated sessions instead of reconnecting every time.
+
+    While instrumentation is active (see `instrumentation.add_sink` and
+    `track_request`), the checkout and every statement run through
+    `cursor()` are reported as timing events.
+
     Attributes:
         con (mysql.connector.connection_cext.CMySQLConnection): the active 
         connection object
@@ -26,7 +36,43 @@ class DBconnection:
         "database": "omakase"
         }
         """
-        self.con = mysql.connector.connect(**server)
+        self._pool = get_pool(server)
+        self._connect = 0.0
+        if not is_active():
+            self.con = self._pool.acquire()
+            return
+        started = time.time()
+        begin = time.perf_counter()
+        self.con, reused = self._pool.checkout()
+        self._connect = time.perf_counter() - begin
+        emit("checkout" if reused else "connect", None, None, None,
+             self._connect, self._connect, started)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.disconnect()
+        return False
+
+    def cursor(self, **kwargs):
+        """
+        Open a cursor on the connection.
+
+        DAL code opens every cursor here rather than on `con`, so that
+        its statements are timed while instrumentation is active.
+
+        Args:
+            **kwargs: Cursor options, e.g. `buffered=False`.
+
+        Returns:
+            cursor(mysql.connector.cursor.MySQLCursor | TimedCursor): The
+            cursor, wrapped in a `TimedCursor` while instrumented.
+        """
+        cursor = self.con.cursor(**kwargs)
+        if is_active():
+            return TimedCursor(cursor, self._connect)
+        return cursor
 
     def execute_query(self, query, params=None):
         """
@@ -41,18 +87,22 @@ class DBconnection:
             cursor(mysql.connector.cursor.MySQLCursor): A cursor object with the
             results of the executed query.
         """
-        cursor = self.con.cursor()
+        cursor = self.cursor()
         cursor.execute(query, params or [])
         return cursor
 
     def disconnect(self):
         """
-        Deactivate the connection object to MySQL.
+        Release the connection object back to the pool.
+
+        Uncommitted work is rolled back by the pool. Calling this method
+        more than once is harmless.
         """
-        # Cursor is already closed before closing connection
+        # Cursor is already closed before releasing connection
         # Since every method closes cursor at the end in this DAL.py design
-        if self.con.is_connected():
-            self.con.close()
+        if self.con is not None:
+            self._pool.release(self.con)
+            self.con = None
 
     def commit(self):
         """
@@ -62,3 +112,12 @@ class DBconnection:
         queries to make sure changes are saved.
         """
         self.con.commit()
+
+    def rollback(self):
+        """
+        Roll back the current transaction.
+
+        Use this method when a write fails halfway so that no partial
+        changes are kept on the connection.
+        """
+        self.con.rollback()
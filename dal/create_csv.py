@@ -1,34 +1,148 @@
+from mysql.connector import Error
 from .connection import DBconnection
 # Advanced Feature - export all details view to csv
 class CreateCSV:
     """
     A class to export reservation details into CSV files.
 
-    This class wraps the stored procedure `exportDetails`, which returns
-    the full `alldetails` view formatted for CSV export (including headers).
-    It enables advanced features like generating CSV reports for external
-    analysis or sharing.
+    This class streams the `all_details` view formatted for CSV export
+    (including headers), and keeps the high-water marks of incremental
+    exports. It enables advanced features like generating CSV reports for
+    external analysis or sharing.
     """
     @staticmethod
-    def export_details(server):
+    def stream_details(server, start=None, end=None, created_after=None,
+                       created_until=None, chunk_size=1000):
         """
-        Export all reservation details for CSV generation.
+        Stream reservation details for CSV generation.
+
+        Reads the `all_details` view through an unbuffered cursor and
+        fetches `chunk_size` rows at a time, so memory use stays constant
+        regardless of how much history is exported. The connection is
+        released when the generator is exhausted or closed.
+
+        All filters run in MySQL. The dining time filters use the
+        `dateAndTime` key; the creation time filters join the
+        `reservations` table on its `createdAt` index.
+
+        Args:
+            server (dict): Connection kwargs for `mysql.connector.connect`.
+            start (datetime.datetime | datetime.date, optional): Only rows
+                with `dateAndTime >= start`.
+            end (datetime.datetime | datetime.date, optional): Only rows
+                with `dateAndTime < end`.
+            created_after (datetime.datetime, optional): Only reservations
+                created strictly after this time.
+            created_until (datetime.datetime, optional): Only reservations
+                created at or before this time.
+            chunk_size (int, optional): Rows fetched per round trip.
+                Defaults to 1000.
+
+        Yields:
+            tuple: The column headers first (same names as the
+            `export_details` procedure), then one tuple per reservation
+            ordered by `dateAndTime`.
+        """
+        query = ("SELECT ad.dateAndTime, ad.room, ad.diner, ad.phone, "
+                 "ad.class, ad.totalDiners, ad.staff, ad.allergy, ad.bill "
+                 "FROM all_details ad")
+        conditions = []
+        params = []
+        if created_after is not None or created_until is not None:
+            query += (" JOIN reservations r ON r.dateAndTime = ad.dateAndTime "
+                      "AND r.room = ad.room")
+        for (condition, value) in (("ad.dateAndTime >= %s", start),
+                                   ("ad.dateAndTime < %s", end),
+                                   ("r.createdAt > %s", created_after),
+                                   ("r.createdAt <= %s", created_until)):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY ad.dateAndTime"
+
+        db = DBconnection(server)
+        cur = db.cursor(buffered=False)
+        try:
+            cur.execute(query, params)
+            # Export csv with headers
+            yield tuple(cur.column_names)
+            while True:
+                rows = cur.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            # An abandoned stream leaves unread rows behind; closing the
+            # cursor would fail, so the pool drops the whole connection
+            if not db.con.unread_result:
+                cur.close()
+            db.disconnect()
+
+    @staticmethod
+    def get_server_time(server):
+        """
+        Get the current time of the MySQL server.
 
         Args:
             server (dict): Connection kwargs for `mysql.connector.connect`.
 
         Returns:
-            list[tuple]: A list of rows with column headers included as
-            the first row (depending on stored procedure definition).
+            datetime.datetime: `NOW(6)` on the server, comparable with the
+            `createdAt` column of reservations.
         """
         db = DBconnection(server)
-        cur = db.con.cursor()
-        cache = []
-        # Export csv with headers
-        cur.callproc("export_details")
-        for res in cur.stored_results():
-            for r in res.fetchall():
-                cache.append(r)
+        cur = db.execute_query("SELECT NOW(6)")
+        res = cur.fetchone()[0]
         cur.close()
         db.disconnect()
-        return cache
+        return res
+
+    @staticmethod
+    def get_watermark(server, job):
+        """
+        Get the high-water mark of an incremental export job.
+
+        Args:
+            server (dict): Connection kwargs for `mysql.connector.connect`.
+            job (str): Name of the export job.
+
+        Returns:
+            datetime.datetime | None: Creation time of the newest reservation
+            already exported, or None if the job never ran.
+        """
+        db = DBconnection(server)
+        query = "SELECT lastCreatedAt FROM export_watermarks WHERE job = %s"
+        cur = db.execute_query(query, [job])
+        res = cur.fetchone()
+        cur.close()
+        db.disconnect()
+        return None if res is None else res[0]
+
+    @staticmethod
+    def set_watermark(server, job, created_at):
+        """
+        Store the high-water mark of an incremental export job.
+
+        Args:
+            server (dict): Connection kwargs for `mysql.connector.connect`.
+            job (str): Name of the export job.
+            created_at (datetime.datetime): Creation time up to which all
+                reservations have been exported.
+
+        Returns:
+            bool: True if stored (committed); False if a DB error occurred.
+        """
+        query = ("INSERT INTO export_watermarks (job, lastCreatedAt) "
+                 "VALUES (%s, %s) "
+                 "ON DUPLICATE KEY UPDATE lastCreatedAt = VALUES(lastCreatedAt)")
+        try:
+            with DBconnection(server) as db:
+                cur = db.execute_query(query, [job, created_at])
+                db.commit()
+                cur.close()
+            mes = True
+        except Error:
+            mes = False
+        return mes
@@ -1,5 +1,8 @@
 from mysql.connector import Error
+from .cache import cached_lookup, invalidate_cache
 from .connection import DBconnection
+from .paging import keyset_page
+from .unit_of_work import UnitOfWork
 # Diners Table
 class Diners:
     """
@@ -8,24 +11,32 @@ class Diners:
     It manages interactions including retrieval, search, insertion and deletion.
     """
     @staticmethod
-    def get_diner_id(server, diner):
+    def get_diner_id(server, diner, session=None):
         """
         Get the unique ID for a diner by name. 
 
+        Results are served from the reference cache when possible, so
+        repeated checks of the same name cost no round-trip.
+
         Args:
             server (dict): Connection kwargs for `mysql.connector.connect`.
             diner (str): The diner's name.
+            session (UnitOfWork, optional): Open unit of work to run the
+                lookup on. Defaults to a new pooled connection.
 
         Returns:
             int: The diner ID if found; `-1` if the diner does not exist.
         """
-        db = DBconnection(server)
-        query = "SELECT get_diner_id(%s)"
-        cur = db.execute_query(query, [diner])
-        res = cur.fetchone()[0]
-        cur.close()
-        db.disconnect()
-        return res
+        def load():
+            db = session or DBconnection(server)
+            query = "SELECT get_diner_id(%s)"
+            cur = db.execute_query(query, [diner])
+            res = cur.fetchone()[0]
+            cur.close()
+            db.disconnect()
+            return res
+        return cached_lookup(server, "diners", diner, load,
+                             session=session)
 
     @staticmethod
     def get_all_diners(server):
@@ -40,7 +51,7 @@ class Diners:
             containes `(id, diner, phone)`).
         """
         db = DBconnection(server)
-        cur = db.con.cursor()
+        cur = db.cursor()
         cur.callproc("get_all_diners")
         cache = []
         for diners in cur.stored_results():
@@ -50,11 +61,38 @@ class Diners:
         db.disconnect()
         return cache
 
+    @staticmethod
+    def get_page(server, after_key=None, limit=100, order="asc"):
+        """
+        Retrieve one page of diners with keyset pagination.
+
+        Pages are ordered by the `id` key and start right after
+        `after_key`, so every page costs one index range scan however deep
+        into the table it is.
+
+        Args:
+            server (dict): Connection kwargs for `mysql.connector.connect`.
+            after_key (int, optional): Key of the last row of the previous
+                page. None starts from the first row.
+            limit (int): Maximum number of rows to return. Defaults to 100.
+            order (str): "asc" or "desc". Defaults to "asc".
+
+        Returns:
+            tuple[list, int | None]: The page, a list of
+                `(id, diner, phone)` rows, and the `after_key` of the next
+                page, or None on the last page.
+        """
+        select = "SELECT id, diner, phone FROM diners"
+        return keyset_page(server, select, ["id"], after_key, limit, order)
+
     @staticmethod
     def get_searched_diner(server, diner):
         """
         Filter diners by exact name.
 
+        The filter runs in MySQL on the unique `diner` column, so only the
+        matching row is transferred.
+
         Args:
             server (dict): Connection kwargs for `mysql.connector.connect`.
             diner (str): Exact name to match.
@@ -63,22 +101,27 @@ class Diners:
             list[list]: A list of `[id, diner, phone]` for rows whose `name`
             equals `diner`. Returns an empty list if no matches.
         """
-        cache = []
-        res = Diners.get_all_diners(server)
-        for (i, name, phone) in res:
-            if name == diner:
-                cache.append([i, name, phone])
+        db = DBconnection(server)
+        query = "SELECT id, diner, phone FROM diners WHERE diner = %s"
+        cur = db.execute_query(query, [diner])
+        cache = [[i, name, phone] for (i, name, phone) in cur.fetchall()]
+        cur.close()
+        db.disconnect()
         return cache
 
     @staticmethod
-    def add_diner(server, name, phone):
+    def add_diner(server, name, phone, session=None):
         """
         Add a new diner if it does not already exist.
 
+        The existence check and the insertion share one connection and
+        one transaction.
+
         Args:
             server (dict): Connection kwargs for `mysql.connector.connect`.
             name (str): Diner's name (must be unique per DB rules).
             phone (str): Diner's phone number.
+            session (UnitOfWork, optional): Open unit of work to join.
 
         Returns:
             bool | int:
@@ -86,33 +129,36 @@ class Diners:
                 * -1    -> diner already exists (no changes made)
                 * False -> unexpected DB error (exception caught)
         """
-        db = DBconnection(server)
-        cur = db.con.cursor()
-        try:
-            diner_id = Diners.get_diner_id(server, name)
-            if diner_id == -1:
-                cur.callproc("add_diner", [name, phone])
-                db.commit()
-                # Successfully added
-                mes = True
-            else:
-                # Diner already exists
-                mes = -1
-        except Error:
+        with session or UnitOfWork(server) as db:
+            cur = db.cursor()
+            try:
+                diner_id = Diners.get_diner_id(server, name, session=db)
+                if diner_id == -1:
+                    cur.callproc("add_diner", [name, phone])
+                    db.commit()
+                    # Cached lookups dropped once committed
+                    db.after_commit(lambda: invalidate_cache(server, "diners"))
+                    # Successfully added
+                    mes = True
+                else:
+                    # Diner already exists
+                    mes = -1
+            except Error:
                 # Failed
+                db.rollback()
                 mes = False
-        cur.close()
-        db.disconnect()
+            cur.close()
         return mes
 
     @staticmethod
-    def delete_diner(server, name):
+    def delete_diner(server, name, session=None):
         """
         Delete an existing diner by name.
 
         Args:
             server (dict): Connection kwargs for `mysql.connector.connect`.
             name (str): Exact diner name to delete.
+            session (UnitOfWork, optional): Open unit of work to join.
 
         Returns:
             bool | int:
@@ -120,21 +166,23 @@ class Diners:
                 * -1    -> diner not found (no changes made)
                 * False -> unexpected DB error (exception caught)
         """
-        db = DBconnection(server)
-        cur = db.con.cursor()
-        try:
-            diner_id = Diners.get_diner_id(server, name)
-            if diner_id != -1:
-                cur.callproc("delete_diner", [name])
-                db.commit()
-                # Successfully deleted
-                mes = True
-            else:
-                # Diner is not on diners file
-                mes = -1
-        except Error:
-            # Failed
-            mes = False
-        cur.close()
-        db.disconnect()
+        with session or UnitOfWork(server) as db:
+            cur = db.cursor()
+            try:
+                diner_id = Diners.get_diner_id(server, name, session=db)
+                if diner_id != -1:
+                    cur.callproc("delete_diner", [name])
+                    db.commit()
+                    # Cached lookups dropped once committed
+                    db.after_commit(lambda: invalidate_cache(server, "diners"))
+                    # Successfully deleted
+                    mes = True
+                else:
+                    # Diner is not on diners file
+                    mes = -1
+            except Error:
+                # Failed
+                db.rollback()
+                mes = False
+            cur.close()
         return mes
\ No newline at end of file
@@ -0,0 +1,473 @@
+"""
+Timing events for every statement and connection checkout of the DAL.
+
+`DBconnection` reports each connection checkout and hands out cursors
+that time `execute`, `executemany` and `callproc`, including the time
+spent fetching the rows. Each report becomes a `QueryEvent` that goes to
+every registered sink (`LoggingSink`, `RingBufferSink`, `JsonlSink`, or
+any callable) and is counted by the active `track_request` contexts.
+A request context sums up the statements, round-trip time and
+connections of one BLL call, which makes N+1 patterns (one call issuing
+many small lookups) visible.
+
+With no sink registered and no request being tracked, `DBconnection`
+skips all of this and uses plain cursors.
+
+Parameter values are never recorded; the fingerprint only tells calls
+with the same values apart from calls with different ones. It is keyed
+with a random per-process secret, so values such as phone numbers cannot
+be guessed back from it, and fingerprints only match within one process.
+"""
+
+import contextvars
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque, namedtuple
+from contextlib import contextmanager
+from functools import wraps
+
+# One timed step.
+#   kind: "connect" (new connection), "checkout" (pooled connection),
+#         "query" (execute), "batch" (executemany) or "proc" (callproc)
+#   statement: SQL text or procedure name; None for connections
+#   fingerprint: parameter types plus a short hash of their values
+#   rows: rows fetched, or affected by a write; None if unknown
+#   elapsed_ms: time of the step, including fetches for queries
+#   connect_ms: checkout time of the connection the step ran on
+#   caller: "file:line function" of the first frame outside the DAL core
+#   request: name of the innermost tracked request, or None
+#   timestamp: `time.time()` when the step started
+QueryEvent = namedtuple("QueryEvent", [
+    "kind", "statement", "fingerprint", "rows", "elapsed_ms", "connect_ms",
+    "caller", "request", "timestamp"])
+
+_sinks = []
+_sinks_lock = threading.Lock()
+# Tracked requests of the current thread or task, innermost last
+_requests = contextvars.ContextVar("omakase_requests", default=())
+
+# Modules whose frames are plumbing, not callers
+_DAL = os.path.dirname(os.path.abspath(__file__))
+_INTERNAL = tuple(os.path.join(_DAL, name) for name in
+                  ("connection.py", "unit_of_work.py", "instrumentation.py",
+                   "pool.py", "paging.py"))
+_ROOT = os.path.dirname(_DAL)
+# Secret key of the parameter fingerprints, new for every process
+_FINGERPRINT_KEY = os.urandom(16)
+
+
+def is_active():
+    """Check whether any sink or tracked request wants events."""
+    return bool(_sinks) or bool(_requests.get())
+
+
+def add_sink(sink):
+    """
+    Register a sink for timing events.
+
+    Args:
+        sink (Callable[[QueryEvent], None]): Called with every event, on
+            the thread that ran the statement. It should return quickly.
+    """
+    with _sinks_lock:
+        _sinks.append(sink)
+
+
+def remove_sink(sink):
+    """Unregister a sink; unknown sinks are ignored."""
+    with _sinks_lock:
+        if sink in _sinks:
+            _sinks.remove(sink)
+
+
+def clear_sinks():
+    """Unregister every sink."""
+    with _sinks_lock:
+        _sinks.clear()
+
+
+def fingerprint(params):
+    """
+    Describe statement parameters without revealing them.
+
+    The hash is keyed with `_FINGERPRINT_KEY`, so equal values give equal
+    fingerprints only within the same process.
+
+    Args:
+        params (list | tuple | dict | None): Statement parameters.
+
+    Returns:
+        str | None: e.g. "datetime,str#1a2b3c4d", or None without params.
+    """
+    if not params:
+        return None
+    values = params.values() if isinstance(params, dict) else params
+    types = ",".join(type(v).__name__ for v in values)
+    digest = hashlib.blake2b(repr(params).encode(), digest_size=4,
+                             key=_FINGERPRINT_KEY).hexdigest()
+    return f"{types}#{digest}"
+
+
+def _caller():
+    """Return "file:line function" of the first frame outside the DAL core."""
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename.startswith(_INTERNAL):
+        frame = frame.f_back
+    if frame is None:
+        return None
+    path = frame.f_code.co_filename
+    if path.startswith(_ROOT):
+        path = os.path.relpath(path, _ROOT)
+    return f"{path}:{frame.f_lineno} {frame.f_code.co_name}"
+
+
+def emit(kind, statement, params, rows, elapsed, connect, started):
+    """
+    Build an event and hand it to the sinks and tracked requests.
+
+    Args:
+        kind (str): See `QueryEvent`.
+        statement (str | None): SQL text or procedure name.
+        params (list | tuple | dict | None): Statement parameters.
+        rows (int | None): Rows fetched or affected.
+        elapsed (float): Seconds the step took.
+        connect (float): Seconds the connection checkout took.
+        started (float): `time.time()` when the step started.
+    """
+    requests = _requests.get()
+    event = QueryEvent(kind, statement, fingerprint(params), rows,
+                       round(elapsed * 1000, 3), round(connect * 1000, 3),
+                       _caller(), requests[-1].name if requests else None,
+                       started)
+    for stats in requests:
+        stats.add(event)
+    with _sinks_lock:
+        sinks = list(_sinks)
+    for sink in sinks:
+        sink(event)
+
+
+class RequestStats:
+    """
+    Totals of one tracked request.
+
+    Attributes:
+        name (str): Request name, usually the BLL function.
+        queries (int): Statements sent (queries, batches and procedures).
+        rows (int): Rows fetched or affected, where known.
+        db_ms (float): Time spent in those statements.
+        checkouts (int): Connections taken from the pool.
+        connections (int): New connections opened among them.
+        connect_ms (float): Time spent getting connections.
+        elapsed_ms (float): Wall time of the whole request, set on exit.
+        statements (dict[str, int]): Count per statement or procedure.
+    """
+    def __init__(self, name):
+        self.name = name
+        self.queries = 0
+        self.rows = 0
+        self.db_ms = 0.0
+        self.checkouts = 0
+        self.connections = 0
+        self.connect_ms = 0.0
+        self.elapsed_ms = None
+        self.statements = {}
+        self._lock = threading.Lock()
+
+    def add(self, event):
+        """Count one event."""
+        with self._lock:
+            if event.kind in ("connect", "checkout"):
+                self.checkouts += 1
+                self.connections += event.kind == "connect"
+                self.connect_ms += event.elapsed_ms
+                return
+            self.queries += 1
+            self.rows += event.rows or 0
+            self.db_ms += event.elapsed_ms
+            self.statements[event.statement] = (
+                self.statements.get(event.statement, 0) + 1)
+
+    def as_dict(self):
+        """Return the totals as a plain dict, e.g. for JSON."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "queries": self.queries,
+                "rows": self.rows,
+                "db_ms": round(self.db_ms, 3),
+                "checkouts": self.checkouts,
+                "connections": self.connections,
+                "connect_ms": round(self.connect_ms, 3),
+                "elapsed_ms": self.elapsed_ms,
+                "statements": dict(self.statements),
+            }
+
+
+@contextmanager
+def track_request(name):
+    """
+    Count the statements and connections used inside a `with` block.
+
+    Requests nest: the statements of an inner request also count for the
+    outer ones. The context follows the current thread (or asyncio task),
+    so the block has to run where the DAL calls run.
+
+    Example:
+        with track_request("get_searched_details") as stats:
+            bll.get_searched_details(server, dtime, room)
+        print(stats.queries, stats.checkouts)
+
+    Args:
+        name (str): Request name, stored in the events.
+
+    Yields:
+        RequestStats: The totals, complete once the block exits.
+    """
+    stats = RequestStats(name)
+    token = _requests.set(_requests.get() + (stats,))
+    started = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats.elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+        _requests.reset(token)
+
+
+def tracked(func):
+    """Decorator running every call of `func` inside `track_request`."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with track_request(func.__name__):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+class TimedCursor:
+    """
+    A cursor wrapper that reports its statements as events.
+
+    A query's or procedure's event is sent once its rows are read: when
+    the next statement starts or the cursor is closed. Everything else
+    is passed through to the wrapped cursor.
+
+    Args:
+        cursor (mysql.connector.cursor.MySQLCursor): The real cursor.
+        connect (float): Seconds the connection checkout took.
+    """
+    def __init__(self, cursor, connect):
+        self._cursor = cursor
+        self._connect = connect
+        self._pending = None
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        row = self.fetchone()
+        while row is not None:
+            yield row
+            row = self.fetchone()
+
+    def execute(self, operation, params=None, **kwargs):
+        """Run a statement, timing it until its rows are read."""
+        self._finish()
+        started = time.time()
+        begin = time.perf_counter()
+        try:
+            return self._cursor.execute(operation, params, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - begin
+            rowcount = self._cursor.rowcount
+            # Rows read so far stay None until the first fetch
+            self._pending = ["query", operation, params, None, elapsed,
+                             started, rowcount if rowcount >= 0 else None]
+            if not getattr(self._cursor, "with_rows", True):
+                self._finish()
+
+    def executemany(self, operation, seq_params, **kwargs):
+        """Run a statement for many parameter sets and report it."""
+        self._finish()
+        seq_params = list(seq_params)
+        started = time.time()
+        begin = time.perf_counter()
+        try:
+            return self._cursor.executemany(operation, seq_params, **kwargs)
+        finally:
+            emit("batch", operation, seq_params[:1], self._cursor.rowcount,
+                 time.perf_counter() - begin, self._connect, started)
+
+    def callproc(self, procname, args=()):
+        """Call a stored procedure, timing it until its results are read."""
+        self._finish()
+        started = time.time()
+        begin = time.perf_counter()
+        try:
+            return self._cursor.callproc(procname, args)
+        finally:
+            # Rows are counted as the caller reads `stored_results()`;
+            # reading them here would consume them
+            self._pending = ["proc", procname, args, None,
+                             time.perf_counter() - begin, started, None]
+
+    def stored_results(self):
+        """
+        Iterate over the result sets of the last procedure call.
+
+        Yields:
+            StoredResult: Each result set, counting the rows read from it
+            towards the procedure's event.
+        """
+        for result in self._cursor.stored_results():
+            yield StoredResult(result, self)
+
+    def _fetch(self, method, *args, source=None):
+        """Run a fetch method, adding its time and rows to the query."""
+        begin = time.perf_counter()
+        cursor = self._cursor if source is None else source
+        result = getattr(cursor, method)(*args)
+        if self._pending is not None:
+            self._pending[4] += time.perf_counter() - begin
+            fetched = self._pending[3] or 0
+            if isinstance(result, list):
+                fetched += len(result)
+            elif result is not None:
+                fetched += 1
+            self._pending[3] = fetched
+        return result
+
+    def fetchone(self):
+        return self._fetch("fetchone")
+
+    def fetchmany(self, size=1):
+        return self._fetch("fetchmany", size)
+
+    def fetchall(self):
+        return self._fetch("fetchall")
+
+    def close(self):
+        """Report the last query and close the cursor."""
+        self._finish()
+        return self._cursor.close()
+
+    def _finish(self):
+        """Send the event of the pending query, if any."""
+        if self._pending is None:
+            return
+        kind, statement, params, fetched, elapsed, started, affected = (
+            self._pending)
+        self._pending = None
+        rows = affected if fetched is None else fetched
+        emit(kind, statement, params, rows, elapsed, self._connect, started)
+
+
+class StoredResult:
+    """
+    One result set of a procedure called on a `TimedCursor`.
+
+    Rows fetched from it are added to the procedure's event; everything
+    else is passed through to the wrapped result.
+
+    Args:
+        result (mysql.connector.cursor.MySQLCursor): The real result set.
+        owner (TimedCursor): The cursor that called the procedure.
+    """
+    def __init__(self, result, owner):
+        self._result = result
+        self._owner = owner
+
+    def __getattr__(self, name):
+        return getattr(self._result, name)
+
+    def __iter__(self):
+        row = self.fetchone()
+        while row is not None:
+            yield row
+            row = self.fetchone()
+
+    def fetchone(self):
+        return self._owner._fetch("fetchone", source=self._result)
+
+    def fetchmany(self, size=1):
+        return self._owner._fetch("fetchmany", size, source=self._result)
+
+    def fetchall(self):
+        return self._owner._fetch("fetchall", source=self._result)
+
+
+class LoggingSink:
+    """
+    Sink writing one log record per event.
+
+    Args:
+        logger (logging.Logger, optional): Target logger. Defaults to
+            the "omakase.dal.queries" logger.
+        level (int): Log level. Defaults to `logging.DEBUG`.
+    """
+    def __init__(self, logger=None, level=logging.DEBUG):
+        self.logger = logger or logging.getLogger("omakase.dal.queries")
+        self.level = level
+
+    def __call__(self, event):
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(
+                self.level, "%s %s rows=%s %.3fms connect=%.3fms caller=%s "
+                "request=%s params=%s", event.kind, event.statement,
+                event.rows, event.elapsed_ms, event.connect_ms, event.caller,
+                event.request, event.fingerprint)
+
+
+class RingBufferSink:
+    """
+    Sink keeping the most recent events in memory.
+
+    Args:
+        size (int): Number of events kept. Defaults to 1000.
+    """
+    def __init__(self, size=1000):
+        self._events = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        with self._lock:
+            self._events.append(event)
+
+    def events(self):
+        """Return the kept events, oldest first."""
+        with self._lock:
+            return list(self._events)
+
+    def clear(self):
+        """Forget every kept event."""
+        with self._lock:
+            self._events.clear()
+
+
+class JsonlSink:
+    """
+    Sink appending one JSON object per event to a file.
+
+    Args:
+        path (str): Target file, created if missing.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        line = json.dumps(event._asdict(), default=str)
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line + "\n")
+                self._file.flush()
+
+    def close(self):
+        """Close the file; later events are dropped."""
+        with self._lock:
+            self._file.close()
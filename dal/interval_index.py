@@ -0,0 +1,332 @@
+"""
+Interval index of the upcoming reservations, per room and per diner.
+
+Each booking is kept as its start and its stored end time (`endTime`,
+see `ProjectUpgrade08_ServicePolicy.sql`) in lists sorted by start. Two
+bookings overlap when each starts before the other ends; since no
+booking lasts longer than the longest duration in the index, only the
+starts from `start - longest` on need checking, so an overlap check is
+one `bisect` (O(log n)) plus a short scan instead of a database
+round-trip.
+
+The index of a server is loaded once, on first use, with every booking
+that has not ended yet. The DAL's add, cancel and import paths keep it in
+sync. Writes by other processes are detected through the
+`cache_version_totals` counters (see `ProjectUpgrade07_TableVersions.sql`),
+read at most once per `poll_interval`; when they moved further than this
+process's own writes explain, the index is dropped and reloaded. A
+changed duration rewrites the end times of the reservations, so it is
+seen the same way. The `book_reservation` procedure and the
+`reservations_no_overlap` trigger stay the final guard: the index only
+answers questions it is sure about.
+"""
+
+import datetime
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from mysql.connector import Error
+from .connection import DBconnection
+from .pool import server_key
+from .table_versions import TableVersions
+from .policy import DURATION, get_service_policy, name_key
+
+# Tables whose writes can change the bookings in the index
+WATCHED = ("reservations", "diners", "rooms")
+
+# Default index settings, changed through `configure_index`
+_settings = {
+    "enabled": True,
+    "poll_interval": 2.0,   # seconds between version polls
+}
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+class IntervalIndex:
+    """
+    Booking intervals grouped by key (a room or a diner name).
+
+    Names are matched with `name_key`, case-insensitively like the
+    database, so a name typed in another case finds the same bookings.
+
+    Attributes:
+        longest (datetime.timedelta): Longest booking ever added; bounds
+            how far back an overlapping booking can start.
+    """
+    def __init__(self, longest=DURATION):
+        self.longest = longest
+        self._starts = {}
+        self._ends = {}
+
+    def __contains__(self, key):
+        return bool(self._starts.get(name_key(key)))
+
+    def add(self, key, start, end):
+        """Record a booking of `key` from `start` to `end`."""
+        key = name_key(key)
+        starts = self._starts.setdefault(key, [])
+        i = bisect_right(starts, start)
+        starts.insert(i, start)
+        self._ends.setdefault(key, []).insert(i, end)
+        self.longest = max(self.longest, end - start)
+
+    def remove(self, key, start):
+        """Forget a booking of `key` starting at `start`, if recorded."""
+        key = name_key(key)
+        starts = self._starts.get(key)
+        if not starts:
+            return
+        i = bisect_left(starts, start)
+        if i < len(starts) and starts[i] == start:
+            del starts[i]
+            del self._ends[key][i]
+
+    def overlaps(self, key, start, end):
+        """Check whether a booking of `key` from `start` to `end` would overlap."""
+        key = name_key(key)
+        starts = self._starts.get(key, [])
+        ends = self._ends.get(key, [])
+        # Bookings starting before start - longest have ended by start
+        i = bisect_right(starts, start - self.longest)
+        while i < len(starts) and starts[i] < end:
+            if ends[i] > start:
+                return True
+            i += 1
+        return False
+
+    def starts_between(self, key, low, high):
+        """
+        List the booking starts of `key` with `low <= start < high`.
+
+        Returns:
+            list[datetime.datetime]: Sorted start times.
+        """
+        starts = self._starts.get(name_key(key), [])
+        return starts[bisect_left(starts, low):bisect_left(starts, high)]
+
+
+class BookingIndex:
+    """
+    Room and diner interval indexes of one server's upcoming bookings.
+
+    Attributes:
+        since (datetime.datetime): Bookings ending after this time are
+            loaded; earlier ones are not.
+        versions (dict[str, int] | None): Counters of `WATCHED` that the
+            index reflects, including its own writes.
+        checked_at (float): `time.monotonic()` of the last version poll.
+        rooms (IntervalIndex): Booking intervals by room.
+        diners (IntervalIndex): Booking intervals by diner name.
+    """
+    def __init__(self, since, versions, longest=DURATION):
+        self.since = since
+        self.versions = versions
+        self.checked_at = time.monotonic()
+        self.rooms = IntervalIndex(longest)
+        self.diners = IntervalIndex(longest)
+        # (start, room key) -> diner name, to unindex cancelled bookings
+        self._diner_of = {}
+        self._lock = threading.Lock()
+
+    def covers(self, dtime):
+        """Check whether every booking that could overlap `dtime` is loaded."""
+        return isinstance(dtime, datetime.datetime) and dtime >= self.since
+
+    def conflict(self, dtime, end, room, diner):
+        """
+        Answer the overlap check of `book_reservation` locally if possible.
+
+        A room or diner with bookings in the index exists, so the codes
+        below are exactly what the procedure would return.
+
+        Args:
+            dtime (datetime.datetime): Start time of the new booking.
+            end (datetime.datetime): End time of the new booking.
+            room (str): Room name.
+            diner (str): Diner name.
+
+        Returns:
+            int | None: -6, -7 or -8 like `Reservations.add_reservation`,
+            or None when the database has to decide.
+        """
+        if not self.covers(dtime):
+            return None
+        with self._lock:
+            room_busy = self.rooms.overlaps(room, dtime, end)
+            diner_busy = self.diners.overlaps(diner, dtime, end)
+            if room_busy and diner_busy:
+                return -6
+            if room_busy and diner in self.diners:
+                return -7
+            if diner_busy and room in self.rooms:
+                return -8
+        return None
+
+    def add(self, dtime, end, room, diner):
+        """Index a booking this process just committed."""
+        with self._lock:
+            self._count_write()
+            if end > self.since:
+                self.rooms.add(room, dtime, end)
+                self.diners.add(diner, dtime, end)
+                self._diner_of[(dtime, name_key(room))] = diner
+
+    def remove(self, dtime, room):
+        """Unindex a booking this process just cancelled."""
+        with self._lock:
+            self._count_write()
+            diner = self._diner_of.pop((dtime, name_key(room)), None)
+            self.rooms.remove(room, dtime)
+            if diner is not None:
+                self.diners.remove(diner, dtime)
+
+    def _count_write(self):
+        """Account for the version bump caused by one of our own writes."""
+        if self.versions is not None:
+            self.versions["reservations"] += 1
+
+
+def load_booking_index(server):
+    """
+    Read the upcoming bookings of a server into a new index.
+
+    The versions are read first, so a write racing with the load makes
+    the next poll reload the index rather than go unnoticed.
+
+    Args:
+        server (dict): Connection kwargs for `mysql.connector.connect`.
+
+    Returns:
+        BookingIndex | None: The index, or None if the version counters
+        are unavailable (writes by other processes could not be seen) or
+        the bookings cannot be read.
+    """
+    versions = TableVersions.get_versions(server, WATCHED)
+    if versions is None:
+        return None
+    since = datetime.datetime.now()
+    policy = get_service_policy(server)
+    index = BookingIndex(since, versions, policy.longest)
+    query = (
+        "SELECT dateAndTime, endTime, room, diner "
+        "FROM reservations r JOIN diners d ON r.dinerId = d.id "
+        "WHERE endTime > %s ORDER BY dateAndTime"
+    )
+    try:
+        # The connection goes back to the pool even if the query fails
+        with DBconnection(server) as db:
+            cur = db.execute_query(query, [since])
+            for (dt, end, room, diner) in cur.fetchall():
+                # Rows come sorted, so every insert appends at the end
+                index.rooms.add(room, dt, end)
+                index.diners.add(diner, dt, end)
+                index._diner_of[(dt, name_key(room))] = diner
+            cur.close()
+    except Error:
+        return None
+    return index
+
+
+def get_booking_index(server):
+    """
+    Get the up-to-date booking index of a server, loading it if needed.
+
+    Args:
+        server (dict): Connection kwargs for `mysql.connector.connect`.
+
+    Returns:
+        BookingIndex | None: The index, or None if indexing is disabled
+        or unavailable for this server.
+    """
+    if not _settings["enabled"]:
+        return None
+    key = server_key(server)
+    with _lock:
+        index = _indexes.get(key)
+    if index is not None:
+        now = time.monotonic()
+        if now - index.checked_at < _settings["poll_interval"]:
+            return index
+        index.checked_at = now
+        versions = TableVersions.get_versions(server, WATCHED)
+        with index._lock:
+            fresh = versions is not None and versions == index.versions
+        if fresh:
+            return index
+    index = load_booking_index(server)
+    with _lock:
+        if index is None:
+            _indexes.pop(key, None)
+        else:
+            _indexes[key] = index
+    return index
+
+
+def record_booking(server, dtime, room, diner):
+    """
+    Add a committed booking to the server's index, if one is loaded.
+
+    The end time follows the room's duration in the service policy, like
+    the `reservations_end_time_insert` trigger computes it.
+
+    Args:
+        server (dict): Connection kwargs for `mysql.connector.connect`.
+        dtime (datetime.datetime | str): Start time of the booking.
+        room (str): Room name.
+        diner (str): Diner name.
+    """
+    index = _loaded_index(server, dtime)
+    if index is not None:
+        end = get_service_policy(server).end_of(dtime, room)
+        index.add(dtime, end, room, diner)
+
+
+def record_cancel(server, dtime, room):
+    """
+    Remove a cancelled booking from the server's index, if one is loaded.
+
+    Args:
+        server (dict): Connection kwargs for `mysql.connector.connect`.
+        dtime (datetime.datetime | str): Start time of the booking.
+        room (str): Room name.
+    """
+    index = _loaded_index(server, dtime)
+    if index is not None:
+        index.remove(dtime, room)
+
+
+def _loaded_index(server, dtime):
+    """Get the loaded index of a server, dropping it for non-datetimes."""
+    key = server_key(server)
+    with _lock:
+        if not isinstance(dtime, datetime.datetime):
+            # Cannot place the booking; reload rather than guess
+            _indexes.pop(key, None)
+            return None
+        return _indexes.get(key)
+
+
+def configure_index(enabled=None, poll_interval=None):
+    """
+    Change the booking index settings.
+
+    Args:
+        enabled (bool, optional): Whether the DAL uses the index.
+        poll_interval (float, optional): Seconds between reads of the
+            version counters. Pass 0 to check them on every use.
+    """
+    with _lock:
+        if enabled is not None:
+            _settings["enabled"] = enabled
+            if not enabled:
+                _indexes.clear()
+        if poll_interval is not None:
+            _settings["poll_interval"] = poll_interval
+
+
+def clear_indexes():
+    """Drop every loaded index, e.g. when switching databases."""
+    with _lock:
+        _indexes.clear()
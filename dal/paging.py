@@ -0,0 +1,79 @@
+"""
+Keyset (seek) pagination shared by the `get_page` methods of the DAL.
+
+Instead of skipping `OFFSET` rows, every page starts right after the key
+of the last row of the previous page:
+
+    WHERE id > %s ORDER BY id LIMIT %s
+
+The primary key index turns that into a range scan, so reading page N
+costs the same as reading page 1. Composite keys such as the
+`(dateAndTime, room)` key of reservations are expanded into
+`a > x OR (a = x AND b > y)`, which MySQL also resolves as ranges.
+"""
+
+from .connection import DBconnection
+
+ORDERS = {"asc": (">", "ASC"), "desc": ("<", "DESC")}
+
+
+def keyset_page(server, select, keys, after_key=None, limit=100, order="asc",
+                make_row=None):
+    """
+    Read one page of a keyset-ordered query.
+
+    Args:
+        server (dict): Connection kwargs for `mysql.connector.connect`.
+        select (str): The SELECT ... FROM ... part of the query, without
+            WHERE or ORDER BY. Its first columns must be the key columns.
+        keys (list[str]): Key column expressions, e.g. `["a.id"]` or
+            `["dateAndTime", "room"]`.
+        after_key (object, optional): Key of the last row of the previous
+            page: a scalar for one key column, a tuple for several.
+            None starts from the first row.
+        limit (int): Maximum number of rows to return. Defaults to 100.
+        order (str): "asc" or "desc". Defaults to "asc".
+        make_row (Callable, optional): Turns a raw row into the returned
+            row type. Defaults to returning the raw row.
+
+    Returns:
+        tuple[list, object | None]: The rows of the page and the
+            `after_key` of the next page, or None on the last page.
+
+    Raises:
+        ValueError: If `order` is neither "asc" nor "desc".
+    """
+    if order not in ORDERS:
+        raise ValueError(f"order must be 'asc' or 'desc', not {order!r}")
+    op, direction = ORDERS[order]
+    query = select
+    params = []
+    if after_key is not None:
+        values = after_key if len(keys) > 1 else (after_key,)
+        # a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z) ...
+        terms = []
+        for i, key in enumerate(keys):
+            equal = [f"{k} = %s" for k in keys[:i]]
+            terms.append("(" + " AND ".join(equal + [f"{key} {op} %s"]) + ")")
+            params.extend(values[:i])
+            params.append(values[i])
+        query += " WHERE " + " OR ".join(terms)
+    query += " ORDER BY " + ", ".join(f"{k} {direction}" for k in keys)
+    # One extra row tells whether a next page exists
+    query += " LIMIT %s"
+    params.append(limit + 1)
+
+    db = DBconnection(server)
+    cur = db.execute_query(query, params)
+    rows = cur.fetchall()
+    cur.close()
+    db.disconnect()
+
+    next_key = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_key = last[0] if len(keys) == 1 else tuple(last[:len(keys)])
+    if make_row is not None:
+        rows = [make_row(r) for r in rows]
+    return rows, next_key
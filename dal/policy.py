@@ -0,0 +1,155 @@
+"""
+Experience durations and service hours, read through one cached object.
+
+The duration of an experience is set per class (`prices.durationMinutes`)
+and the booking window per weekday (`service_hours`, see
+`ProjectUpgrade08_ServicePolicy.sql`). Both are read together into a
+`ServicePolicy` that lives in the reference cache, so booking checks,
+availability searches and the booking index ask it instead of querying
+or hard-coding the rules. Writes to `prices`, `rooms` or `service_hours`
+drop it like any other cached lookup.
+"""
+
+import datetime
+from mysql.connector import Error
+from .cache import cached_lookup, depends_on
+from .connection import DBconnection
+
+# Duration and booking window used before upgrade 08, and for rooms the
+# policy does not know yet
+DURATION = datetime.timedelta(minutes=90)
+FIRST_START = datetime.time(17, 0)
+LAST_START = datetime.time(21, 30)
+# Tables the policy is read from
+SOURCES = ("prices", "rooms", "service_hours")
+
+depends_on("service_policy", SOURCES)
+
+
+def name_key(name):
+    """
+    Normalize a room or diner name the way MySQL compares it.
+
+    The tables use a case-insensitive collation, so "room a" finds the
+    row of "Room A"; in-memory lookups key names by `casefold()` to agree
+    with the database.
+
+    Args:
+        name (str | None): The name as typed or stored.
+
+    Returns:
+        str | None: The lookup key.
+    """
+    return name.casefold() if isinstance(name, str) else name
+
+
+def _as_time(value):
+    """Convert a MySQL TIME (returned as `timedelta`) to `datetime.time`."""
+    if isinstance(value, datetime.timedelta):
+        return (datetime.datetime.min + value).time()
+    return value
+
+
+class ServicePolicy:
+    """
+    Experience duration per room and booking window per weekday.
+
+    Attributes:
+        durations (dict[str, datetime.timedelta]): Duration by room name,
+            as stored. Use `duration` to look up a name as typed.
+        hours (dict[int, tuple[datetime.time, datetime.time]]): First and
+            last allowed start by weekday (0 = Monday). Missing days are
+            closed.
+        longest (datetime.timedelta): Longest duration of any room, the
+            farthest a booking can reach past its start.
+    """
+    def __init__(self, durations, hours):
+        self.durations = durations
+        self.hours = hours
+        self._by_key = {name_key(room): d for room, d in durations.items()}
+        self.longest = max(durations.values(), default=DURATION)
+
+    @classmethod
+    def default(cls):
+        """Return the fixed rules used before upgrade 08: 90 minutes, 17:00 - 21:30 daily."""
+        return cls({}, {day: (FIRST_START, LAST_START) for day in range(7)})
+
+    def duration(self, room):
+        """Return the experience duration of a room, matched like MySQL does."""
+        return self._by_key.get(name_key(room), DURATION)
+
+    def end_of(self, dtime, room):
+        """Return the end time of a booking of `room` starting at `dtime`."""
+        return dtime + self.duration(room)
+
+    def is_service_time(self, dtime):
+        """Check whether a booking may start at `dtime`."""
+        window = self.hours.get(dtime.weekday())
+        return window is not None and window[0] <= dtime.time() <= window[1]
+
+    def starts(self, day, step):
+        """
+        List the allowed start times of one day.
+
+        Args:
+            day (datetime.date): The day.
+            step (datetime.timedelta): Distance between two start times.
+
+        Returns:
+            list[datetime.datetime]: Start times in ascending order, empty
+            on a closed day.
+        """
+        window = self.hours.get(day.weekday())
+        if window is None:
+            return []
+        slot = datetime.datetime.combine(day, window[0])
+        last = datetime.datetime.combine(day, window[1])
+        starts = []
+        while slot <= last:
+            starts.append(slot)
+            slot += step
+        return starts
+
+
+def load_service_policy(server):
+    """
+    Read the durations and service hours of a server.
+
+    Args:
+        server (dict): Connection kwargs for `mysql.connector.connect`.
+
+    Returns:
+        ServicePolicy: The policy, or `ServicePolicy.default()` if the
+        database predates `ProjectUpgrade08_ServicePolicy.sql`.
+    """
+    try:
+        # The connection goes back to the pool even if a query fails
+        with DBconnection(server) as db:
+            cur = db.execute_query(
+                "SELECT r.room, p.durationMinutes "
+                "FROM rooms r JOIN prices p ON r.classId = p.id")
+            durations = {room: datetime.timedelta(minutes=minutes)
+                         for (room, minutes) in cur.fetchall()}
+            cur.close()
+            cur = db.execute_query(
+                "SELECT weekday, firstStart, lastStart FROM service_hours")
+            hours = {day: (_as_time(first), _as_time(last))
+                     for (day, first, last) in cur.fetchall()}
+            cur.close()
+    except Error:
+        return ServicePolicy.default()
+    return ServicePolicy(durations, hours)
+
+
+def get_service_policy(server):
+    """
+    Get the cached service policy of a server, loading it on a miss.
+
+    Args:
+        server (dict): Connection kwargs for `mysql.connector.connect`.
+
+    Returns:
+        ServicePolicy: The current policy.
+    """
+    return cached_lookup(server, "service_policy", "policy",
+                         lambda: load_service_policy(server))
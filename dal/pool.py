@@ -0,0 +1,213 @@
+"""
+Connection pooling for the Data Access Layer (DAL).
+
+Every DAL method opens a `DBconnection` and releases it when it is done.
+Instead of paying for a new TCP handshake and MySQL authentication on each
+call, `DBconnection` borrows a live connection from the pool that belongs to
+its `server` dict and hands it back on `disconnect()`.
+
+Pools are created lazily, one per distinct `server` dict, and share the
+settings configured through `configure_pool`.
+"""
+
+import threading
+import time
+from collections import deque
+import mysql.connector
+from mysql.connector import Error
+
+# Default pool settings, changed through `configure_pool`
+_settings = {
+    "size": 5,             # maximum number of idle connections kept per server
+    "max_idle": 300.0,     # seconds an idle connection may wait before eviction
+    "health_check": True,  # ping idle connections before handing them out
+}
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def server_key(server):
+    """
+    Build a hashable key that identifies a `server` dict.
+
+    The login form passes the port as a string while the defaults use an
+    integer, so all values are normalized to strings before hashing.
+
+    Args:
+        server (dict): Connection kwargs for `mysql.connector.connect`.
+
+    Returns:
+        tuple: Sorted `(name, value)` pairs of the server dict.
+    """
+    return tuple(sorted((k, str(v)) for k, v in server.items()))
+
+
+class ConnectionPool:
+    """
+    A small pool of reusable MySQL connections for one server.
+
+    The pool never blocks: when no idle connection is available a new one
+    is opened, and when more than `size` connections are returned the
+    extra ones are closed. This keeps nested DAL calls (which hold one
+    connection while opening another) free of deadlocks.
+
+    Attributes:
+        server (dict): Connection kwargs for `mysql.connector.connect`.
+        size (int): Maximum number of idle connections kept open.
+        max_idle (float): Seconds after which an idle connection is closed.
+        health_check (bool): Whether to ping connections on checkout.
+    """
+    def __init__(self, server, size=5, max_idle=300.0, health_check=True):
+        self.server = dict(server)
+        self.size = size
+        self.max_idle = max_idle
+        self.health_check = health_check
+        # Idle connections as (connection, returned_at) pairs.
+        # The right end holds the most recently returned connection.
+        self._idle = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Check out a connection from the pool.
+
+        Reuses the most recently returned idle connection if it is still
+        healthy; otherwise opens a new one.
+
+        Returns:
+            mysql.connector.connection.MySQLConnection: An open connection.
+        """
+        return self.checkout()[0]
+
+    def checkout(self):
+        """
+        Check out a connection and tell whether it was reused.
+
+        Returns:
+            tuple[mysql.connector.connection.MySQLConnection, bool]: An
+            open connection, and True if it came from the idle list
+            rather than being opened now.
+        """
+        self.evict_idle()
+        while True:
+            with self._lock:
+                item = self._idle.pop() if self._idle else None
+            if item is None:
+                return mysql.connector.connect(**self.server), False
+            con = item[0]
+            if not self.health_check or self._is_healthy(con):
+                return con, True
+            self._close(con)
+
+    def release(self, con):
+        """
+        Return a connection to the pool.
+
+        Any uncommitted work is rolled back so the next borrower starts
+        with a clean session. Broken connections, connections with unread
+        results (e.g. an abandoned streaming cursor) and connections beyond
+        the pool size are closed instead of being kept.
+
+        Args:
+            con (mysql.connector.connection.MySQLConnection): The connection
+                previously returned by `acquire`.
+        """
+        if con.unread_result:
+            # Reading the rest of a large result only to drop it is slower
+            # than opening a new connection later
+            self._close(con)
+            return
+        try:
+            if con.in_transaction:
+                con.rollback()
+        except Error:
+            self._close(con)
+            return
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append((con, time.monotonic()))
+                return
+        self._close(con)
+
+    def evict_idle(self):
+        """Close idle connections that have waited longer than `max_idle`."""
+        expired = []
+        now = time.monotonic()
+        with self._lock:
+            # The oldest connections sit at the left end of the deque
+            while self._idle and now - self._idle[0][1] > self.max_idle:
+                expired.append(self._idle.popleft()[0])
+        for con in expired:
+            self._close(con)
+
+    def close_all(self):
+        """Close every idle connection held by the pool."""
+        with self._lock:
+            idle = [con for con, _ in self._idle]
+            self._idle.clear()
+        for con in idle:
+            self._close(con)
+
+    @staticmethod
+    def _is_healthy(con):
+        """Ping the server to make sure the connection is still usable."""
+        try:
+            return con.is_connected()
+        except Error:
+            return False
+
+    @staticmethod
+    def _close(con):
+        """Close a connection, ignoring errors from already broken sockets."""
+        try:
+            con.close()
+        except Error:
+            pass
+
+
+def get_pool(server):
+    """
+    Get the pool for a server, creating it on first use.
+
+    Args:
+        server (dict): Connection kwargs for `mysql.connector.connect`.
+
+    Returns:
+        ConnectionPool: The shared pool for that server.
+    """
+    key = server_key(server)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(server, **_settings)
+            _pools[key] = pool
+        return pool
+
+
+def configure_pool(size=None, max_idle=None, health_check=None):
+    """
+    Change the pool settings for existing and future pools.
+
+    Args:
+        size (int, optional): Maximum number of idle connections per server.
+        max_idle (float, optional): Idle timeout in seconds.
+        health_check (bool, optional): Whether to ping on checkout.
+    """
+    changes = {"size": size, "max_idle": max_idle,
+               "health_check": health_check}
+    changes = {k: v for k, v in changes.items() if v is not None}
+    with _pools_lock:
+        _settings.update(changes)
+        for pool in _pools.values():
+            for name, value in changes.items():
+                setattr(pool, name, value)
+
+
+def close_all_pools():
+    """Close every pooled connection, e.g. when the application exits."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close_all()
@@ -1,5 +1,9 @@
 from mysql.connector import Error
+from .cache import cached_lookup, invalidate_cache
 from .connection import DBconnection
+from .paging import keyset_page
+from .rows import PriceRow
+from .unit_of_work import UnitOfWork
 # Prices Table
 class Prices:
     """
@@ -8,24 +12,32 @@ class Prices:
     It manages interactions including retrieval, search, insertion and updates.
     """
     @staticmethod
-    def get_class_id(server, name):
+    def get_class_id(server, name, session=None):
         """
         Get the unique ID of a pricing class by name.
 
+        Results are served from the reference cache when possible, so
+        repeated checks of the same name cost no round-trip.
+
         Args:
             server (dict): Connection kwargs for `mysql.connector.connect`.
             name (str): Class name to search for.
+            session (UnitOfWork, optional): Open unit of work to run the
+                lookup on. Defaults to a new pooled connection.
 
         Returns:
             int: The class ID if found; `-1` if not found.
         """
-        db = DBconnection(server)
-        query = "SELECT get_class_id(%s)"
-        cur = db.execute_query(query, [name])
-        res = cur.fetchone()[0]
-        cur.close()
-        db.disconnect()
-        return res
+        def load():
+            db = session or DBconnection(server)
+            query = "SELECT get_class_id(%s)"
+            cur = db.execute_query(query, [name])
+            res = cur.fetchone()[0]
+            cur.close()
+            db.disconnect()
+            return res
+        return cached_lookup(server, "prices", name, load,
+                             session=session)
 
     @staticmethod
     def get_all_prices(server):
@@ -38,41 +50,68 @@ class Prices:
             server (dict): Connection kwargs for `mysql.connector.connect`.
 
         Returns:
-            list[list]: A list of `[Id, class, costPerPerson]`.
+            list[PriceRow]: A list of `(id, class_name, cost_per_person)`
+            rows with the cost as a `Decimal`.
         """
         db = DBconnection(server)
-        cur = db.con.cursor()
+        cur = db.cursor()
         cur.callproc("get_all_prices")
         cache = []
         for prices in cur.stored_results():
-            for (classId, name, price) in prices.fetchall():
-                cache.append([classId, name, f"${price:.2f}"])
+            cache.extend(map(PriceRow._make, prices.fetchall()))
         cur.close()
         db.disconnect()
         return cache
 
+    @staticmethod
+    def get_page(server, after_key=None, limit=100, order="asc"):
+        """
+        Retrieve one page of pricing classes with keyset pagination.
+
+        Pages are ordered by the `id` key and start right after
+        `after_key`, so every page costs one index range scan however deep
+        into the table it is.
+
+        Args:
+            server (dict): Connection kwargs for `mysql.connector.connect`.
+            after_key (int, optional): Key of the last row of the previous
+                page. None starts from the first row.
+            limit (int): Maximum number of rows to return. Defaults to 100.
+            order (str): "asc" or "desc". Defaults to "asc".
+
+        Returns:
+            tuple[list, int | None]: The page, a list of `PriceRow`, and the
+                `after_key` of the next page, or None on the last page.
+        """
+        select = "SELECT id, class, costPerPerson FROM prices"
+        return keyset_page(server, select, ["id"], after_key, limit, order,
+                           make_row=PriceRow._make)
+
     @staticmethod
     def get_searched_class(server, class_name):
         """
         Search for a pricing class by exact name.
 
+        The filter runs in MySQL on the unique `class` column.
+
         Args:
             server (dict): Connection kwargs for `mysql.connector.connect`.
             class_name (str): Name of the class to search for.
 
         Returns:
-            list[list]: A list of `[Id, class, costPerPerson]` for matched class.
-            Returns an empty list if no matches.
+            list[PriceRow]: A list of `(id, class_name, cost_per_person)`
+            rows for the matched class. Returns an empty list if no matches.
         """
-        cache = []
-        res = Prices.get_all_prices(server)
-        for (i, name, cost) in res:
-            if name == class_name:
-                cache.append([i, name, cost])
+        db = DBconnection(server)
+        query = "SELECT id, class, costPerPerson FROM prices WHERE class = %s"
+        cur = db.execute_query(query, [class_name])
+        cache = list(map(PriceRow._make, cur.fetchall()))
+        cur.close()
+        db.disconnect()
         return cache
 
     @staticmethod
-    def add_class(server, name, price):
+    def add_class(server, name, price, session=None):
         """
         Add a new pricing class if it does not already exist.
 
@@ -80,6 +119,7 @@ class Prices:
             server (dict): Connection kwargs for `mysql.connector.connect`.
             name (str): Class name to add.
             price (float): Class price.
+            session (UnitOfWork, optional): Open unit of work to join.
 
         Returns:
             bool | int:
@@ -87,37 +127,44 @@ class Prices:
                 * -1    -> class already exists
                 * False -> database error occurred
         """
-        db = DBconnection(server)
-        cur = db.con.cursor()
-        try:
-            class_id = Prices.get_class_id(server, name)
-            if class_id == -1:
-                cur.callproc("add_class", [name, price])
-                db.commit()
-                # Successfully added
-                mes = True
-            else:
-                # Already exists
-                mes = -1
-        except Error:
+        with session or UnitOfWork(server) as db:
+            cur = db.cursor()
+            try:
+                class_id = Prices.get_class_id(server, name, session=db)
+                if class_id == -1:
+                    cur.callproc("add_class", [name, price])
+                    db.commit()
+                    # Cached lookups dropped once committed
+                    db.after_commit(lambda: invalidate_cache(server, "prices"))
+                    # Successfully added
+                    mes = True
+                else:
+                    # Already exists
+                    mes = -1
+            except Error:
                 # Failed
+                db.rollback()
                 mes = False
-        cur.close()
-        db.disconnect()
+            cur.close()
         return mes
 
     # Delete class does not happen frequently
     # So develop the function to update class and menu price
     @staticmethod
-    def update_class(server, old_name, new_name=None, new_price=None):
+    def update_class(server, old_name, new_name=None, new_price=None,
+                     session=None):
         """
         Update an existing class's name and/or price.
 
+        Both name lookups and the update share one connection and one
+        transaction.
+
         Args:
             server (dict): Connection kwargs for `mysql.connector.connect`.
             old_name (str): Current class name to update.
             new_name (str, optional): New class name. Defaults to None.
             new_price (float, optional): New price. Defaults to None.
+            session (UnitOfWork, optional): Open unit of work to join.
         
         Returns:
             bool | int:
@@ -127,29 +174,31 @@ class Prices:
                 * -3    -> other failure cases
                 * False -> database error occurred    
         """
-        db = DBconnection(server)
-        cur = db.con.cursor()
-        try:
-            old_name_id = Prices.get_class_id(server, old_name)
-            new_name_id = Prices.get_class_id(server, new_name)
-            if old_name_id != -1 and (new_name_id == -1 or new_name_id == old_name_id):
-                cur.callproc("update_class",
-                             [old_name, new_name, new_price])
-                db.commit()
-                # Successfully updated
-                mes = True
-            elif old_name_id == -1:
-                # old class is not on file
-                mes = -1
-            elif old_name_id != -1 and new_name_id != -1 and new_name_id != old_name_id:
-                # new name already exists
-                mes =  -2
-            else:
-                # other failure cases
-                mes = -3
-        except Error:
-            # Failed
-            mes = False
-        cur.close()
-        db.disconnect()
+        with session or UnitOfWork(server) as db:
+            cur = db.cursor()
+            try:
+                old_name_id = Prices.get_class_id(server, old_name, session=db)
+                new_name_id = Prices.get_class_id(server, new_name, session=db)
+                if old_name_id != -1 and (new_name_id == -1 or new_name_id == old_name_id):
+                    cur.callproc("update_class",
+                                 [old_name, new_name, new_price])
+                    db.commit()
+                    # Cached lookups dropped once committed
+                    db.after_commit(lambda: invalidate_cache(server, "prices"))
+                    # Successfully updated
+                    mes = True
+                elif old_name_id == -1:
+                    # old class is not on file
+                    mes = -1
+                elif old_name_id != -1 and new_name_id != -1 and new_name_id != old_name_id:
+                    # new name already exists
+                    mes =  -2
+                else:
+                    # other failure cases
+                    mes = -3
+            except Error:
+                # Failed
+                db.rollback()
+                mes = False
+            cur.close()
         return mes
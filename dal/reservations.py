@@ -1,8 +1,14 @@
 from mysql.connector import Error
 import datetime
 from .connection import DBconnection
-from .diners import Diners
-from .rooms import Rooms
+from .interval_index import IntervalIndex
+from .interval_index import get_booking_index, record_booking, record_cancel
+from .policy import get_service_policy
+from .paging import keyset_page
+from .unit_of_work import UnitOfWork
+
+# Maximum number of values per IN list or multi-row INSERT in bulk imports
+BATCH_SIZE = 1000
 # Reservations Table
 class Reservations:
     """
@@ -12,7 +18,7 @@ class Reservations:
     insertion and deletion.
     """
     @staticmethod
-    def get_res_existence(server, dtime, room):
+    def get_res_existence(server, dtime, room, session=None):
         """
         Check if a reservation exists for the given datetime and room.
 
@@ -21,11 +27,13 @@ class Reservations:
             dtime (datetime.datetime | str): Reservation datetime. If a
                 `datetime`, it will be passed to MySQL as a parameter.
             room (str): Room name.
+            session (UnitOfWork, optional): Open unit of work to run the
+                lookup on. Defaults to a new pooled connection.
 
         Returns:
             int: A non-`-1` value if a reservation exists; `-1` if not found.
         """
-        db = DBconnection(server)
+        db = session or DBconnection(server)
         query = "SELECT get_reservation_existence(%s, %s)"
         cur = db.execute_query(query, [dtime, room])
         res = cur.fetchone()[0]
@@ -48,7 +56,7 @@ class Reservations:
                 `date_time_str` is formatted like `"YYYY-MM-DD HH:MM:SS"`.
         """
         db = DBconnection(server)
-        cur = db.con.cursor()
+        cur = db.cursor()
         cur.callproc("get_all_reservations")
         cache = []
         for res in cur.stored_results():
@@ -58,11 +66,96 @@ class Reservations:
         db.disconnect()
         return cache
 
+    @staticmethod
+    def get_page(server, after_key=None, limit=100, order="asc"):
+        """
+        Retrieve one page of reservations with keyset pagination.
+
+        Pages are ordered by the composite `(dateAndTime, room)` primary key
+        and start right after `after_key`, so every page costs one index range
+        scan however deep into the table it is.
+
+        Args:
+            server (dict): Connection kwargs for `mysql.connector.connect`.
+            after_key (tuple[datetime, str], optional): Key of the last row of
+                the previous page. None starts from the first row.
+            limit (int): Maximum number of rows to return. Defaults to 100.
+            order (str): "asc" or "desc". Defaults to "asc".
+
+        Returns:
+            tuple[list, tuple[datetime, str] | None]: The page, a list of
+                `[date_time_str, room, diner, group_size]`, and the `after_key`
+                of the next page, or None on the last page.
+        """
+        select = (
+            "SELECT dateAndTime, room, diner, totalDiners "
+            "FROM reservations r JOIN diners d ON r.dinerId = d.id"
+        )
+
+        def make_row(row):
+            dt, room, diner, group = row
+            return [str(dt), room, diner, group]
+
+        return keyset_page(server, select, ["dateAndTime", "room"], after_key,
+                           limit, order, make_row=make_row)
+
+    @staticmethod
+    def get_room_bookings(server, start, end, class_name=None, tv=None):
+        """
+        Get the booked intervals of every matching room in a period.
+
+        Rooms and their reservations come back in one query. The
+        reservations are read through the `(room, dateAndTime, endTime)`
+        index and include bookings that start up to the longest duration
+        before `start` and have not ended by then, since they still block
+        the first slots of the period.
+
+        Args:
+            server (dict): Connection kwargs for `mysql.connector.connect`.
+            start (datetime.datetime): Beginning of the period.
+            end (datetime.datetime): End of the period (exclusive).
+            class_name (str, optional): Only rooms of this class.
+            tv (bool, optional): Only rooms with (True) or without (False)
+                a TV. None accepts both.
+
+        Returns:
+            dict[str, list[tuple[datetime.datetime, datetime.datetime]]]:
+            `(start, end)` pairs per room, sorted by start; rooms without
+            bookings map to an empty list.
+        """
+        longest = get_service_policy(server).longest
+        db = DBconnection(server)
+        query = (
+            "SELECT r.room, res.dateAndTime, res.endTime "
+            "FROM rooms r JOIN prices p ON r.classId = p.id "
+            "LEFT JOIN reservations res ON res.room = r.room "
+            "AND res.dateAndTime > %s AND res.dateAndTime < %s "
+            "AND res.endTime > %s "
+            "WHERE (%s IS NULL OR p.class = %s) "
+            "AND (%s IS NULL OR r.TVProvided = %s) "
+            "ORDER BY r.room, res.dateAndTime"
+        )
+        tv_flag = None if tv is None else int(bool(tv))
+        cur = db.execute_query(query, [start - longest, end, start,
+                                       class_name, class_name,
+                                       tv_flag, tv_flag])
+        bookings = {}
+        for room, dt, dt_end in cur.fetchall():
+            spans = bookings.setdefault(room, [])
+            if dt is not None:
+                spans.append((dt, dt_end))
+        cur.close()
+        db.disconnect()
+        return bookings
+
     @staticmethod
     def get_searched_reservation(server, dtime:datetime, room_name):
         """
         Search for a reservation by exact datetime and room.
 
+        The filter runs in MySQL on the `(dateAndTime, room)` primary key,
+        so the cost does not grow with the reservations history.
+
         Args:
             server (dict): Connection kwargs for `mysql.connector.connect`.
             dtime (datetime.datetime): Target datetime.
@@ -72,31 +165,47 @@ class Reservations:
             list[list]: A list of `[date_time_str, room, diner, group_size]`
                 for matching reservations. Empty list if none.
         """
-        cache = []
-        res = Reservations.get_all_reservations(server)
-        for (date_time, room, diner, total) in res:
-            # In sql, the date time is in YYYY-MM-DD HH:MM:SS format
-            # Convert the string before comparison
-            if (date_time == dtime.strftime("%Y-%m-%d %H:%M:%S")
-                    and room == room_name):
-                cache.append([date_time, room, diner, total])
+        db = DBconnection(server)
+        query = (
+            "SELECT dateAndTime, room, diner, totalDiners "
+            "FROM reservations r JOIN diners d ON r.dinerId = d.id "
+            "WHERE dateAndTime = %s AND room = %s"
+        )
+        cur = db.execute_query(query, [dtime, room_name])
+        cache = [[str(dt), room, diner, group]
+                 for (dt, room, diner, group) in cur.fetchall()]
+        cur.close()
+        db.disconnect()
         return cache
 
     @staticmethod
-    def add_reservation(server, dtime, room_name, diner_name, group):
+    def add_reservation(server, dtime, room_name, diner_name, group,
+                        session=None):
         """
         Add a reservation if the diner and room exist and no overlaps occur.
 
-        Validation steps:s
-            1) Verify diner exists (`Diners.get_diner_id(...) != -1`).
-            2) Verify room exists (`Rooms.get_room_existence(...) != -1`).
-            3) Enforce 1.5-hour window to prevent overlaps by:
-               - room (primary key constraint on `(dateAndTime, room)`)
-               - diner (candidate key-like constraint on `(dateAndTime, diner)`)
+        Booking is one atomic call of the stored procedure `book_reservation`.
+        It locks the room row and the diner row, checks for overlaps with
+        locking reads and inserts the reservation in the same transaction,
+        so two terminals booking the same room or diner at the same time
+        cannot both succeed.
+
+        Validation steps (inside `book_reservation`):
+            1) Verify diner exists.
+            2) Verify room exists.
+            3) Enforce the service hours of the weekday.
+            4) Prevent overlaps by:
+               - room (index on `(room, dateAndTime, endTime)`)
+               - diner (index on `(dinerId, dateAndTime, endTime)`)
 
         Overlap logic:
             x_start < y_end  AND  y_start < x_end
-            Here, end = start + 1.5 hours.
+            The end is the stored `endTime` (start plus the duration of
+            the room's class); `dateAndTime > dtime - longest duration`
+            bounds the index range scan.
+
+        Overlaps that the in-memory booking index (`interval_index`) is
+        certain about are rejected without calling the procedure.
 
         Args:
             server (dict): Connection kwargs for `mysql.connector.connect`.
@@ -104,10 +213,14 @@ class Reservations:
             room_name (str): Room to reserve.
             diner_name (str): Diner making the reservation.
             group (int): Group size.
+            session (UnitOfWork, optional): Open unit of work to join. The
+                row locks are then held until the unit ends.
 
         Returns:
             bool | int:
                 * True  -> reservation created (committed)
+                * -1    -> invalid date/time (checked again in MySQL)
+                * -2    -> invalid group size (checked again in MySQL)
                 * -3    -> diner not found
                 * -4    -> room not found
                 * -5    -> both diner and room not found
@@ -116,71 +229,45 @@ class Reservations:
                 * -8    -> diner overlapping
                 * False -> DB error occurred
         """
-        db = DBconnection(server)
-
-        diner_id = Diners.get_diner_id(server, diner_name)
-        room_exists = Rooms.get_room_existence(server, room_name)
-        if diner_id == -1 and room_exists == 1:
-            # diner not on the list
-            mes = -3
-        elif diner_id != -1 and room_exists == -1:
-            # room not on the list
-            mes = -4
-        elif diner_id == -1 and room_exists == -1:
-            # both diner and room not on file
-            mes = -5
-        else:
+        index = get_booking_index(server)
+        if index is not None and index.covers(dtime):
+            end = get_service_policy(server).end_of(dtime, room_name)
+            code = index.conflict(dtime, end, room_name, diner_name)
+            if code is not None:
+                # Overlapping, known without a round-trip
+                return code
+        with session or UnitOfWork(server) as db:
+            cur = db.cursor()
             try:
-                # Duration of each omakase experience is 1.5 hours
-                # Make sure there is no overlapped reservation
-
-                # Logic: x_start < y_end and y_start < a_end
-                # Check primary key (dateAndTime, room)
-                q1 = (
-                    "SELECT * FROM all_details "
-                    "WHERE room = %s "
-                    "AND (%s < ADDTIME(dateAndTime, SEC_TO_TIME(1.5 * 3600)) "
-                    "AND dateAndTime < ADDTIME(%s, SEC_TO_TIME(1.5 * 3600)))"
-                )
-                cur1 = db.execute_query(q1, [room_name, dtime, dtime])
-                res1 = cur1.fetchall()
-                cur1.close()
-
-                # Check candidate key (dateAndTime, dinerId)
-                q2 = (
-                    "SELECT * FROM all_details "
-                    "WHERE diner = %s "
-                    "AND (%s < ADDTIME(dateAndTime, SEC_TO_TIME(1.5 * 3600)) "
-                    "AND dateAndTime < ADDTIME(%s, SEC_TO_TIME(1.5 * 3600)))"
-                )
-                cur2 = db.execute_query(q2, [diner_name, dtime, dtime])
-                res2 = cur2.fetchall()
-                cur2.close()
-                if res1 and res2:
-                    # Both room and diner are double-booked
-                    mes = -6
-                elif res1:
-                    # Room is double-booked
-                    mes = -7
-                elif res2:
-                    # Diner is double-booked
-                    mes = -8
-                else:
-                    # When diner exists, room exists and record not found
-                    cur = db.con.cursor()
-                    cur.callproc("add_reservation",
-                                         [dtime, room_name, diner_name, group])
+                cur.callproc("book_reservation",
+                             [dtime, room_name, diner_name, group])
+                code = False
+                for res in cur.stored_results():
+                    code = res.fetchone()[0]
+                if code == 1:
                     db.commit()
-                    cur.close()
+                    # Indexed once committed, which a caller's session defers
+                    db.after_commit(lambda: record_booking(
+                        server, dtime, room_name, diner_name))
                     # Successfully added
                     mes = True
+                elif code is False:
+                    # No status row came back, so the outcome is unknown;
+                    # do not let the unit commit a booking it did not report
+                    db.rollback()
+                    mes = False
+                else:
+                    # Not booked, nothing was written
+                    mes = code
             except Error:
+                # Failed
+                db.rollback()
                 mes = False
-        db.disconnect()
+            cur.close()
         return mes
 
     @staticmethod
-    def cancel_reservation(server, dtime, room_name):
+    def cancel_reservation(server, dtime, room_name, session=None):
         """
         Cancel a reservation by datetime and room.
 
@@ -188,6 +275,7 @@ class Reservations:
             server (dict): Connection kwargs for `mysql.connector.connect`.
             dtime (datetime.datetime | str): Reservation datetime.
             room_name (str): Room name.
+            session (UnitOfWork, optional): Open unit of work to join.
 
         Returns:
             bool | int:
@@ -195,21 +283,161 @@ class Reservations:
                 * -1    -> reservation not found
                 * False -> DB error occurred
         """
-        db = DBconnection(server)
-        cur = db.con.cursor()
-        try:
-            res_id = Reservations.get_res_existence(server, dtime, room_name)
-            if res_id != -1:
-                cur.callproc("delete_reservation", [dtime, room_name])
+        with session or UnitOfWork(server) as db:
+            cur = db.cursor()
+            try:
+                res_id = Reservations.get_res_existence(server, dtime, room_name,
+                                                        session=db)
+                if res_id != -1:
+                    cur.callproc("delete_reservation", [dtime, room_name])
+                    db.commit()
+                    db.after_commit(lambda: record_cancel(
+                        server, dtime, room_name))
+                    # Successfully canceled
+                    mes = True
+                else:
+                    # Not on file
+                    mes = -1
+            except Error:
+                # Failed
+                db.rollback()
+                mes = False
+            cur.close()
+        return mes
+
+    @staticmethod
+    def import_reservations(server, rows, session=None):
+        """
+        Insert many reservations in one transaction.
+
+        The rows must already satisfy the booking window and group size
+        rules (see `bll.reservations_service.check_booking_rules`). The
+        import then:
+            1) Locks the involved rooms and diners (rooms first, like
+               `book_reservation`) and resolves diner ids in batches.
+            2) Loads every existing booking in the time span of the batch
+               with one range query.
+            3) Checks room and diner overlaps in Python, including overlaps
+               between rows of the same batch.
+            4) Inserts the accepted rows with `executemany`.
+
+        The `reservations_no_overlap` trigger remains the final guard.
+
+        Args:
+            server (dict): Connection kwargs for `mysql.connector.connect`.
+            rows (list[tuple]): `(key, dtime, room_name, diner_name, group)`
+                tuples, where `key` is any caller-defined row identifier
+                and `dtime` is a `datetime.datetime`.
+            session (UnitOfWork, optional): Open unit of work to join.
+
+        Returns:
+            dict: Maps each `key` to its result, using the codes of
+            `add_reservation`:
+                * True  -> reservation created (committed)
+                * -3    -> diner not found
+                * -4    -> room not found
+                * -5    -> both diner and room not found
+                * -6    -> both room and diner overlapping
+                * -7    -> room overlapping
+                * -8    -> diner overlapping
+                * False -> DB error occurred, nothing was imported
+        """
+        results = {}
+        if not rows:
+            return results
+
+        room_names = sorted({r[2] for r in rows})
+        diner_names = sorted({r[3] for r in rows})
+        with session or UnitOfWork(server) as db:
+            cur = db.cursor()
+            try:
+                # Lock and resolve rooms, then diners. MySQL compares the
+                # names case-insensitively, so the maps are keyed by the
+                # casefolded name and hold the stored spelling
+                rooms = {}
+                for i in range(0, len(room_names), BATCH_SIZE):
+                    chunk = room_names[i:i + BATCH_SIZE]
+                    cur.execute(
+                        "SELECT room FROM rooms WHERE room IN ({}) FOR UPDATE"
+                        .format(", ".join(["%s"] * len(chunk))), chunk)
+                    rooms.update({room.casefold(): room
+                                  for (room,) in cur.fetchall()})
+                diner_ids = {}
+                for i in range(0, len(diner_names), BATCH_SIZE):
+                    chunk = diner_names[i:i + BATCH_SIZE]
+                    cur.execute(
+                        "SELECT id, diner FROM diners WHERE diner IN ({}) "
+                        "FOR UPDATE".format(", ".join(["%s"] * len(chunk))),
+                        chunk)
+                    diner_ids.update({name.casefold(): (diner_id, name)
+                                      for (diner_id, name) in cur.fetchall()})
+
+                # Every booking that could overlap a row of this batch
+                policy = get_service_policy(server)
+                first = min(r[1] for r in rows)
+                last = max(r[1] for r in rows)
+                cur.execute(
+                    "SELECT dateAndTime, endTime, room, dinerId "
+                    "FROM reservations "
+                    "WHERE dateAndTime > %s AND dateAndTime < %s "
+                    "AND endTime > %s ORDER BY dateAndTime FOR SHARE",
+                    [first - policy.longest, last + policy.longest, first])
+                by_room = IntervalIndex(policy.longest)
+                by_diner = IntervalIndex(policy.longest)
+                for (dt, dt_end, room, diner_id) in cur.fetchall():
+                    by_room.add(room, dt, dt_end)
+                    by_diner.add(diner_id, dt, dt_end)
+
+                accepted = []
+                for (key, dtime, room, diner, group) in rows:
+                    diner_id, diner = diner_ids.get(diner.casefold(),
+                                                    (None, diner))
+                    room = rooms.get(room.casefold())
+                    if diner_id is None and room is None:
+                        results[key] = -5
+                        continue
+                    if diner_id is None:
+                        results[key] = -3
+                        continue
+                    if room is None:
+                        results[key] = -4
+                        continue
+                    end = policy.end_of(dtime, room)
+                    room_busy = by_room.overlaps(room, dtime, end)
+                    diner_busy = by_diner.overlaps(diner_id, dtime, end)
+                    if room_busy and diner_busy:
+                        results[key] = -6
+                    elif room_busy:
+                        results[key] = -7
+                    elif diner_busy:
+                        results[key] = -8
+                    else:
+                        # Accepted rows block later rows of the same batch
+                        by_room.add(room, dtime, end)
+                        by_diner.add(diner_id, dtime, end)
+                        accepted.append((key, (dtime, room, diner_id, group),
+                                         diner))
+
+                query = ("INSERT INTO reservations "
+                         "(dateAndTime, room, dinerId, totalDiners) "
+                         "VALUES (%s, %s, %s, %s)")
+                for i in range(0, len(accepted), BATCH_SIZE):
+                    chunk = accepted[i:i + BATCH_SIZE]
+                    cur.executemany(query,
+                                    [values for (_, values, _) in chunk])
                 db.commit()
-                # Successfully canceled
-                mes = True
-            else:
-                # Not on file
-                mes = -1
-        except Error:
-            # Failed
-            mes = False
-        cur.close()
-        db.disconnect()
-        return mes
\ No newline at end of file
+                # Successfully imported; indexed once committed
+                def index_accepted():
+                    for (_, (start, room, _, _), diner) in accepted:
+                        record_booking(server, start, room, diner)
+                db.after_commit(index_accepted)
+                for (key, *_) in accepted:
+                    results[key] = True
+            except Error:
+                # Failed, the whole batch is rolled back
+                db.rollback()
+                for (key, *_) in rows:
+                    if results.get(key) is None:
+                        results[key] = False
+            cur.close()
+        return results
@@ -2,7 +2,7 @@ from .connection import DBconnection
 # Total Revenue By Class View
 class Revenues:
     """
-    A class to interact with `totalrevenuebyclass` view.
+    A class to interact with `totalrevenuebyclass` view and revenue summary.
 
     The `totalrevenuebyclass` view provides aggregated financial
     information, grouped by menu class. It is typically used for
@@ -30,4 +30,80 @@ class Revenues:
         res = cur.fetchall()
         cur.close()
         db.disconnect()
-        return res
\ No newline at end of file
+        return res
+
+    @staticmethod
+    def get_range(server, offset=0, limit=100):
+        """
+        Retrieve one page of revenue by class with LIMIT/OFFSET.
+
+        Rows have the shape of `get_all_revenues`, ordered by revenue
+        (highest first) so the rolling total grows from page to page.
+        The rolling total is computed over all classes before paging.
+
+        Args:
+            server (dict): Connection kwargs for `mysql.connector.connect`.
+            offset (int): Number of rows to skip. Defaults to 0.
+            limit (int): Maximum number of rows to return. Defaults to 100.
+
+        Returns:
+            list[tuple]: Rows of (class_name, total_diners, total_revenue,
+                rolling_total).
+        """
+        db = DBconnection(server)
+        query = """
+            SELECT p.class, s.totalDiners,
+                CONCAT('$', FORMAT(s.totalDiners * p.costPerPerson, 2)),
+                CONCAT('$', FORMAT(SUM(s.totalDiners * p.costPerPerson)
+                    OVER (ORDER BY s.totalDiners * p.costPerPerson DESC), 2))
+            FROM revenue_by_class s
+            JOIN prices p ON s.classId = p.id
+            WHERE s.totalDiners > 0
+            ORDER BY s.totalDiners * p.costPerPerson DESC, p.class
+            LIMIT %s OFFSET %s
+        """
+        cur = db.execute_query(query, [limit, offset])
+        res = cur.fetchall()
+        cur.close()
+        db.disconnect()
+        return res
+
+    @staticmethod
+    def get_daily_revenues(server, start=None, end=None):
+        """
+        Retrieve revenue per class and day from the revenue summary.
+
+        Reads the `revenue_by_class_day` summary table, which triggers keep
+        in sync with the reservations, so the cost does not grow with the
+        number of reservations.
+
+        Args:
+            server (dict): Connection kwargs for `mysql.connector.connect`.
+            start (datetime.date, optional): First day to include.
+            end (datetime.date, optional): Last day to include.
+
+        Returns:
+            list[tuple]: Rows of (day, class_name, total_diners, revenue)
+                ordered by day and class, with revenue as a `Decimal`.
+        """
+        db = DBconnection(server)
+        query = """
+            SELECT s.day, p.class, s.totalDiners,
+                s.totalDiners * p.costPerPerson AS revenue
+            FROM revenue_by_class_day s
+            JOIN prices p ON s.classId = p.id
+            WHERE s.totalDiners > 0
+        """
+        params = []
+        if start is not None:
+            query += " AND s.day >= %s"
+            params.append(start)
+        if end is not None:
+            query += " AND s.day <= %s"
+            params.append(end)
+        query += " ORDER BY s.day, p.class"
+        cur = db.execute_query(query, params)
+        res = cur.fetchall()
+        cur.close()
+        db.disconnect()
+        return res
@@ -1,5 +1,8 @@
 from mysql.connector import Error
+from .cache import cached_lookup, invalidate_cache
 from .connection import DBconnection
+from .paging import keyset_page
+from .unit_of_work import UnitOfWork
 from .prices import Prices
 # Rooms Table
 class Rooms:
@@ -11,24 +14,32 @@ class Rooms:
     # Since name works as primary key
     # The getter is designed to check existence
     @staticmethod
-    def get_room_existence(server, name):
+    def get_room_existence(server, name, session=None):
         """
         Check if a room exists by name.
 
+        Results are served from the reference cache when possible, so
+        repeated checks of the same name cost no round-trip.
+
         Args:
             server (dict): Connection kwargs for `mysql.connector.connect`.
             name (str): The room name to check.
+            session (UnitOfWork, optional): Open unit of work to run the
+                lookup on. Defaults to a new pooled connection.
 
         Returns:
             int: A room existence flag (ID or non-`-1` if exists; `-1` if not found).
         """
-        db = DBconnection(server)
-        query = "SELECT get_room_existence(%s)"
-        cur = db.execute_query(query, [name])
-        res = cur.fetchone()[0]
-        cur.close()
-        db.disconnect()
-        return res
+        def load():
+            db = session or DBconnection(server)
+            query = "SELECT get_room_existence(%s)"
+            cur = db.execute_query(query, [name])
+            res = cur.fetchone()[0]
+            cur.close()
+            db.disconnect()
+            return res
+        return cached_lookup(server, "rooms", name, load,
+                             session=session)
 
     @staticmethod
     def get_all_rooms(server):
@@ -44,7 +55,7 @@ class Rooms:
             `(room, staff, classID, tv)`).
         """
         db = DBconnection(server)
-        cur = db.con.cursor()
+        cur = db.cursor()
         cur.callproc("get_all_rooms")
         cache = []
         for rooms in cur.stored_results():
@@ -54,11 +65,41 @@ class Rooms:
         db.disconnect()
         return cache
 
+    @staticmethod
+    def get_page(server, after_key=None, limit=100, order="asc"):
+        """
+        Retrieve one page of rooms with keyset pagination.
+
+        Pages are ordered by the `room` key and start right after
+        `after_key`, so every page costs one index range scan however deep
+        into the table it is.
+
+        Args:
+            server (dict): Connection kwargs for `mysql.connector.connect`.
+            after_key (str, optional): Key of the last row of the previous
+                page. None starts from the first row.
+            limit (int): Maximum number of rows to return. Defaults to 100.
+            order (str): "asc" or "desc". Defaults to "asc".
+
+        Returns:
+            tuple[list, str | None]: The page, a list of
+                `(room, staff, class, tv)` rows, and the `after_key` of the
+                next page, or None on the last page.
+        """
+        select = (
+            "SELECT r.room, staff, p.class, IF(TVProvided = 1, 'Yes', 'No') "
+            "FROM rooms r JOIN prices p ON r.classId = p.id"
+        )
+        return keyset_page(server, select, ["r.room"], after_key, limit, order)
+
     @staticmethod
     def get_searched_room(server, room_name):
         """
         Search for a specific room by exact name.
 
+        The filter runs in MySQL on the `room` primary key and returns the
+        same columns as the `get_all_rooms` procedure.
+
         Args:
             server (dict): Connection kwargs for `mysql.connector.connect`.
             room_name (str): The room name to match.
@@ -67,15 +108,21 @@ class Rooms:
             list[list]: A list of `[room, staff, classID, tv]`
             for the matched room. Empty list if no match.
         """
-        cache = []
-        res = Rooms.get_all_rooms(server)
-        for (room, staff, class_name, tv) in res:
-            if room == room_name:
-                cache.append([room, staff, class_name, tv])
+        db = DBconnection(server)
+        query = (
+            "SELECT room, staff, p.class, IF(TVProvided = 1, 'Yes', 'No') "
+            "FROM rooms r JOIN prices p ON r.classId = p.id "
+            "WHERE room = %s"
+        )
+        cur = db.execute_query(query, [room_name])
+        cache = [[room, staff, class_name, tv]
+                 for (room, staff, class_name, tv) in cur.fetchall()]
+        cur.close()
+        db.disconnect()
         return cache
 
     @staticmethod
-    def add_room(server, room_name, tv, class_name):
+    def add_room(server, room_name, tv, class_name, session=None):
         """
         Add a new room if it does not already exist.
 
@@ -84,6 +131,7 @@ class Rooms:
             room_name (str): The room name (unique).
             tv (str): TV availability flag ("Yes" => 1, "No" => 0).
             class_name (str): Associated pricing class.
+            session (UnitOfWork, optional): Open unit of work to join.
 
         Returns:
             bool | int:
@@ -93,39 +141,45 @@ class Rooms:
                 * -4    -> class missing AND room already exists
                 * False -> DB error occurred
         """
-        db = DBconnection(server)
-        cur = db.con.cursor()
-        try:
-            class_id = Prices.get_class_id(server, class_name)
-            room_id = Rooms.get_room_existence(server, room_name)
-
-            # When class exists and room name does not exist, add new room
-            if class_id != -1 and room_id == -1:
-                cur.callproc("add_room", [room_name, tv, class_name])
-                db.commit()
-                # Successfully added
-                mes = True
-            elif class_id == -1 and room_id == -1:
-                # class does not exist
-                mes = -2
-            elif class_id != -1 and room_id != -1:
-                # duplicate room name
-                mes = -3
-            else:
-                # class name does not exist and room name exists
-                mes = -4
-        except Error:
+        with session or UnitOfWork(server) as db:
+            cur = db.cursor()
+            try:
+                class_id = Prices.get_class_id(server, class_name, session=db)
+                room_id = Rooms.get_room_existence(server, room_name, session=db)
+
+                # When class exists and room name does not exist, add new room
+                if class_id != -1 and room_id == -1:
+                    cur.callproc("add_room", [room_name, tv, class_name])
+                    db.commit()
+                    # Cached lookups dropped once committed
+                    db.after_commit(lambda: invalidate_cache(server, "rooms"))
+                    # Successfully added
+                    mes = True
+                elif class_id == -1 and room_id == -1:
+                    # class does not exist
+                    mes = -2
+                elif class_id != -1 and room_id != -1:
+                    # duplicate room name
+                    mes = -3
+                else:
+                    # class name does not exist and room name exists
+                    mes = -4
+            except Error:
                 # Failed
+                db.rollback()
                 mes = False
-        cur.close()
-        db.disconnect()
+            cur.close()
         return mes
 
     @staticmethod
-    def update_room(server, room, new_room=None, tv=None, staff=None, new_class=None):
+    def update_room(server, room, new_room=None, tv=None, staff=None, new_class=None,
+                    session=None):
         """
         Update an existing room's attributes.
 
+        All room and class lookups and the update share one connection
+        and one transaction.
+
         Args:
             server (dict): Connection kwargs for `mysql.connector.connect`.
             room (str): Current room name (must exist).
@@ -133,6 +187,7 @@ class Rooms:
             tv (str, optional): Updated TV flag. Defaults to None.
             staff (str, optional): Updated staff assignment. Defaults to None.
             new_class (str, optional): New associated pricing class. Defaults to None.
+            session (UnitOfWork, optional): Open unit of work to join.
 
         Returns:
             bool | int:
@@ -142,35 +197,40 @@ class Rooms:
                 * -3    -> new room name is duplicate
                 * False -> DB error occurred
         """
-        db = DBconnection(server)
-        cur = db.con.cursor()
-        try:
-            old_name_ex = Rooms.get_room_existence(server, room)
-
-            if old_name_ex != -1:
-                new_class_id = Prices.get_class_id(server, new_class)
-                if new_class is not None and new_class_id == -1:
-                    # class name does not exist
-                    mes = -2
-                else:
-                    new_room_ex = Rooms.get_room_existence(server, new_room)
-                    if (new_room is not None and new_room_ex != -1
-                            and new_room != room):
-                        # updated room name is duplicate
-                        mes = -3
+        with session or UnitOfWork(server) as db:
+            cur = db.cursor()
+            try:
+                old_name_ex = Rooms.get_room_existence(server, room, session=db)
+
+                if old_name_ex != -1:
+                    new_class_id = Prices.get_class_id(server, new_class,
+                                                       session=db)
+                    if new_class is not None and new_class_id == -1:
+                        # class name does not exist
+                        mes = -2
                     else:
-                        cur.callproc(
-                            "update_room",
-                            [room, new_room, tv, staff, new_class])
-                        db.commit()
+                        new_room_ex = Rooms.get_room_existence(server, new_room,
+                                                               session=db)
+                        if (new_room is not None and new_room_ex != -1
+                                and new_room != room):
+                            # updated room name is duplicate
+                            mes = -3
+                        else:
+                            cur.callproc(
+                                "update_room",
+                                [room, new_room, tv, staff, new_class])
+                            db.commit()
+                            # Cached lookups dropped once committed
+                            db.after_commit(
+                                lambda: invalidate_cache(server, "rooms"))
                             # Successfully update
-                        mes = True
-            else:
-                # old room Not on file
-                mes = -1
-        except Error:
-            # Failed
-            mes = False
-        cur.close()
-        db.disconnect()
+                            mes = True
+                else:
+                    # old room Not on file
+                    mes = -1
+            except Error:
+                # Failed
+                db.rollback()
+                mes = False
+            cur.close()
         return mes
@@ -0,0 +1,19 @@
+"""
+Lightweight row types for the Data Access Layer (DAL).
+
+Rows keep the raw database values (`datetime.datetime`, `decimal.Decimal`)
+so callers can sort, sum, or compare them without parsing strings back.
+Display formatting, such as the `$` prefix on prices, is applied by the
+GUI layer.
+"""
+
+from collections import namedtuple
+
+# A pricing class from the `prices` table
+PriceRow = namedtuple("PriceRow", ["id", "class_name", "cost_per_person"])
+
+# A reservation from the `all_details_raw` view
+DetailRow = namedtuple("DetailRow", [
+    "date_time", "room", "diner", "phone", "class_name", "total_diners",
+    "staff", "allergy", "cost_per_person", "bill",
+])
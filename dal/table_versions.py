@@ -0,0 +1,42 @@
+from mysql.connector import Error
+from .connection import DBconnection
+# Table Versions
+class TableVersions:
+    """
+    A class to read the write counters of the `cache_version_totals` view.
+
+    Triggers bump a table's version on every insert, update and delete,
+    so comparing versions tells whether rows shown earlier went stale
+    without reading the rows again. Reservations and allergies keep one
+    counter per room and per diner; the view adds them up.
+    """
+    @staticmethod
+    def get_versions(server, tables):
+        """
+        Get the current version of each given table.
+
+        Args:
+            server (dict): Connection kwargs for `mysql.connector.connect`.
+            tables (Iterable[str]): Table names, e.g. `("reservations",
+                "diners")`.
+
+        Returns:
+            dict[str, int] | None: Version per table (0 for tables that
+            were never written), or None if the versions cannot be read,
+            e.g. before `ProjectUpgrade07_TableVersions.sql` was applied.
+        """
+        tables = list(tables)
+        if not tables:
+            return {}
+        marks = ", ".join(["%s"] * len(tables))
+        query = ("SELECT tableName, version FROM cache_version_totals "
+                 f"WHERE tableName IN ({marks})")
+        try:
+            # The connection goes back to the pool even if the query fails
+            with DBconnection(server) as db:
+                cur = db.execute_query(query, tables)
+                found = dict(cur.fetchall())
+                cur.close()
+        except Error:
+            return None
+        return {t: found.get(t, 0) for t in tables}
@@ -0,0 +1,98 @@
+from .connection import DBconnection
+# Unit of work - one connection and one transaction for several DAL calls
+class UnitOfWork(DBconnection):
+    """
+    A connection shared by several DAL calls as one transaction.
+
+    Write paths such as `Reservations.add_reservation` look up diner ids,
+    room existence and overlaps before calling a stored procedure. Passing
+    a `UnitOfWork` as the `session` argument of those DAL methods makes all
+    of these steps run on the same pooled connection instead of opening a
+    new one for every lookup.
+
+    While the unit is open (inside a `with` block), `commit()` and
+    `disconnect()` called by the DAL methods are deferred. When the
+    outermost `with` block ends, the transaction is committed, or rolled
+    back if an exception escaped or `rollback()` was called, and the
+    connection goes back to the pool. `with` blocks can be nested; only
+    the outermost one finishes the unit. In-process state that must only
+    reflect committed rows (such as the booking index) is updated through
+    `after_commit`.
+
+    Example:
+        with UnitOfWork(server) as uow:
+            diner_id = Diners.get_diner_id(server, "Mei Chen", session=uow)
+            Reservations.add_reservation(server, dtime, "Kai", "Mei Chen", 2,
+                                         session=uow)
+    """
+    def __init__(self, server):
+        super().__init__(server)
+        self._depth = 0
+        self._failed = False
+        self._after_commit = []
+
+    def __enter__(self):
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._depth -= 1
+        if exc_type is not None:
+            self._failed = True
+        if self._depth == 0:
+            callbacks, self._after_commit = self._after_commit, []
+            committed = False
+            try:
+                if self._failed:
+                    self.con.rollback()
+                else:
+                    self.con.commit()
+                    committed = True
+            finally:
+                super().disconnect()
+            if committed:
+                for callback in callbacks:
+                    callback()
+        return False
+
+    def commit(self):
+        """
+        Commit immediately when used outside a `with` block.
+
+        Inside the unit the commit happens once, when the outermost
+        `with` block ends.
+        """
+        if self._depth == 0:
+            self.con.commit()
+
+    def after_commit(self, callback):
+        """
+        Run `callback` once the unit's transaction is committed.
+
+        Outside a `with` block the caller has just committed, so the
+        callback runs right away. Inside, it runs after the outermost
+        block committed and is dropped if the unit is rolled back.
+
+        Args:
+            callback (Callable[[], None]): Usually updates in-process
+                state, e.g. `record_booking`.
+        """
+        if self._depth == 0:
+            callback()
+        else:
+            self._after_commit.append(callback)
+
+    def rollback(self):
+        """
+        Roll back the transaction and mark the whole unit as failed.
+
+        Later steps of the unit still run on the same connection, but
+        nothing is committed when the unit ends.
+        """
+        self._failed = True
+        self.con.rollback()
+
+    def disconnect(self):
+        """Release the connection only when the unit is not in use."""
+        if self._depth == 0:
+            super().disconnect()
@@ -0,0 +1,19 @@
+-- Upgrade 01: indexes that support the reservation overlap checks
+-- Run after ProjectStarter.sql. Docker runs the files in db/init in name order,
+-- existing databases can run this file once in MySQL Workbench.
+
+USE `oma`;
+
+-- The overlap checks look for bookings of one room or one diner whose start time
+-- lies within 90 minutes of the requested start time:
+--     room = ? AND dateAndTime > ? - INTERVAL 90 MINUTE AND dateAndTime < ? + INTERVAL 90 MINUTE
+-- The primary key (dateAndTime, room) leads with the range column, so it cannot
+-- narrow the search to one room. These indexes put the equality column first.
+
+-- 1. Room overlap check
+-- It also serves the foreign key on room, so MySQL drops the implicit single-column index
+CREATE INDEX `idx_reservations_room_time` ON `reservations` (room, dateAndTime);
+
+-- 2. Diner overlap check
+-- It also serves the foreign key on dinerId
+CREATE INDEX `idx_reservations_diner_time` ON `reservations` (dinerId, dateAndTime);
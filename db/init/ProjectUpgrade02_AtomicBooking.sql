@@ -0,0 +1,94 @@
+-- Upgrade 02: atomic, race-free booking
+-- Run after ProjectUpgrade01_OverlapIndexes.sql.
+
+USE `oma`;
+
+-- 1. Create procedure to book a reservation in one atomic step
+-- It replaces the "check overlaps, then call add_reservation" sequence of the DAL,
+-- where two terminals booking the same room at the same time could both pass the check.
+-- Result codes match the DAL:
+--    1 -> booked, -1 -> invalid date/time, -2 -> invalid group size,
+--   -3 -> diner not found, -4 -> room not found, -5 -> both not found,
+--   -6 -> room and diner overlapping, -7 -> room overlapping, -8 -> diner overlapping
+-- Call it with autocommit off (the default of mysql-connector) and commit afterwards,
+-- the row locks are held until the transaction ends.
+DROP PROCEDURE IF EXISTS `book_reservation`;
+DELIMITER $$
+CREATE PROCEDURE `book_reservation`(IN dtime DATETIME, IN roomName VARCHAR(50), IN dinerName VARCHAR(50), IN totalDiners INT)
+BEGIN
+	DECLARE lockedRoom VARCHAR(50) DEFAULT NULL;
+    DECLARE lockedDinerId INT DEFAULT NULL;
+    DECLARE roomBusy INT DEFAULT 0;
+    DECLARE dinerBusy INT DEFAULT 0;
+
+    -- Lock the room row, then the diner row (always in this order to avoid deadlocks).
+    -- Any other booking of the same room or the same diner waits here until this
+    -- transaction ends, so the overlap checks below cannot race.
+    SELECT room INTO lockedRoom FROM rooms WHERE room = roomName FOR UPDATE;
+    SELECT id INTO lockedDinerId FROM diners WHERE diner = dinerName FOR UPDATE;
+
+    IF lockedRoom IS NULL AND lockedDinerId IS NULL THEN
+		SELECT -5 AS result;
+	ELSEIF lockedDinerId IS NULL THEN
+		SELECT -3 AS result;
+	ELSEIF lockedRoom IS NULL THEN
+		SELECT -4 AS result;
+	ELSEIF NOT (dtime > NOW() + INTERVAL 2 DAY AND (TIME(dtime) BETWEEN '17:00:00' AND '21:30:00')) THEN
+		SELECT -1 AS result;
+	ELSEIF totalDiners <= 0 THEN
+		SELECT -2 AS result;
+	ELSE
+		-- Omakase experience lasts 90 minutes: x_start < y_end AND y_start < x_end
+        -- Locking reads always see the latest committed bookings
+		SELECT COUNT(*) INTO roomBusy
+        FROM reservations
+        WHERE room = roomName
+			AND dateAndTime > dtime - INTERVAL 90 MINUTE
+            AND dateAndTime < dtime + INTERVAL 90 MINUTE
+		FOR SHARE;
+
+		SELECT COUNT(*) INTO dinerBusy
+        FROM reservations
+        WHERE dinerId = lockedDinerId
+			AND dateAndTime > dtime - INTERVAL 90 MINUTE
+            AND dateAndTime < dtime + INTERVAL 90 MINUTE
+		FOR SHARE;
+
+        IF roomBusy > 0 AND dinerBusy > 0 THEN
+			SELECT -6 AS result;
+		ELSEIF roomBusy > 0 THEN
+			SELECT -7 AS result;
+		ELSEIF dinerBusy > 0 THEN
+			SELECT -8 AS result;
+		ELSE
+			INSERT INTO reservations(dateAndTime, room, dinerId, totalDiners)
+            VALUES (dtime, roomName, lockedDinerId, totalDiners);
+            SELECT 1 AS result;
+		END IF;
+	END IF;
+END $$
+DELIMITER ;
+
+
+-- 2. Create trigger as the final guard against overlapped reservations
+-- It covers every other way of inserting rows (bulk imports, MySQL Workbench, ...).
+DROP TRIGGER IF EXISTS `reservations_no_overlap`;
+DELIMITER $$
+CREATE TRIGGER `reservations_no_overlap`
+BEFORE INSERT ON `reservations`
+FOR EACH ROW
+BEGIN
+	IF EXISTS (SELECT 1 FROM reservations
+			   WHERE room = NEW.room
+				   AND dateAndTime > NEW.dateAndTime - INTERVAL 90 MINUTE
+				   AND dateAndTime < NEW.dateAndTime + INTERVAL 90 MINUTE) THEN
+		SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Room is double-booked';
+	END IF;
+	IF EXISTS (SELECT 1 FROM reservations
+			   WHERE dinerId = NEW.dinerId
+				   AND dateAndTime > NEW.dateAndTime - INTERVAL 90 MINUTE
+				   AND dateAndTime < NEW.dateAndTime + INTERVAL 90 MINUTE) THEN
+		SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Diner is double-booked';
+	END IF;
+END $$
+DELIMITER ;
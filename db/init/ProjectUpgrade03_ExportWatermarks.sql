@@ -0,0 +1,18 @@
+-- Upgrade 03: incremental exports of reservation details
+-- Run after ProjectUpgrade02_AtomicBooking.sql.
+
+USE `oma`;
+
+-- 1. Record when each reservation was created
+-- Reservations are keyed by their (future) dining time, so the insertion time is needed
+-- to tell which rows are new since the last export. Existing rows get the upgrade time.
+ALTER TABLE `reservations`
+	ADD COLUMN createdAt TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    ADD INDEX `idx_reservations_created` (createdAt);
+
+-- 2. Create table to remember the high-water mark of each export job
+DROP TABLE IF EXISTS `export_watermarks`;
+CREATE TABLE `export_watermarks` (
+    job VARCHAR(50) PRIMARY KEY,
+    lastCreatedAt TIMESTAMP(6) NOT NULL
+);
@@ -0,0 +1,225 @@
+-- Upgrade 04: materialized revenue summary
+-- Run after ProjectUpgrade03_ExportWatermarks.sql.
+--
+-- total_revenue_by_class used to re-derive revenue by parsing the bill strings of
+-- all_details over the full join on every read. The summary tables below keep the
+-- number of diners per class (and per class and day) up to date through triggers.
+-- Revenue is totalDiners * costPerPerson, so a price change needs no maintenance and,
+-- like the old view, always reflects the current price of the class.
+-- Note: MySQL does not fire triggers for foreign key cascades, so the deletes that
+-- cascade into reservations (diners, rooms) adjust the summary themselves.
+
+USE `oma`;
+
+-- 1. Create summary tables
+DROP TABLE IF EXISTS `revenue_by_class_day`;
+DROP TABLE IF EXISTS `revenue_by_class`;
+CREATE TABLE `revenue_by_class` (
+    classId INT PRIMARY KEY,
+    totalDiners INT NOT NULL DEFAULT 0,
+    FOREIGN KEY (classId)
+        REFERENCES prices (id)
+        ON DELETE CASCADE ON UPDATE CASCADE
+);
+CREATE TABLE `revenue_by_class_day` (
+    classId INT NOT NULL,
+    `day` DATE NOT NULL,
+    totalDiners INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (classId, `day`),
+    FOREIGN KEY (classId)
+        REFERENCES prices (id)
+        ON DELETE CASCADE ON UPDATE CASCADE
+);
+
+
+-- 2. Create procedure to add (or subtract) diners of one class on one day
+DROP PROCEDURE IF EXISTS `adjust_revenue`;
+DELIMITER $$
+CREATE PROCEDURE `adjust_revenue`(IN cls INT, IN dtime DATETIME, IN delta INT)
+BEGIN
+	INSERT INTO revenue_by_class (classId, totalDiners)
+    VALUES (cls, delta)
+    ON DUPLICATE KEY UPDATE totalDiners = totalDiners + delta;
+
+	INSERT INTO revenue_by_class_day (classId, `day`, totalDiners)
+    VALUES (cls, DATE(dtime), delta)
+    ON DUPLICATE KEY UPDATE totalDiners = totalDiners + delta;
+END $$
+DELIMITER ;
+
+
+-- 3. Create procedure to rebuild the summary from scratch
+-- Used for the initial backfill and to repair the summary after manual changes.
+DROP PROCEDURE IF EXISTS `rebuild_revenue_summary`;
+DELIMITER $$
+CREATE PROCEDURE `rebuild_revenue_summary`()
+BEGIN
+	DELETE FROM revenue_by_class_day;
+    DELETE FROM revenue_by_class;
+
+	INSERT INTO revenue_by_class (classId, totalDiners)
+    SELECT rm.classId, SUM(r.totalDiners)
+    FROM reservations r
+    JOIN rooms rm
+		ON r.room = rm.room
+	GROUP BY rm.classId;
+
+	INSERT INTO revenue_by_class_day (classId, `day`, totalDiners)
+    SELECT rm.classId, DATE(r.dateAndTime), SUM(r.totalDiners)
+    FROM reservations r
+    JOIN rooms rm
+		ON r.room = rm.room
+	GROUP BY rm.classId, DATE(r.dateAndTime);
+END $$
+DELIMITER ;
+
+CALL rebuild_revenue_summary();
+
+
+-- 4. Create procedure to subtract a set of reservations from the summary
+-- It takes the reservations of one diner (dinerId) or of one room (roomName).
+DROP PROCEDURE IF EXISTS `remove_revenue`;
+DELIMITER $$
+CREATE PROCEDURE `remove_revenue`(IN dinerKey INT, IN roomName VARCHAR(50))
+BEGIN
+	UPDATE revenue_by_class_day s
+    JOIN (
+		SELECT rm.classId, DATE(r.dateAndTime) AS `day`, SUM(r.totalDiners) AS removed
+		FROM reservations r
+		JOIN rooms rm
+			ON r.room = rm.room
+		WHERE r.dinerId = dinerKey OR r.room = roomName
+		GROUP BY rm.classId, DATE(r.dateAndTime)
+		) m
+		ON s.classId = m.classId AND s.`day` = m.`day`
+	SET s.totalDiners = s.totalDiners - m.removed;
+
+	UPDATE revenue_by_class s
+    JOIN (
+		SELECT rm.classId, SUM(r.totalDiners) AS removed
+		FROM reservations r
+		JOIN rooms rm
+			ON r.room = rm.room
+		WHERE r.dinerId = dinerKey OR r.room = roomName
+		GROUP BY rm.classId
+		) m
+		ON s.classId = m.classId
+	SET s.totalDiners = s.totalDiners - m.removed;
+END $$
+DELIMITER ;
+
+
+-- 5. Create triggers on reservations
+DROP TRIGGER IF EXISTS `reservations_revenue_insert`;
+DELIMITER $$
+CREATE TRIGGER `reservations_revenue_insert`
+AFTER INSERT ON `reservations`
+FOR EACH ROW
+BEGIN
+	CALL adjust_revenue((SELECT classId FROM rooms WHERE room = NEW.room),
+						NEW.dateAndTime, NEW.totalDiners);
+END $$
+DELIMITER ;
+
+DROP TRIGGER IF EXISTS `reservations_revenue_delete`;
+DELIMITER $$
+CREATE TRIGGER `reservations_revenue_delete`
+AFTER DELETE ON `reservations`
+FOR EACH ROW
+BEGIN
+	CALL adjust_revenue((SELECT classId FROM rooms WHERE room = OLD.room),
+						OLD.dateAndTime, -OLD.totalDiners);
+END $$
+DELIMITER ;
+
+DROP TRIGGER IF EXISTS `reservations_revenue_update`;
+DELIMITER $$
+CREATE TRIGGER `reservations_revenue_update`
+AFTER UPDATE ON `reservations`
+FOR EACH ROW
+BEGIN
+	CALL adjust_revenue((SELECT classId FROM rooms WHERE room = OLD.room),
+						OLD.dateAndTime, -OLD.totalDiners);
+	CALL adjust_revenue((SELECT classId FROM rooms WHERE room = NEW.room),
+						NEW.dateAndTime, NEW.totalDiners);
+END $$
+DELIMITER ;
+
+
+-- 6. Create triggers for deletes that cascade into reservations
+DROP TRIGGER IF EXISTS `diners_revenue_delete`;
+DELIMITER $$
+CREATE TRIGGER `diners_revenue_delete`
+BEFORE DELETE ON `diners`
+FOR EACH ROW
+BEGIN
+	CALL remove_revenue(OLD.id, NULL);
+END $$
+DELIMITER ;
+
+DROP TRIGGER IF EXISTS `rooms_revenue_delete`;
+DELIMITER $$
+CREATE TRIGGER `rooms_revenue_delete`
+BEFORE DELETE ON `rooms`
+FOR EACH ROW
+BEGIN
+	CALL remove_revenue(NULL, OLD.room);
+END $$
+DELIMITER ;
+-- Deleting a class cascades into the summary tables through their foreign keys.
+
+
+-- 7. Create trigger to move the revenue of a room that changes class
+DROP TRIGGER IF EXISTS `rooms_revenue_update`;
+DELIMITER $$
+CREATE TRIGGER `rooms_revenue_update`
+BEFORE UPDATE ON `rooms`
+FOR EACH ROW
+BEGIN
+	IF OLD.classId != NEW.classId THEN
+		-- Reservations still carry the old room name before the update cascades
+		CALL remove_revenue(NULL, OLD.room);
+
+		INSERT INTO revenue_by_class (classId, totalDiners)
+        SELECT * FROM (
+			SELECT NEW.classId AS classId, COALESCE(SUM(totalDiners), 0) AS moved
+			FROM reservations
+			WHERE room = OLD.room
+			) m
+		ON DUPLICATE KEY UPDATE totalDiners = revenue_by_class.totalDiners + m.moved;
+
+		INSERT INTO revenue_by_class_day (classId, `day`, totalDiners)
+        SELECT * FROM (
+			SELECT NEW.classId AS classId, DATE(dateAndTime) AS `day`,
+				SUM(totalDiners) AS moved
+			FROM reservations
+			WHERE room = OLD.room
+			GROUP BY DATE(dateAndTime)
+			) m
+		ON DUPLICATE KEY UPDATE totalDiners = revenue_by_class_day.totalDiners + m.moved;
+	END IF;
+END $$
+DELIMITER ;
+
+
+-- 8. Recreate total revenue by class from the summary table
+-- Same columns as before, read in O(number of classes)
+DROP VIEW IF EXISTS `total_revenue_by_class`;
+CREATE VIEW `total_revenue_by_class` AS
+    SELECT
+        class,
+        totalDiners,
+		CONCAT('$', FORMAT(total, 2)) AS totalRevenue,
+		CONCAT('$', FORMAT(SUM(total) OVER (ORDER BY total DESC), 2)) AS rollingTotal
+    FROM
+		(
+        SELECT
+			p.class,
+            s.totalDiners,
+            s.totalDiners * p.costPerPerson AS total
+		FROM
+			revenue_by_class s
+		JOIN prices p
+			ON s.classId = p.id
+		WHERE s.totalDiners > 0
+        ) AS revenue;
@@ -0,0 +1,35 @@
+-- Upgrade 05: numeric reservation details
+-- Run after ProjectUpgrade04_RevenueSummary.sql.
+--
+-- all_details formats the bill as a '$'-prefixed string, which every consumer has
+-- to parse back into a number. all_details_raw returns the same rows with numeric
+-- costPerPerson and bill columns; formatting is left to the application.
+-- all_details is kept unchanged for the CSV export and existing reports.
+
+USE `oma`;
+
+DROP VIEW IF EXISTS `all_details_raw`;
+CREATE VIEW `all_details_raw` AS
+    SELECT
+        dateAndTime,
+        rm.room,
+        d.diner,
+        d.phone,
+        p.class,
+        r.totalDiners,
+        rm.staff,
+        IF(a.dinerId is NOT NULL, 'Yes', 'No') AS allergy,
+        p.costPerPerson,
+        CAST(p.costPerPerson * r.totalDiners AS DECIMAL (8 , 2 )) AS bill
+    FROM
+        reservations r
+            JOIN
+        diners d ON r.dinerId = d.id
+            JOIN
+        rooms rm ON r.room = rm.room
+            JOIN
+        prices p ON rm.classId = p.id
+			LEFT JOIN
+		-- Filter out duplicate diners since a diner might have multiple allergies
+        (SELECT DISTINCT dinerId FROM allergies) a ON a.dinerId = d.id
+    ORDER BY dateAndTime;
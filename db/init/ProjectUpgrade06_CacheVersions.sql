@@ -0,0 +1,69 @@
+-- Upgrade 06: version counters for the reference cache
+-- Run after ProjectUpgrade05_RawDetails.sql.
+--
+-- The application caches diner, room and class lookups in memory. Every write to
+-- those tables bumps a counter in cache_versions, so other application processes
+-- can poll one small table and drop only the caches that went stale.
+
+USE `oma`;
+
+-- 1. Create version table
+DROP TABLE IF EXISTS `cache_versions`;
+CREATE TABLE `cache_versions` (
+    tableName VARCHAR(50) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO cache_versions (tableName, version)
+VALUES ('diners', 0), ('rooms', 0), ('prices', 0);
+
+
+-- 2. Create procedure to bump the version of a table
+DROP PROCEDURE IF EXISTS `bump_cache_version`;
+DELIMITER $$
+CREATE PROCEDURE `bump_cache_version`(IN tbl VARCHAR(50))
+BEGIN
+	INSERT INTO cache_versions (tableName, version)
+    VALUES (tbl, 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END $$
+DELIMITER ;
+
+
+-- 3. Create triggers on the cached tables
+DROP TRIGGER IF EXISTS `diners_cache_insert`;
+DROP TRIGGER IF EXISTS `diners_cache_update`;
+DROP TRIGGER IF EXISTS `diners_cache_delete`;
+CREATE TRIGGER `diners_cache_insert` AFTER INSERT ON `diners`
+FOR EACH ROW CALL bump_cache_version('diners');
+CREATE TRIGGER `diners_cache_update` AFTER UPDATE ON `diners`
+FOR EACH ROW CALL bump_cache_version('diners');
+CREATE TRIGGER `diners_cache_delete` AFTER DELETE ON `diners`
+FOR EACH ROW CALL bump_cache_version('diners');
+
+DROP TRIGGER IF EXISTS `rooms_cache_insert`;
+DROP TRIGGER IF EXISTS `rooms_cache_update`;
+DROP TRIGGER IF EXISTS `rooms_cache_delete`;
+CREATE TRIGGER `rooms_cache_insert` AFTER INSERT ON `rooms`
+FOR EACH ROW CALL bump_cache_version('rooms');
+CREATE TRIGGER `rooms_cache_update` AFTER UPDATE ON `rooms`
+FOR EACH ROW CALL bump_cache_version('rooms');
+CREATE TRIGGER `rooms_cache_delete` AFTER DELETE ON `rooms`
+FOR EACH ROW CALL bump_cache_version('rooms');
+
+DROP TRIGGER IF EXISTS `prices_cache_insert`;
+DROP TRIGGER IF EXISTS `prices_cache_update`;
+DROP TRIGGER IF EXISTS `prices_cache_delete`;
+CREATE TRIGGER `prices_cache_insert` AFTER INSERT ON `prices`
+FOR EACH ROW CALL bump_cache_version('prices');
+CREATE TRIGGER `prices_cache_update` AFTER UPDATE ON `prices`
+FOR EACH ROW CALL bump_cache_version('prices');
+DELIMITER $$
+-- Deleting a class cascades into rooms without firing the rooms triggers
+CREATE TRIGGER `prices_cache_delete` AFTER DELETE ON `prices`
+FOR EACH ROW
+BEGIN
+	CALL bump_cache_version('prices');
+	CALL bump_cache_version('rooms');
+END $$
+DELIMITER ;
@@ -0,0 +1,67 @@
+-- Upgrade 07: version counters for allergies and reservations
+-- Run after ProjectUpgrade06_CacheVersions.sql.
+--
+-- The dashboard keeps every table screen alive and reloads one only when a table
+-- it shows has changed. Upgrade 06 counts writes to diners, rooms and prices; this
+-- adds the same counters for allergies and reservations. Cascaded deletes do not
+-- fire triggers, so screens also watch the parent tables of their rows.
+--
+-- Reservations and allergies are the hot write paths, so their counters are split
+-- into one row per room and per diner. A booking only bumps the row of its own room,
+-- which it already holds the lock of, so bookings of different rooms never queue on
+-- a shared counter row. Readers use cache_version_totals, which adds the rows up.
+
+USE `oma`;
+
+-- 1. Create the split counters and the totals view
+DROP TABLE IF EXISTS `cache_version_shards`;
+CREATE TABLE `cache_version_shards` (
+    tableName VARCHAR(50) NOT NULL,
+    shard VARCHAR(50) NOT NULL,
+    version BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (tableName, shard)
+);
+
+DROP VIEW IF EXISTS `cache_version_totals`;
+CREATE VIEW `cache_version_totals` AS
+SELECT tableName, CAST(SUM(version) AS SIGNED) AS version
+FROM (
+    SELECT tableName, version FROM cache_versions
+    UNION ALL
+    SELECT tableName, version FROM cache_version_shards
+) AS counters
+GROUP BY tableName;
+
+
+-- 2. Create procedure to bump one counter row of a table
+DROP PROCEDURE IF EXISTS `bump_cache_version_shard`;
+DELIMITER $$
+CREATE PROCEDURE `bump_cache_version_shard`(IN tbl VARCHAR(50), IN shardKey VARCHAR(50))
+BEGIN
+	INSERT INTO cache_version_shards (tableName, shard, version)
+    VALUES (tbl, shardKey, 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END $$
+DELIMITER ;
+
+
+-- 3. Create triggers on allergies (per diner) and reservations (per room)
+DROP TRIGGER IF EXISTS `allergies_version_insert`;
+DROP TRIGGER IF EXISTS `allergies_version_update`;
+DROP TRIGGER IF EXISTS `allergies_version_delete`;
+CREATE TRIGGER `allergies_version_insert` AFTER INSERT ON `allergies`
+FOR EACH ROW CALL bump_cache_version_shard('allergies', NEW.dinerId);
+CREATE TRIGGER `allergies_version_update` AFTER UPDATE ON `allergies`
+FOR EACH ROW CALL bump_cache_version_shard('allergies', NEW.dinerId);
+CREATE TRIGGER `allergies_version_delete` AFTER DELETE ON `allergies`
+FOR EACH ROW CALL bump_cache_version_shard('allergies', OLD.dinerId);
+
+DROP TRIGGER IF EXISTS `reservations_version_insert`;
+DROP TRIGGER IF EXISTS `reservations_version_update`;
+DROP TRIGGER IF EXISTS `reservations_version_delete`;
+CREATE TRIGGER `reservations_version_insert` AFTER INSERT ON `reservations`
+FOR EACH ROW CALL bump_cache_version_shard('reservations', NEW.room);
+CREATE TRIGGER `reservations_version_update` AFTER UPDATE ON `reservations`
+FOR EACH ROW CALL bump_cache_version_shard('reservations', NEW.room);
+CREATE TRIGGER `reservations_version_delete` AFTER DELETE ON `reservations`
+FOR EACH ROW CALL bump_cache_version_shard('reservations', OLD.room);
@@ -0,0 +1,324 @@
+-- Upgrade 08: configurable experience duration and service hours
+-- Run after ProjectUpgrade07_TableVersions.sql.
+--
+-- The 90-minute experience and the 17:00 - 21:30 booking window used to be written
+-- into every procedure, trigger and event. Now the duration is a column of each
+-- class and the booking window is a per-weekday schedule. Every reservation stores
+-- its end time in an indexed column, so overlap checks and the expiry event compare
+-- stored values instead of computing ADDTIME per row.
+
+USE `oma`;
+
+-- 1. Add the duration of each class
+ALTER TABLE `prices`
+	ADD COLUMN durationMinutes INT NOT NULL DEFAULT 90 CHECK (durationMinutes > 0);
+
+-- get_all_prices selected *, keep its result shape for the DAL
+DROP PROCEDURE IF EXISTS `get_all_prices`;
+DELIMITER $$
+CREATE PROCEDURE `get_all_prices`()
+BEGIN
+	SELECT
+		id, class, costPerPerson
+	FROM
+		prices;
+END $$
+DELIMITER ;
+
+
+-- 2. Create the booking window per weekday (0 = Monday ... 6 = Sunday, like WEEKDAY())
+-- A weekday without a row is closed.
+DROP TABLE IF EXISTS `service_hours`;
+CREATE TABLE `service_hours` (
+    weekday TINYINT PRIMARY KEY CHECK (weekday BETWEEN 0 AND 6),
+    firstStart TIME NOT NULL,
+    lastStart TIME NOT NULL,
+    CHECK (firstStart <= lastStart)
+);
+
+INSERT INTO `service_hours` (weekday, firstStart, lastStart)
+VALUES
+	(0, '17:00:00', '21:30:00'),
+	(1, '17:00:00', '21:30:00'),
+	(2, '17:00:00', '21:30:00'),
+	(3, '17:00:00', '21:30:00'),
+	(4, '17:00:00', '21:30:00'),
+	(5, '17:00:00', '21:30:00'),
+	(6, '17:00:00', '21:30:00');
+
+-- The application caches the schedule, bump its version like the other cached tables
+INSERT INTO cache_versions (tableName, version)
+VALUES ('service_hours', 0)
+ON DUPLICATE KEY UPDATE version = version;
+
+DROP TRIGGER IF EXISTS `service_hours_cache_insert`;
+DROP TRIGGER IF EXISTS `service_hours_cache_update`;
+DROP TRIGGER IF EXISTS `service_hours_cache_delete`;
+CREATE TRIGGER `service_hours_cache_insert` AFTER INSERT ON `service_hours`
+FOR EACH ROW CALL bump_cache_version('service_hours');
+CREATE TRIGGER `service_hours_cache_update` AFTER UPDATE ON `service_hours`
+FOR EACH ROW CALL bump_cache_version('service_hours');
+CREATE TRIGGER `service_hours_cache_delete` AFTER DELETE ON `service_hours`
+FOR EACH ROW CALL bump_cache_version('service_hours');
+
+
+-- 3. Create functions for the policy
+DROP FUNCTION IF EXISTS `get_room_duration`;
+DELIMITER $$
+CREATE FUNCTION `get_room_duration`(roomName VARCHAR(50))
+RETURNS INT READS SQL DATA
+BEGIN
+	DECLARE foundDuration INT DEFAULT NULL;
+
+	SELECT p.durationMinutes INTO foundDuration
+    FROM rooms r
+    JOIN prices p
+		ON r.classId = p.id
+	WHERE r.room = roomName;
+
+    RETURN foundDuration;
+END$$
+DELIMITER ;
+
+-- Longest experience of any class, bounds how far back an overlapping booking can start
+DROP FUNCTION IF EXISTS `get_max_duration`;
+DELIMITER $$
+CREATE FUNCTION `get_max_duration`()
+RETURNS INT READS SQL DATA
+BEGIN
+	DECLARE longest INT DEFAULT 90;
+
+	SELECT COALESCE(MAX(durationMinutes), 90) INTO longest
+    FROM prices;
+
+    RETURN longest;
+END$$
+DELIMITER ;
+
+DROP FUNCTION IF EXISTS `is_service_time`;
+DELIMITER $$
+CREATE FUNCTION `is_service_time`(dtime DATETIME)
+RETURNS INT READS SQL DATA
+BEGIN
+	RETURN EXISTS (SELECT 1 FROM service_hours
+				   WHERE weekday = WEEKDAY(dtime)
+					   AND TIME(dtime) BETWEEN firstStart AND lastStart);
+END$$
+DELIMITER ;
+
+
+-- 4. Store the end time of every reservation
+ALTER TABLE `reservations` ADD COLUMN endTime DATETIME NULL;
+
+UPDATE reservations r
+JOIN rooms rm
+	ON r.room = rm.room
+JOIN prices p
+	ON rm.classId = p.id
+SET r.endTime = r.dateAndTime + INTERVAL p.durationMinutes MINUTE;
+
+ALTER TABLE `reservations` MODIFY endTime DATETIME NOT NULL;
+
+-- The overlap checks read start and end from the index alone. The new indexes lead
+-- with the same columns as those of upgrade 01, so they take over the foreign keys.
+CREATE INDEX `idx_reservations_room_span` ON `reservations` (room, dateAndTime, endTime);
+DROP INDEX `idx_reservations_room_time` ON `reservations`;
+CREATE INDEX `idx_reservations_diner_span` ON `reservations` (dinerId, dateAndTime, endTime);
+DROP INDEX `idx_reservations_diner_time` ON `reservations`;
+-- Expiry event and index loads of upcoming bookings
+CREATE INDEX `idx_reservations_end` ON `reservations` (endTime);
+
+
+-- 5. Create triggers to keep endTime in sync
+DROP TRIGGER IF EXISTS `reservations_end_time_insert`;
+CREATE TRIGGER `reservations_end_time_insert`
+BEFORE INSERT ON `reservations`
+FOR EACH ROW
+SET NEW.endTime = NEW.dateAndTime + INTERVAL get_room_duration(NEW.room) MINUTE;
+
+DROP TRIGGER IF EXISTS `reservations_end_time_update`;
+DELIMITER $$
+CREATE TRIGGER `reservations_end_time_update`
+BEFORE UPDATE ON `reservations`
+FOR EACH ROW
+BEGIN
+	IF NEW.dateAndTime <> OLD.dateAndTime OR NEW.room <> OLD.room THEN
+		SET NEW.endTime = NEW.dateAndTime + INTERVAL get_room_duration(NEW.room) MINUTE;
+	END IF;
+END $$
+DELIMITER ;
+
+-- A new class duration applies to the bookings of its rooms
+DROP TRIGGER IF EXISTS `prices_end_time_update`;
+DELIMITER $$
+CREATE TRIGGER `prices_end_time_update`
+AFTER UPDATE ON `prices`
+FOR EACH ROW
+BEGIN
+	IF NEW.durationMinutes <> OLD.durationMinutes THEN
+		UPDATE reservations r
+        JOIN rooms rm
+			ON r.room = rm.room
+		SET r.endTime = r.dateAndTime + INTERVAL NEW.durationMinutes MINUTE
+        WHERE rm.classId = NEW.id;
+	END IF;
+END $$
+DELIMITER ;
+
+-- So does the duration of a room's new class
+DROP TRIGGER IF EXISTS `rooms_end_time_update`;
+DELIMITER $$
+CREATE TRIGGER `rooms_end_time_update`
+AFTER UPDATE ON `rooms`
+FOR EACH ROW
+BEGIN
+	IF NEW.classId <> OLD.classId THEN
+		UPDATE reservations
+		SET endTime = dateAndTime + INTERVAL get_room_duration(NEW.room) MINUTE
+        WHERE room = NEW.room;
+	END IF;
+END $$
+DELIMITER ;
+
+
+-- 6. Re-create the overlap guard on stored end times: x_start < y_end AND y_start < x_end
+-- Bookings that overlap NEW start after NEW.dateAndTime minus the longest duration,
+-- which keeps the index range short.
+DROP TRIGGER IF EXISTS `reservations_no_overlap`;
+DELIMITER $$
+CREATE TRIGGER `reservations_no_overlap`
+BEFORE INSERT ON `reservations`
+FOR EACH ROW
+FOLLOWS `reservations_end_time_insert`
+BEGIN
+	DECLARE earliest DATETIME;
+    SET earliest = NEW.dateAndTime - INTERVAL get_max_duration() MINUTE;
+
+	IF EXISTS (SELECT 1 FROM reservations
+			   WHERE room = NEW.room
+				   AND dateAndTime > earliest
+				   AND dateAndTime < NEW.endTime
+				   AND endTime > NEW.dateAndTime) THEN
+		SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Room is double-booked';
+	END IF;
+	IF EXISTS (SELECT 1 FROM reservations
+			   WHERE dinerId = NEW.dinerId
+				   AND dateAndTime > earliest
+				   AND dateAndTime < NEW.endTime
+				   AND endTime > NEW.dateAndTime) THEN
+		SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Diner is double-booked';
+	END IF;
+END $$
+DELIMITER ;
+
+
+-- 7. Re-create the booking procedure with the schedule and the class duration
+-- Result codes are unchanged, see ProjectUpgrade02_AtomicBooking.sql.
+DROP PROCEDURE IF EXISTS `book_reservation`;
+DELIMITER $$
+CREATE PROCEDURE `book_reservation`(IN dtime DATETIME, IN roomName VARCHAR(50), IN dinerName VARCHAR(50), IN totalDiners INT)
+BEGIN
+	DECLARE lockedRoom VARCHAR(50) DEFAULT NULL;
+    DECLARE lockedDinerId INT DEFAULT NULL;
+    DECLARE duration INT DEFAULT NULL;
+    DECLARE newEnd DATETIME;
+    DECLARE earliest DATETIME;
+    DECLARE roomBusy INT DEFAULT 0;
+    DECLARE dinerBusy INT DEFAULT 0;
+
+    -- Lock the room row, then the diner row (always in this order to avoid deadlocks).
+    -- Only the room is locked: the class row is read without a lock, so
+    -- bookings of other rooms of the class do not queue on it.
+    SELECT r.room, p.durationMinutes INTO lockedRoom, duration
+    FROM rooms r
+    JOIN prices p
+		ON r.classId = p.id
+    WHERE r.room = roomName
+    FOR UPDATE OF r;
+    SELECT id INTO lockedDinerId FROM diners WHERE diner = dinerName FOR UPDATE;
+
+    IF lockedRoom IS NULL AND lockedDinerId IS NULL THEN
+		SELECT -5 AS result;
+	ELSEIF lockedDinerId IS NULL THEN
+		SELECT -3 AS result;
+	ELSEIF lockedRoom IS NULL THEN
+		SELECT -4 AS result;
+	ELSEIF NOT (dtime > NOW() + INTERVAL 2 DAY AND is_service_time(dtime)) THEN
+		SELECT -1 AS result;
+	ELSEIF totalDiners <= 0 THEN
+		SELECT -2 AS result;
+	ELSE
+		SET newEnd = dtime + INTERVAL duration MINUTE;
+        SET earliest = dtime - INTERVAL get_max_duration() MINUTE;
+
+        -- Locking reads always see the latest committed bookings
+		SELECT COUNT(*) INTO roomBusy
+        FROM reservations r
+        WHERE r.room = roomName
+			AND r.dateAndTime > earliest
+            AND r.dateAndTime < newEnd
+            AND r.endTime > dtime
+		FOR SHARE;
+
+		SELECT COUNT(*) INTO dinerBusy
+        FROM reservations r
+        WHERE r.dinerId = lockedDinerId
+			AND r.dateAndTime > earliest
+            AND r.dateAndTime < newEnd
+            AND r.endTime > dtime
+		FOR SHARE;
+
+        IF roomBusy > 0 AND dinerBusy > 0 THEN
+			SELECT -6 AS result;
+		ELSEIF roomBusy > 0 THEN
+			SELECT -7 AS result;
+		ELSEIF dinerBusy > 0 THEN
+			SELECT -8 AS result;
+		ELSE
+			INSERT INTO reservations(dateAndTime, room, dinerId, totalDiners)
+            VALUES (dtime, roomName, lockedDinerId, totalDiners);
+            SELECT 1 AS result;
+		END IF;
+	END IF;
+END $$
+DELIMITER ;
+
+
+-- 8. Re-create the legacy add procedure with the schedule
+DROP PROCEDURE IF EXISTS `add_reservation`;
+DELIMITER $$
+CREATE PROCEDURE `add_reservation`(IN dtime DATETIME, IN roomName VARCHAR(50), IN dinerName VARCHAR(50), IN totalDiners INT)
+BEGIN
+	DECLARE verifyRoom INT;
+    DECLARE verifyDinerId INT;
+
+    SET verifyRoom = get_room_existence(roomName);
+    SET verifyDinerId = get_diner_id(dinerName);
+
+    IF dtime > NOW() + INTERVAL 2 DAY AND is_service_time(dtime)
+		AND verifyRoom = 1
+        AND verifyDinerId != -1
+        AND totalDiners > 0 THEN
+		 INSERT INTO reservations(dateAndTime, room, dinerId, totalDiners)
+         VALUES (dtime, roomName, verifyDinerId, totalDiners);
+         SELECT 'Yes' AS success;
+	ELSE
+		SELECT 'Invalid Inputs' AS failure;
+    END IF;
+END $$
+DELIMITER ;
+
+
+-- 9. Re-create the expiry event on the stored end time
+DROP EVENT IF EXISTS `delete_expired_reservations`;
+DELIMITER $$
+CREATE EVENT `delete_expired_reservations`
+ON SCHEDULE EVERY 1 HOUR
+STARTS CURRENT_TIMESTAMP
+DO
+BEGIN
+	DELETE
+    FROM reservations
+    WHERE endTime < NOW();
+END $$
+DELIMITER ;
@@ -3,7 +3,10 @@ from pathlib import Path
 import tkinter as tk
 from tkinter import PhotoImage, Label
 from .login import LoginFrame
+from .async_bridge import AsyncBridge
 from .dashboard import DashFrame
+from ..bll import release_connections
+from ..dal.aio import shutdown_executor
 # Main Application Logic ====================================
 class Application(tk.Tk):
     """
@@ -20,6 +23,8 @@ class Application(tk.Tk):
         login (LoginFrame): The login frame displayed on startup.
         server (dict | None): Connection information for the Omakase database.
         dash (DashFrame | None): The dashboard frame, created after login.
+        bridge (AsyncBridge | None): Runs database calls off the Tk thread,
+            created with the dashboard.
 
     Args:
         title (str): The window title for the application.
@@ -48,6 +53,7 @@ class Application(tk.Tk):
 
         self.server = None
         self.dash = None
+        self.bridge = None
 
     def connectable_db(self, res):
         """
@@ -80,6 +86,10 @@ class Application(tk.Tk):
                 triggers application exit.
         """ 
         if res is None:
+            if self.bridge is not None:
+                self.bridge.close()
+            shutdown_executor(wait=False)
+            release_connections()
             self.destroy()
             sys.exit()
 
@@ -91,5 +101,7 @@ class Application(tk.Tk):
         to the main application dashboard.
         """
         if self.server:
-            self.dash = DashFrame(self, self.server, self.on_cancel)
+            self.bridge = AsyncBridge(self)
+            self.dash = DashFrame(self, self.server, self.on_cancel,
+                                  bridge=self.bridge)
             self.dash.place(relx=0, rely=0, relwidth=1, relheight=1)
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""
+Tk widgets may only be touched from the thread running `mainloop`, while
+awaiting the asyncio DAL (`dal.aio`) needs a running event loop. The
+`AsyncBridge` runs that event loop on a background thread and hands the
+results back to the Tk thread by polling with `after()`, so frames can
+start a coroutine from a button callback and receive its result without
+blocking the window.
+"""
+
+import asyncio
+import queue
+import threading
+import tkinter as tk
+from ..dal.aio import run
+
+
+# Bridge between the Tk main loop and asyncio ====================================
+class AsyncBridge:
+    """
+    Run coroutines on a background event loop and deliver their results
+    to callbacks on the Tk thread.
+
+    Attributes:
+        root (tk.Tk): Window used to schedule `after()` polls.
+        poll_ms (int): Milliseconds between checks for finished coroutines.
+        loop (asyncio.AbstractEventLoop): The background event loop.
+
+    Args:
+        root (tk.Tk): The application window.
+        poll_ms (int): Poll interval in milliseconds. Defaults to 30.
+    """
+    def __init__(self, root, poll_ms=30):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever,
+                                        name="omakase-asyncio", daemon=True)
+        self._thread.start()
+        # Finished futures waiting to be delivered on the Tk thread
+        self._done = queue.Queue()
+        self._pending = 0
+        self._poll_job = None
+
+    def submit(self, coro, on_done=None, on_error=None, owner=None):
+        """
+        Schedule a coroutine and call back on the Tk thread when it ends.
+
+        Args:
+            coro (Coroutine): The coroutine to run, e.g.
+                `aio.Reservations.get_all_reservations(server)`.
+            on_done (Callable[[Any], None], optional): Receives the result.
+            on_error (Callable[[BaseException], None], optional): Receives
+                the exception. Without it, errors are reported through
+                Tk's `report_callback_exception`.
+            owner (tk.Misc, optional): Widget the callbacks belong to.
+                When it was destroyed meanwhile, the callbacks are skipped.
+
+        Returns:
+            concurrent.futures.Future: Can be used to cancel the coroutine.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        self._pending += 1
+        future.add_done_callback(
+            lambda f: self._done.put((f, on_done, on_error, owner)))
+        if self._poll_job is None:
+            self._poll_job = self.root.after(self.poll_ms, self._poll)
+        return future
+
+    def call(self, func, *args, on_done=None, on_error=None, owner=None):
+        """
+        Run a synchronous (BLL) function on the DAL executor.
+
+        Shortcut for `submit(dal.aio.run(func, *args), ...)`.
+
+        Args:
+            func (Callable): The function to run, e.g. `get_all_diners`.
+            *args: Arguments for `func`.
+            on_done, on_error, owner: See `submit`.
+
+        Returns:
+            concurrent.futures.Future: Can be used to cancel the call
+            before it starts.
+        """
+        return self.submit(run(func, *args), on_done, on_error, owner)
+
+    def _poll(self):
+        """Deliver finished coroutines and poll again while any is pending."""
+        self._poll_job = None
+        while True:
+            try:
+                future, on_done, on_error, owner = self._done.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            if future.cancelled():
+                continue
+            if owner is not None and not owner.winfo_exists():
+                continue
+            error = future.exception()
+            if error is None:
+                if on_done is not None:
+                    on_done(future.result())
+            elif on_error is not None:
+                on_error(error)
+            else:
+                self.root.report_callback_exception(
+                    type(error), error, error.__traceback__)
+        if self._pending > 0:
+            self._poll_job = self.root.after(self.poll_ms, self._poll)
+
+    def close(self):
+        """Stop the event loop and drop undelivered results."""
+        if self._poll_job is not None:
+            try:
+                self.root.after_cancel(self._poll_job)
+            except tk.TclError:
+                pass
+            self._poll_job = None
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=1)
@@ -1,4 +1,5 @@
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
 load_dotenv()  # reads .env if present
@@ -15,3 +16,29 @@ def server_defaults():
         "password": os.getenv("DB_PASSWORD", ""),
         "database": os.getenv("DB_NAME", "oma"),
     }
+
+def action_log_settings():
+    """
+    Returns where the action log history is spooled to, pulled from env.
+
+    ACTION_LOG_FILE defaults to logs/actions.log in the project folder; an
+    empty value turns the spool off. The file is rotated after
+    ACTION_LOG_MAX_BYTES bytes, keeping ACTION_LOG_BACKUPS old files.
+    Malformed numbers fall back to the defaults, so a typo in .env does
+    not stop the application.
+    """
+    default = Path(__file__).resolve().parent.parent / "logs" / "actions.log"
+    return {
+        "path": os.getenv("ACTION_LOG_FILE", str(default)),
+        "max_bytes": _env_int("ACTION_LOG_MAX_BYTES", 5242880),
+        "backups": _env_int("ACTION_LOG_BACKUPS", 5),
+    }
+
+def _env_int(name, default):
+    """
+    Returns an integer env value, or the default if it is unset or malformed.
+    """
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
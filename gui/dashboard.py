@@ -1,13 +1,17 @@
 from tkinter import ttk
 from .side_bar import Functionality
-from .logs import ActionLogFrame
+from .logs import ActionLogFrame, open_spool
+from .perf import PerfPanel
 from .data_display import DataFrame
+from .tasks import TaskRunner
+from .config import action_log_settings
 # Dashboard layer ====================================
 """
 This layer will appear if users successfully log in
 There are three sections: 
 Functionality to hold 8 buttons
-Action logs to present results of add/update/delete/search actions
+Action logs to present results of add/update/delete/search actions,
+next to a tab with the timings of the background loads
 Data Frame to manipulate tables
 """
 
@@ -19,7 +23,8 @@ class DashFrame(ttk.Frame):
     - **Functionality**: Sidebar containing navigation buttons
       for core database operations and views.
     - **Action logs**: Panel that displays logs of add, update,
-      delete, and search actions.
+      delete, and search actions, with a second tab for the timings
+      of the background loads.
     - **Data frame**: Central area for interacting with tables
       and displaying query results.
 
@@ -28,15 +33,26 @@ class DashFrame(ttk.Frame):
         func_num (int | None): Identifier for the currently selected functionality.
         server (dict): Database connection information passed from the login frame.
         func (Functionality): Sidebar widget with navigation buttons.
-        logs (ActionLogFrame): Log panel for displaying action results.
+        tabs (ttk.Notebook): Holds the log and performance panels.
+        logs (ActionLogFrame): Log panel for displaying action results;
+            its full history is spooled to the file set in `.env`.
+        perf (PerfPanel): Database, query, connection and render timings
+            of the background loads.
         data (DataFrame): Data display panel for table operations.
+        frames (dict[int | None, DataFrame]): Data panels already built,
+            by functionality. Hidden panels keep their widgets and rows.
+        bridge (AsyncBridge | None): Runs database calls off the Tk thread.
+        runner (TaskRunner | None): Loads table data in the background and
+            cancels the loads of a screen when the user leaves it.
+        busy (ttk.Progressbar): Indicator shown while any load is running.
 
     Args:
         parent (tk.Widget): The parent container in which this frame is placed.
         server (dict): Database connection details.
         on_cancel (Callable): Callback to handle exit requests.
+        bridge (AsyncBridge, optional): Shared bridge for non-blocking loads.
     """
-    def __init__(self, parent, server, on_cancel):
+    def __init__(self, parent, server, on_cancel, bridge=None):
         super().__init__(parent)
 
         # Grid layout (2 rows and 2 columns)
@@ -48,24 +64,37 @@ class DashFrame(ttk.Frame):
         self.on_exit = on_cancel
         self.func_num = None
         self.server = server
+        self.bridge = bridge
+        self.busy = ttk.Progressbar(self, mode="indeterminate", length=120)
 
         # Position three sections
         self.func = Functionality(self, self.server, self.update_func_num,
                                   self.on_exit)
         self.func.grid(row=0, rowspan=2, column=0, padx=10, pady=5, sticky="nsew")
 
-        self.logs = ActionLogFrame(self)
-        self.logs.grid(row=1, column=1, padx=10, pady=5, sticky="nsew")
+        self.tabs = ttk.Notebook(self)
+        self.tabs.grid(row=1, column=1, padx=10, pady=5, sticky="nsew")
+        self.logs = ActionLogFrame(self.tabs,
+                                   spool=open_spool(**action_log_settings()))
+        self.perf = PerfPanel(self.tabs)
+        self.tabs.add(self.logs, text="Action Logs")
+        self.tabs.add(self.perf, text="Performance")
+        self.runner = (TaskRunner(bridge, self.show_busy, self.perf.add_timing)
+                       if bridge is not None else None)
 
-        self.data = DataFrame(self, self.server, self.func_num,self.logs)
+        self.data = DataFrame(self, self.server, self.func_num, self.logs,
+                              runner=self.runner)
         self.data.grid(row=0, column=1, padx=10, pady=5,sticky="nsew")
+        self.frames = {self.func_num: self.data}
 
     def update_func_num(self, func):
         """
-        Update the current functionality and refresh the data panel.
+        Update the current functionality and show its data panel.
 
-        Destroys the existing DataFrame and replaces it with a new one
-        corresponding to the selected functionality.
+        Cancels the pending loads of the current screen and hides its
+        DataFrame. The panel of the selected functionality is built on the
+        first visit and shown again afterwards, reloading its rows only
+        when a table it displays was written in the meantime.
 
         Args:
             func (int | None): Identifier for the selected functionality, passed
@@ -73,7 +102,32 @@ class DashFrame(ttk.Frame):
                 2 for Prices, etc. None to exit).
         """
         self.func_num = func
-        if self.data:
-            self.data.destroy()
-        self.data = DataFrame(self, self.server, self.func_num, self.logs)
-        self.data.grid(row=0, column=1, padx=10, pady=5, sticky="nsew")
\ No newline at end of file
+        if self.runner is not None:
+            if self.runner.busy:
+                # Its load is cancelled below, so reload it on return
+                self.data.versions = None
+            self.runner.cancel_all()
+        self.data.grid_remove()
+        self.data = self.frames.get(func)
+        if self.data is None:
+            self.data = DataFrame(self, self.server, self.func_num, self.logs,
+                                  runner=self.runner)
+            self.frames[func] = self.data
+        else:
+            self.data.refresh_if_stale()
+        self.data.grid(row=0, column=1, padx=10, pady=5, sticky="nsew")
+
+    def show_busy(self, busy):
+        """
+        Show or hide the busy indicator.
+
+        Args:
+            busy (bool): Whether background loads are running.
+        """
+        if busy:
+            self.busy.place(relx=1.0, rely=0.0, anchor="ne", x=-20, y=8)
+            self.busy.lift()
+            self.busy.start(10)
+        else:
+            self.busy.stop()
+            self.busy.place_forget()
@@ -3,13 +3,45 @@ from pathlib import Path
 from .logs import ActionLogFrame
 from .tables import DinersFrame, PricesFrame, RoomsFrame, AllergiesFrame
 from .tables import ReservationsFrame, AllDetailsFrame, RevenuesFrame
+from .tasks import run_task
+from ..bll import get_table_versions
 # Data manipulation layer ====================================
 class DataFrame(ttk.LabelFrame):
-    def __init__(self, parent, server, func_num, logs:ActionLogFrame):
+    """
+    Central panel holding the table screen of one sidebar function.
+
+    The dashboard keeps one DataFrame per function alive and only hides
+    it when the user navigates away. `refresh_if_stale` reloads the
+    screen when one of the tables it shows was written since it loaded.
+
+    Attributes:
+        server (dict): Database connection details.
+        log (ActionLogFrame): Shared action log.
+        num (int | None): The sidebar function shown.
+        runner (TaskRunner | None): Runs the version checks and loads.
+        screen_type (tuple[str, type] | None): Attribute name and class of
+            the table screen, None for the default background.
+        screen (ttk.LabelFrame | None): The table screen, None for the
+            default background or until the first versions are read.
+        versions (dict[str, int] | None): Versions of `screen.TABLES` when
+            the screen was last loaded; None forces the next reload.
+
+    Args:
+        parent (tk.Widget): The dashboard.
+        server (dict): Database connection details.
+        func_num (int | None): The sidebar function to show.
+        logs (ActionLogFrame): Shared action log.
+        runner (TaskRunner, optional): Dashboard task runner.
+    """
+    def __init__(self, parent, server, func_num, logs:ActionLogFrame,
+                 runner=None):
         super().__init__(parent, style="Custom.TLabelframe", padding=5)
 
         self.server = server
         self.log = logs
+        self.runner = runner
+        self.screen = None
+        self.versions = None
 
         # Grid layer of output frame (1 row and 1 column)
         self.rowconfigure(0, weight=1)
@@ -29,27 +61,20 @@ class DataFrame(ttk.LabelFrame):
         }
         self.configure(text=titles.get(self.num, "SAKURA OMAKASE DATABASE"))
 
-        if self.num == 1:
-            self.diners = DinersFrame(self, self.server, self.log)
-            self.diners.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
-        elif self.num == 2:
-            self.prices = PricesFrame(self, self.server, self.log)
-            self.prices.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
-        elif self.num == 3:
-            self.rooms = RoomsFrame(self, self.server, self.log)
-            self.rooms.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
-        elif self.num == 4:
-            self.allergies = AllergiesFrame(self, self.server, self.log)
-            self.allergies.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
-        elif self.num == 5:
-            self.reservations = ReservationsFrame(self, self.server, self.log)
-            self.reservations.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
-        elif self.num == 6:
-            self.details = AllDetailsFrame(self, self.server, self.log)
-            self.details.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
-        elif self.num == 7:
-            self.revenues = RevenuesFrame(self, self.server, self.log)
-            self.revenues.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
+        # Table screen per sidebar function, and the attribute holding it
+        screens = {
+            1: ("diners", DinersFrame),
+            2: ("prices", PricesFrame),
+            3: ("rooms", RoomsFrame),
+            4: ("allergies", AllergiesFrame),
+            5: ("reservations", ReservationsFrame),
+            6: ("details", AllDetailsFrame),
+            7: ("revenues", RevenuesFrame),
+        }
+        self.screen_type = screens.get(self.num)
+
+        if self.screen_type is not None:
+            self.load_screen()
         else:
             # Default Look
             # Create background image for data manipulation when loaded
@@ -58,3 +83,68 @@ class DataFrame(ttk.LabelFrame):
             self.bg_label = Label(self, image=self.bg)
             # Take up 100% width and height of parent
             self.bg_label.place(relx=0, rely=0, relwidth=1, relheight=1)
+
+    def load_screen(self):
+        """
+        Build the table screen once the versions of its tables are read.
+
+        The versions are read first, so a write landing while the screen
+        loads its rows makes the recorded versions stale instead of being
+        counted as already shown.
+        """
+        _, frame = self.screen_type
+        run_task(self.runner, get_table_versions, self.server, frame.TABLES,
+                 on_done=self.show_screen, owner=self)
+
+    def show_screen(self, versions):
+        """
+        Record the versions and build the screen, which loads its rows.
+
+        Args:
+            versions (dict[str, int] | None): The versions read before
+                the rows.
+        """
+        if self.screen is not None:
+            return
+        name, frame = self.screen_type
+        self.versions = versions
+        self.screen = frame(self, self.server, self.log, runner=self.runner)
+        self.screen.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
+        setattr(self, name, self.screen)
+
+    def refresh_if_stale(self):
+        """Reload the screen if a table it shows changed since it loaded."""
+        if self.screen is not None:
+            self.check_versions(reload=True)
+        elif self.screen_type is not None:
+            # The first version read was cancelled before the screen was built
+            self.load_screen()
+
+    def check_versions(self, reload):
+        """
+        Read the versions of the screen's tables in the background.
+
+        The screen is reloaded only after the versions are read, so they
+        never cover a write its rows do not show.
+
+        Args:
+            reload (bool): Whether to reload the screen when the versions
+                differ from the recorded ones (or cannot be read).
+        """
+        run_task(self.runner, get_table_versions, self.server,
+                 self.screen.TABLES,
+                 on_done=lambda res: self.apply_versions(res, reload),
+                 owner=self)
+
+    def apply_versions(self, versions, reload):
+        """
+        Record freshly read versions and reload the screen if stale.
+
+        Args:
+            versions (dict[str, int] | None): The versions just read.
+            reload (bool): Whether a change should reload the screen.
+        """
+        stale = versions is None or versions != self.versions
+        self.versions = versions
+        if reload and stale:
+            self.screen.refresh_data()
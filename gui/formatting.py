@@ -0,0 +1,140 @@
+# Display formatting for DAL rows
+"""
+Formatting helpers for the GUI layer.
+
+The DAL returns raw values (numbers as `Decimal`, datetimes as
+`datetime.datetime`); these helpers turn rows into the strings shown in
+the tree views, so formatting only happens for rows that are displayed.
+"""
+import datetime
+
+
+def format_money(value):
+    """
+    Format an amount of money for display.
+
+    Args:
+        value (decimal.Decimal | float): The amount.
+
+    Returns:
+        str: The amount with a `$` prefix and two decimals, e.g. "$100.00".
+    """
+    return f"${value:.2f}"
+
+
+def price_values(row):
+    """
+    Build the tree view values of a prices row.
+
+    Args:
+        row (PriceRow): A row from the prices table.
+
+    Returns:
+        tuple: (id, class_name, formatted_cost).
+    """
+    return row.id, row.class_name, format_money(row.cost_per_person)
+
+
+def detail_values(row):
+    """
+    Build the tree view values of an all details row.
+
+    Args:
+        row (DetailRow): A row from the all details view.
+
+    Returns:
+        tuple: (date_time, room, diner, phone, class_name, total_diners,
+            staff, allergy, formatted_bill).
+    """
+    return (str(row.date_time), row.room, row.diner, row.phone,
+            row.class_name, row.total_diners, row.staff, row.allergy,
+            format_money(row.bill))
+
+
+def format_duration(duration):
+    """
+    Format an experience duration for display.
+
+    Args:
+        duration (datetime.timedelta): The duration.
+
+    Returns:
+        str: e.g. "1.5 hours", "2 hours" or "45 minutes".
+    """
+    minutes = duration.total_seconds() / 60
+    if minutes < 60:
+        return f"{minutes:g} minutes"
+    hours = minutes / 60
+    return f"{hours:g} hour" + ("" if hours == 1 else "s")
+
+
+def service_hours_text(policy):
+    """
+    Describe the booking windows of a service policy.
+
+    Consecutive weekdays with the same window are grouped.
+
+    Args:
+        policy (ServicePolicy): The current policy.
+
+    Returns:
+        str: e.g. "17:00 to 21:30" when every day is the same, or
+        "Tue-Thu 17:00 to 21:30, Fri-Sat 17:00 to 22:00" otherwise
+        (days that are not listed are closed).
+    """
+    days = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+    windows = [policy.hours.get(day) for day in range(7)]
+    if not any(windows):
+        return "no service hours"
+    if all(w == windows[0] for w in windows):
+        first, last = windows[0]
+        return f"{first:%H:%M} to {last:%H:%M}"
+    parts = []
+    start = 0
+    for day in range(1, 8):
+        if day < 7 and windows[day] == windows[start]:
+            continue
+        if windows[start] is not None:
+            first, last = windows[start]
+            span = (days[start] if day - 1 == start
+                    else f"{days[start]}-{days[day - 1]}")
+            parts.append(f"{span} {first:%H:%M} to {last:%H:%M}")
+        start = day
+    return ", ".join(parts)
+
+
+def closing_time_text(policy):
+    """
+    Return when the last seating ends at the latest, e.g. "23:00".
+
+    Args:
+        policy (ServicePolicy): The current policy.
+
+    Returns:
+        str | None: The time, or None without service hours.
+    """
+    if not policy.hours:
+        return None
+    last = max(window[1] for window in policy.hours.values())
+    end = datetime.datetime.combine(datetime.date.min, last) + policy.longest
+    return f"{end:%H:%M}"
+
+
+def duration_text(policy):
+    """
+    Describe how long an experience lasts.
+
+    Args:
+        policy (ServicePolicy): The current policy.
+
+    Returns:
+        str: e.g. "Each Omakase experience lasts 1.5 hours." or, when the
+        classes differ, "Omakase experiences last up to 2 hours, depending
+        on the class."
+    """
+    durations = set(policy.durations.values())
+    if len(durations) <= 1:
+        return (f"Each Omakase experience lasts "
+                f"{format_duration(policy.longest)}.")
+    return (f"Omakase experiences last up to "
+            f"{format_duration(policy.longest)}, depending on the class.")
@@ -1,6 +1,90 @@
+import logging
+import os
+import queue
 import tkinter as tk
+from collections import deque
+from logging.handlers import QueueListener, RotatingFileHandler
 from tkinter import ttk
 from datetime import datetime
+
+# Messages kept in the log panel; older ones stay in the spool file only
+MAX_MESSAGES = 2000
+# Messages arriving within this many milliseconds are drawn together
+FLUSH_MS = 100
+
+
+# Rotating file for the full log history ====================
+class LogSpool:
+    """
+    Write log lines to a rotating file from a background thread.
+
+    Lines are queued and written by a `QueueListener`, so file I/O and
+    rotation never hold up the Tk thread.
+
+    Attributes:
+        path (str): The log file.
+
+    Args:
+        path (str): The log file; missing directories are created.
+        max_bytes (int): Size at which the file is rotated.
+        backups (int): Number of rotated files kept.
+
+    Raises:
+        OSError: If the directory cannot be created.
+    """
+    def __init__(self, path, max_bytes=5242880, backups=5):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._handler = RotatingFileHandler(path, maxBytes=max_bytes,
+                                            backupCount=backups,
+                                            encoding="utf-8", delay=True)
+        self._handler.setFormatter(
+            logging.Formatter("%(levelname)-5s %(message)s"))
+        self._queue = queue.SimpleQueue()
+        self._listener = QueueListener(self._queue, self._handler)
+        self._listener.start()
+
+    def write(self, line, success=True):
+        """
+        Queue one line for the file.
+
+        Args:
+            line (str): The timestamped message.
+            success (bool): Logged as INFO if True, as ERROR otherwise.
+        """
+        level = logging.INFO if success else logging.ERROR
+        self._queue.put(logging.makeLogRecord({
+            "name": "omakase.gui.actions", "msg": line, "levelno": level,
+            "levelname": logging.getLevelName(level)}))
+
+    def close(self):
+        """Write the queued lines and close the file."""
+        self._listener.stop()
+        self._handler.close()
+
+
+def open_spool(path, max_bytes, backups):
+    """
+    Open a spool, or return None if it is turned off or unavailable.
+
+    Args:
+        path (str): The log file; empty to turn the spool off.
+        max_bytes (int): Size at which the file is rotated.
+        backups (int): Number of rotated files kept.
+
+    Returns:
+        LogSpool | None: The spool.
+    """
+    if not path:
+        return None
+    try:
+        return LogSpool(path, max_bytes, backups)
+    except OSError:
+        return None
+
+
 # Action Log layer to track add/update/delete actions ====================
 class ActionLogFrame(ttk.LabelFrame):
     """
@@ -11,17 +95,44 @@ class ActionLogFrame(ttk.LabelFrame):
     delete, or search actions. The most recent messages are
     inserted at the top of the log for easy visibility.
 
+    Messages are buffered and drawn once per `flush_ms` in a single
+    insert, and only the newest `max_messages` messages are kept on
+    screen (whole messages, however many lines each one takes), so
+    a long service night neither floods nor slows down the panel. With a
+    spool, every message also goes to a rotating file.
+
     Attributes:
         txt_box (tk.Text): The text widget used to display log messages.
         y_scroll (ttk.Scrollbar): Vertical scrollbar for navigating log content.
+        max_messages (int): Messages kept in the text widget.
+        flush_ms (int): Delay before buffered messages are drawn.
+        spool (LogSpool | None): File receiving the full history.
 
     Args:
         parent (tk.Widget): The parent container in which this frame is placed.
+        max_messages (int, optional): Messages kept on screen. Defaults
+            to `MAX_MESSAGES`.
+        flush_ms (int, optional): Batching delay in milliseconds.
+            Defaults to `FLUSH_MS`.
+        spool (LogSpool, optional): File for the full history. It is
+            closed when the frame is destroyed.
     """
-    def __init__(self, parent):
+    def __init__(self, parent, max_messages=MAX_MESSAGES, flush_ms=FLUSH_MS,
+                 spool=None):
         super().__init__(parent, text="Logs For "
                                       "Add/Update/Delete/Search Actions",
                          style="Custom.TLabelframe", padding=5)
+        self.max_messages = max_messages
+        self.flush_ms = flush_ms
+        self.spool = spool
+        # Messages not drawn yet, oldest first; a burst longer than the
+        # panel only keeps the messages that would stay visible
+        self._pending = deque(maxlen=max_messages)
+        self._flush_job = None
+        # Text lines of every message on screen, newest first, and their
+        # sum; the welcome message takes one line
+        self._sizes = deque([1])
+        self._lines = 1
 
         # Grid layer of output frame (2 rows and 2 columns)
         self.rowconfigure(0, weight=1)
@@ -45,6 +156,8 @@ class ActionLogFrame(ttk.LabelFrame):
         self.y_scroll.grid(row=0, column=1, sticky="ns")
         self.txt_box.configure(yscrollcommand=self.y_scroll.set)
 
+        self.bind("<Destroy>", self._on_destroy, add="+")
+
     # Add messages to the top (shown from latest)
     def add_message(self, mes, success=True):
         """
@@ -52,13 +165,52 @@ class ActionLogFrame(ttk.LabelFrame):
 
         Adds a timestamped log message at the top of the log display.
         Messages are styled according to their status (blue for success,
-        red for errors).
+        red for errors). The message is drawn with the next batch, at
+        most `flush_ms` later, and written to the spool right away.
 
         Args:
             mes (str): The log message to display.
             success (bool, optional): Whether the action was successful.
                 Defaults to True. If False, the message is tagged as an error.
         """
-        text = f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} {mes}\n"
+        line = f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} {mes}"
         tag = "success" if success else "error"
-        self.txt_box.insert("1.0", text, tag)
\ No newline at end of file
+        self._pending.append((line + "\n", tag))
+        if self.spool is not None:
+            self.spool.write(line, success)
+        if self._flush_job is None:
+            self._flush_job = self.after(self.flush_ms, self.flush)
+
+    def flush(self):
+        """Draw the buffered messages in one insert and trim old messages."""
+        if self._flush_job is not None:
+            self.after_cancel(self._flush_job)
+            self._flush_job = None
+        if not self._pending:
+            return
+        # Newest on top: one insert of (text, tag) pairs, newest first
+        chunks = []
+        for text, tag in reversed(self._pending):
+            chunks.extend((text, tag))
+        for text, _ in self._pending:
+            size = text.count("\n")
+            self._sizes.appendleft(size)
+            self._lines += size
+        self._pending.clear()
+        self.txt_box.insert("1.0", *chunks)
+        # Drop whole messages from the bottom, oldest first
+        if len(self._sizes) > self.max_messages:
+            while len(self._sizes) > self.max_messages:
+                self._lines -= self._sizes.pop()
+            self.txt_box.delete(f"{self._lines + 1}.0", "end")
+
+    def _on_destroy(self, event):
+        """Stop the pending batch and close the spool with the frame."""
+        if event.widget is not self:
+            return
+        if self._flush_job is not None:
+            self.after_cancel(self._flush_job)
+            self._flush_job = None
+        if self.spool is not None:
+            self.spool.close()
+            self.spool = None
@@ -0,0 +1,210 @@
+"""
+Live timings of the dashboard's background tasks.
+
+Every load, search and version check reports a `TaskTiming` through the
+`TaskRunner`. The panel lists the most recent ones and draws a histogram
+of their latencies. The summary line splits the recent time into its
+parts, so a slow screen can be pinned on the right layer:
+    - MySQL: statements and fetching their rows (server and network),
+    - connect: getting connections from the pool or the server,
+    - Python: the rest of the BLL/DAL call on the worker thread,
+    - queue: waiting for a worker and for the Tk thread to pick up
+      the result,
+    - Tk: the callback filling the tree view and the redraw after it.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from collections import deque
+from datetime import datetime
+
+# Timings kept for the list, the histogram and the summary
+HISTORY = 200
+# Upper edges of the histogram buckets in milliseconds; the last bucket
+# holds everything slower
+BUCKET_EDGES = (10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+def latency_histogram(values, edges=BUCKET_EDGES):
+    """
+    Count latencies per bucket.
+
+    Args:
+        values (Iterable[float]): Latencies in milliseconds.
+        edges (tuple[float, ...]): Ascending upper bucket edges.
+
+    Returns:
+        list[int]: One count per edge, plus one for values at or above
+        the last edge.
+    """
+    counts = [0] * (len(edges) + 1)
+    for value in values:
+        i = 0
+        while i < len(edges) and value >= edges[i]:
+            i += 1
+        counts[i] += 1
+    return counts
+
+
+def time_breakdown(timings):
+    """
+    Split the time of some tasks into the layers it was spent in.
+
+    Args:
+        timings (Iterable[TaskTiming]): Task timings.
+
+    Returns:
+        dict[str, float]: Milliseconds per layer ("MySQL", "connect",
+        "Python", "queue", "Tk"), in that order.
+    """
+    parts = dict.fromkeys(("MySQL", "connect", "Python", "queue", "Tk"), 0.0)
+    for t in timings:
+        call = t.call_ms or 0.0
+        parts["MySQL"] += t.db_ms
+        parts["connect"] += t.connect_ms
+        parts["Python"] += max(call - t.db_ms - t.connect_ms, 0.0)
+        parts["queue"] += max(t.total_ms - call - t.render_ms, 0.0)
+        parts["Tk"] += t.render_ms
+    return parts
+
+
+class PerfPanel(ttk.Frame):
+    """
+    A panel with the timings of recent background tasks.
+
+    The list shows one line per task, newest first: total latency, time
+    spent in MySQL, statements sent, connections used (pool checkouts /
+    new connections), rows drawn and the time Tk needed to draw them.
+    Next to it, a histogram of the recent latencies and a summary line
+    with the median, the 95th percentile and where the time went.
+
+    Attributes:
+        timings (collections.deque[TaskTiming]): The most recent timings.
+        tree (ttk.Treeview): List of the recent tasks.
+        y_scroll (ttk.Scrollbar): Vertical scrollbar of the list.
+        canvas (tk.Canvas): Latency histogram.
+        summary (ttk.Label): Percentiles and time per layer.
+        clear_btn (ttk.Button): Forgets every timing.
+
+    Args:
+        parent (tk.Widget): The parent container.
+        history (int): Timings kept. Defaults to `HISTORY`.
+    """
+    def __init__(self, parent, history=HISTORY):
+        super().__init__(parent, padding=5)
+        self.timings = deque(maxlen=history)
+
+        # Grid layout (2 rows and 3 columns)
+        self.rowconfigure(0, weight=1)
+        self.rowconfigure(1, weight=0)
+        self.columnconfigure(0, weight=3)
+        self.columnconfigure(1, weight=0)
+        self.columnconfigure(2, weight=2)
+
+        columns = {
+            "time": ("Time", 70),
+            "action": ("Action", 170),
+            "total": ("Total ms", 70),
+            "db": ("MySQL ms", 70),
+            "queries": ("Queries", 60),
+            "conns": ("Conn. (new)", 75),
+            "rows": ("Rows", 50),
+            "render": ("Tk ms", 60),
+        }
+        self.tree = ttk.Treeview(self, columns=list(columns),
+                                 show="headings", height=5)
+        for col, (heading, width) in columns.items():
+            self.tree.heading(col, text=heading)
+            self.tree.column(col, width=width, minwidth=40,
+                             anchor="w" if col == "action" else "e")
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.y_scroll = ttk.Scrollbar(self, orient="vertical",
+                                      command=self.tree.yview)
+        self.y_scroll.grid(row=0, column=1, sticky="ns")
+        self.tree.configure(yscrollcommand=self.y_scroll.set)
+
+        self.canvas = tk.Canvas(self, height=110, background="white",
+                                highlightthickness=0)
+        self.canvas.grid(row=0, column=2, padx=(10, 0), sticky="nsew")
+        self.canvas.bind("<Configure>", lambda event: self._draw_histogram())
+
+        self.summary = ttk.Label(self, text="No timings yet.",
+                                 font=("Helvetica", 9))
+        self.summary.grid(row=1, column=0, columnspan=2, sticky="w",
+                          pady=(4, 0))
+        self.clear_btn = ttk.Button(self, text="Clear", command=self.clear)
+        self.clear_btn.grid(row=1, column=2, sticky="e", pady=(4, 0))
+
+    def add_timing(self, timing):
+        """
+        Show the timing of a finished task.
+
+        Args:
+            timing (TaskTiming): The timing, as sent by the `TaskRunner`.
+        """
+        self.timings.append(timing)
+        values = (
+            datetime.fromtimestamp(timing.finished).strftime("%H:%M:%S"),
+            timing.name,
+            f"{timing.total_ms:.1f}",
+            f"{timing.db_ms:.1f}",
+            timing.queries,
+            f"{timing.checkouts} ({timing.connections})",
+            "" if timing.rows is None else timing.rows,
+            f"{timing.render_ms:.1f}",
+        )
+        self.tree.insert(parent="", index=0, values=values)
+        children = self.tree.get_children()
+        if len(children) > self.timings.maxlen:
+            self.tree.delete(*children[self.timings.maxlen:])
+        self._update_summary()
+        self._draw_histogram()
+
+    def clear(self):
+        """Forget every timing."""
+        self.timings.clear()
+        self.tree.delete(*self.tree.get_children())
+        self._update_summary()
+        self._draw_histogram()
+
+    def _update_summary(self):
+        """Show the percentiles and the time per layer of the kept timings."""
+        if not self.timings:
+            self.summary.configure(text="No timings yet.")
+            return
+        totals = sorted(t.total_ms for t in self.timings)
+        p50 = totals[(len(totals) - 1) // 2]
+        p95 = totals[max(0, -(-len(totals) * 95 // 100) - 1)]
+        parts = time_breakdown(self.timings)
+        whole = sum(parts.values()) or 1.0
+        shares = "  ".join(f"{layer} {ms / whole:.0%}"
+                           for layer, ms in parts.items())
+        self.summary.configure(
+            text=f"Last {len(totals)} tasks: p50 {p50:.0f} ms, "
+                 f"p95 {p95:.0f} ms  |  {shares}")
+
+    def _draw_histogram(self):
+        """Redraw the latency histogram to fit the canvas."""
+        canvas = self.canvas
+        canvas.delete("all")
+        width, height = canvas.winfo_width(), canvas.winfo_height()
+        if width <= 1:
+            return  # not mapped yet
+        counts = latency_histogram(t.total_ms for t in self.timings)
+        labels = ([f"<{edge}" for edge in BUCKET_EDGES]
+                  + [f"{BUCKET_EDGES[-1]}+"])
+        highest = max(counts) or 1
+        slot = width / len(counts)
+        base = height - 16
+        for i, (count, label) in enumerate(zip(counts, labels)):
+            left, right = i * slot + 2, (i + 1) * slot - 2
+            middle = (left + right) / 2
+            top = base - (base - 14) * count / highest
+            if count:
+                canvas.create_rectangle(left, top, right, base,
+                                        fill="#4A7EBB", outline="")
+                canvas.create_text(middle, top - 1, text=count, anchor="s",
+                                   font=("Helvetica", 8))
+            canvas.create_text(middle, height - 2, text=label, anchor="s",
+                               font=("Helvetica", 8))
+        canvas.create_line(0, base, width, base, fill="#999999")
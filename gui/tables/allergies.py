@@ -1,8 +1,11 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from ..widgets import Button, ButtonEntryFrame
+from operator import itemgetter
+from ..widgets import Button, ButtonEntryFrame, PagedTable
+from ..widgets.paged_table import keyset_source
 from ..logs import ActionLogFrame
-from ...bll import get_all_allergies, get_searched_allergy, delete_allergy, add_allergy
+from ..tasks import run_task
+from ...bll import get_allergies_page, get_searched_allergy, delete_allergy, add_allergy
 # For Allergies Table ----------------------------
 class AllergiesFrame(ttk.LabelFrame):
     """
@@ -16,11 +19,13 @@ class AllergiesFrame(ttk.LabelFrame):
     All successes and errors are written to the shared `ActionLogFrame`.
 
     Attributes:
+        TABLES (tuple[str]): Tables the rows come from. A write to any of
+            them makes the screen stale.
         server (dict): Database connection configuration from the dashboard.
         log (ActionLogFrame): Log panel to display success/error messages.
+        runner (TaskRunner | None): Runs the BLL loads in the background.
         allergies (ttk.Treeview): Tree view (ID, Diner Name, Allergy Type, Level).
-        x_scroll (ttk.Scrollbar | None): Horizontal scrollbar for the tree view.
-        y_scroll (ttk.Scrollbar | None): Vertical scrollbar for the tree view.
+        table (PagedTable): Pages rows from the database into the tree view.
         button_frame (ttk.Frame): Container for list/delete controls.
         full_btn (Button): Reloads the full allergies list.
         delete_btn (Button): Deletes the selected allergy record.
@@ -38,12 +43,17 @@ class AllergiesFrame(ttk.LabelFrame):
         parent (tk.Widget): Parent container.
         server (dict): Database connection details used by BLL calls.
         logs (ActionLogFrame): Shared action log instance.
+        runner (TaskRunner, optional): Dashboard task runner for loading
+            data off the Tk thread. Without it, data loads synchronously.
     """
-    def __init__(self, parent, server, logs:ActionLogFrame):
+    TABLES = ("allergies", "diners")
+
+    def __init__(self, parent, server, logs:ActionLogFrame, runner=None):
         super().__init__(parent, text="Full Allergies List",
                          style="Custom.TLabelframe")
         self.server = server
         self.log = logs
+        self.runner = runner
 
         # Grid layout (4 rows and 4 columns)
         self.rowconfigure(0, weight=2, minsize=150)
@@ -58,9 +68,13 @@ class AllergiesFrame(ttk.LabelFrame):
 
         # Display allergies tree view ----------------------
         # First row
-        self.allergies = ttk.Treeview(self, padding=(0, 0, 10, 10))
-        self.allergies.grid(row=0, column=0, columnspan=4, padx=10, pady=10,
-                         sticky="nsew")
+        self.table = PagedTable(
+            self, keyset_source(get_allergies_page, self.server),
+            runner=self.runner,
+            key_row=itemgetter(0))
+        self.table.grid(row=0, column=0, columnspan=4, padx=10, pady=10,
+                        sticky="nsew")
+        self.allergies = self.table.tree
         self.allergies["columns"] = ("ID", "Diner Name", "Allergy Type", "Level")
 
         self.allergies.column("#0", width=0, stretch=False)
@@ -75,9 +89,6 @@ class AllergiesFrame(ttk.LabelFrame):
         self.allergies.heading("Allergy Type", text="Allergy Type", anchor="center")
         self.allergies.heading("Level", text="Level", anchor="center")
 
-        self.x_scroll = None
-        self.y_scroll = None
-        self.create_scroll_bars()
         self.load_full_data()
 
         # Display action buttons  ----------------------
@@ -146,44 +157,25 @@ class AllergiesFrame(ttk.LabelFrame):
         self.add_btn.grid(row=1, column=4, sticky="ew", padx=15)
 
 
-    def create_scroll_bars(self):
+    def load_full_data(self):
         """
-        Attach horizontal/vertical scrollbars to the allergies tree view.
-
-        Configures the tree view to use the created scrollbars.
+        Load and display the full allergies list.
 
-        Side Effects:
-            Modifies `self.allergies` to connect x/y scroll commands.
-            Creates and assigns `self.x_scroll` and `self.y_scroll`.
+        Shows the first page of rows in the paged tree view and sets
+        the label frame title to "Full Allergies List".
         """
-        # Scroll bars configuration
-        self.x_scroll = ttk.Scrollbar(self.allergies, orient="horizontal",
-                                      command=self.allergies.xview)
-        self.y_scroll = ttk.Scrollbar(self.allergies, orient="vertical",
-                                      command=self.allergies.yview)
-        self.x_scroll.pack(side="bottom", fill="x")
-        self.y_scroll.pack(side="right", fill="y")
-        self.allergies.configure(xscrollcommand=self.x_scroll.set,
-                       yscrollcommand=self.y_scroll.set)
+        self.configure(text="Full Allergies List")
+        self.table.load()
 
-    def load_full_data(self):
+    def refresh_data(self):
         """
-        Load and display the full allergies list.
+        Refresh the rows on screen after a write, keeping the current page.
 
-        Fetches all allergy records via the BLL and populates the tree view.
-        Uses alternating row tags ("odd"/"even") for readability and sets the
-        label frame title to "Full Allergies List".
+        Only the rows that changed are redrawn, so the selection and the
+        scroll position survive. Search results give way to the full list.
         """
-        self.allergies.delete(*self.allergies.get_children())
         self.configure(text="Full Allergies List")
-        records = get_all_allergies(self.server)
-        self.allergies.tag_configure("odd", background="white")
-        self.allergies.tag_configure("even", background="#E6E6E6")
-        for i, p in enumerate(records):
-            if i % 2 != 0:
-                self.allergies.insert(parent="", index="end", values=p, tags=("odd",))
-            else:
-                self.allergies.insert(parent="", index="end", values=p, tags=("even",))
+        self.table.refresh()
 
     def load_searched_data(self):
         """
@@ -204,61 +196,61 @@ class AllergiesFrame(ttk.LabelFrame):
         """
         name = self.search_name.get_input().strip().title()
         if name != "":
-
-            res = get_searched_allergy(self.server, name)
-
-            # Result messages mapper
-            mes_mapper = {
-                None: [f"Failed Search: the record of {name} is not on the allergies"
-                       f" table since {name} is not on diners table", False],
-                0: [f"Failed Search: {name} has no allergies.", False],
-                True: [f"Successful Search: the record of {name} "
-                      f"is on the allergies table.", True]
-
-            }
-
-            # Diner is not on the diners table
-            # Or Diner is on diners table but has no allergy
-            # Early exit
-            if res is None:
-                mes1 = mes_mapper.get(None)
-                self.log.add_message(mes1[0], mes1[1])
-                self.search_name.delete_input()
-                return
-
-            elif res == 0:
-                mes2 = mes_mapper.get(0)
-                self.log.add_message(mes2[0], mes2[1])
-                self.search_name.delete_input()
-                return
-
-            else:
-                # Diner is on diners table and has allergy record
-                self.allergies.delete(*self.allergies.get_children())
-                self.configure(text="Search Results List")
-                mes3 = mes_mapper.get(True)
-                for i, r in enumerate(res):
-                    if i % 2 != 0:
-                        self.allergies.insert(parent="", index="end", values=r,
-                                                  tags=("odd",))
-                    else:
-                        self.allergies.insert(parent="", index="end", values=r,
-                                                  tags=("even",))
-                self.log.add_message(mes3[0], mes3[1])
-
+            run_task(self.runner, get_searched_allergy, self.server, name,
+                     on_done=lambda res: self.show_searched_data(name, res),
+                     owner=self)
         else:
             messagebox.showwarning("Warning Message:", "Diner name "
                                                        "cannot be empty.")
         # Clear search box
         self.search_name.delete_input()
 
+    def show_searched_data(self, name, res):
+        """
+        Display the result of an allergy search.
+
+        Args:
+            name (str): The searched diner name.
+            res (list | int | None): Allergy rows, 0 if the diner has no
+                allergies, or None if the diner does not exist.
+        """
+        # Result messages mapper
+        mes_mapper = {
+            None: [f"Failed Search: the record of {name} is not on the allergies"
+                   f" table since {name} is not on diners table", False],
+            0: [f"Failed Search: {name} has no allergies.", False],
+            True: [f"Successful Search: the record of {name} "
+                  f"is on the allergies table.", True]
+
+        }
+
+        # Diner is not on the diners table
+        # Or Diner is on diners table but has no allergy
+        # Early exit
+        if res is None:
+            mes1 = mes_mapper.get(None)
+            self.log.add_message(mes1[0], mes1[1])
+            return
+
+        elif res == 0:
+            mes2 = mes_mapper.get(0)
+            self.log.add_message(mes2[0], mes2[1])
+            return
+
+        else:
+            # Diner is on diners table and has allergy record
+            self.configure(text="Search Results List")
+            mes3 = mes_mapper.get(True)
+            self.table.show_rows(res)
+            self.log.add_message(mes3[0], mes3[1])
+
     def delete_allergy(self):
         """
         Delete the currently selected allergy record.
 
         Prompts for confirmation, then calls the BLL to delete by
         (diner name, allergy type) taken from the selected row. Logs
-        success or failure and reloads the full list.
+        success or failure and refreshes the list.
 
         User Feedback:
             - Warns if no row is selected.
@@ -295,8 +287,8 @@ class AllergiesFrame(ttk.LabelFrame):
                 mes = mes_mapper.get(res)
                 self.log.add_message(mes[0], mes[1])
 
-            # Load full list to reflect change or clear focus
-            self.load_full_data()
+            # Refresh the rows on screen to reflect the change
+            self.refresh_data()
         else:
             messagebox.showwarning("Warning Message",
                                    "Please select a record before clicking "
@@ -368,6 +360,6 @@ class AllergiesFrame(ttk.LabelFrame):
         mes2 = mes_mapper.get(res)
         if res is True:
             # Successfully added
-            self.load_full_data()
+            self.refresh_data()
         self.log.add_message(mes2[0], mes2[1])
         self.clear_record()
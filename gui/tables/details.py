@@ -2,9 +2,13 @@ import tkinter as tk
 import os
 from datetime import datetime
 from tkinter import ttk, messagebox
-from ..widgets import Button
+from operator import itemgetter
+from ..widgets import Button, PagedTable
+from ..widgets.paged_table import keyset_source
+from ..formatting import detail_values
 from ..logs import ActionLogFrame
-from ...bll import get_all_details, get_searched_details, export_details
+from ..tasks import run_task
+from ...bll import get_details_page, get_searched_details, export_details
 # For All Details View (advanced feature csv included) --------------
 class AllDetailsFrame(ttk.LabelFrame):
     """
@@ -20,11 +24,13 @@ class AllDetailsFrame(ttk.LabelFrame):
     All successes and errors are written to the shared `ActionLogFrame`.
 
     Attributes:
+        TABLES (tuple[str]): Tables the rows come from. A write to any of
+            them makes the screen stale.
         server (dict): Database connection configuration from the dashboard.
         log (ActionLogFrame): Log panel to display success/error messages.
+        runner (TaskRunner | None): Runs the BLL loads in the background.
         details (ttk.Treeview): Grid of the 'All Details' view fields.
-        x_scroll (ttk.Scrollbar | None): Horizontal scrollbar for the tree view.
-        y_scroll (ttk.Scrollbar | None): Vertical scrollbar for the tree view.
+        table (PagedTable): Pages rows from the database into the tree view.
         button_frame (ttk.Frame): Container for the full-list button.
         full_btn (Button): Reloads the full details list.
         search (ttk.LabelFrame): Container for the search inputs.
@@ -38,12 +44,17 @@ class AllDetailsFrame(ttk.LabelFrame):
         parent (tk.Widget): Parent container.
         server (dict): Database connection details used by BLL calls.
         logs (ActionLogFrame): Shared action log instance.
+        runner (TaskRunner, optional): Dashboard task runner for loading
+            data off the Tk thread. Without it, data loads synchronously.
     """
-    def __init__(self, parent, server, logs:ActionLogFrame):
+    TABLES = ("reservations", "diners", "rooms", "prices", "allergies")
+
+    def __init__(self, parent, server, logs:ActionLogFrame, runner=None):
         super().__init__(parent, text="Full Details List",
                          style="Custom.TLabelframe")
         self.server = server
         self.log = logs
+        self.runner = runner
 
         # Grid layout (4 rows and 4 columns)
         self.rowconfigure(0, weight=2, minsize=150)
@@ -58,9 +69,13 @@ class AllDetailsFrame(ttk.LabelFrame):
 
         # Display all details tree view ----------------------
         # First row
-        self.details = ttk.Treeview(self, padding=(0, 0, 10, 10))
-        self.details.grid(row=0, column=0, columnspan=4, padx=10, pady=10,
-                         sticky="nsew")
+        self.table = PagedTable(
+            self, keyset_source(get_details_page, self.server),
+            runner=self.runner, format_row=detail_values,
+            key_row=itemgetter(0, 1))
+        self.table.grid(row=0, column=0, columnspan=4, padx=10, pady=10,
+                        sticky="nsew")
+        self.details = self.table.tree
         self.details["columns"] = ("Date and Time", "Room Name", "Diner Name",
                                   "Phone", "Class Name", "Total Diners", "Staff",
                                   "Allergy", "Bill")
@@ -87,9 +102,6 @@ class AllDetailsFrame(ttk.LabelFrame):
         self.details.heading("Allergy", text="Allergy", anchor="center")
         self.details.heading("Bill", text="Bill", anchor="center")
 
-        self.x_scroll = None
-        self.y_scroll = None
-        self.create_scroll_bars()
         self.load_full_data()
 
         # Display action buttons  ----------------------
@@ -175,44 +187,25 @@ class AllDetailsFrame(ttk.LabelFrame):
                                  font=("Helvetica", 8))
         self.notice3.grid(row=2, column=1, columnspan=3, pady=2)
 
-    def create_scroll_bars(self):
+    def load_full_data(self):
         """
-        Attach horizontal/vertical scrollbars to the details tree view.
-
-        Configures the tree view to use the created scrollbars.
+        Load and display the full 'All Details' list.
 
-        Side Effects:
-            Modifies `self.details` to connect x/y scroll commands.
-            Creates and assigns `self.x_scroll` and `self.y_scroll`.
+        Shows the first page of rows in the paged tree view and sets
+        the label frame title to "Full Detail List".
         """
-        # Scroll bars configuration
-        self.x_scroll = ttk.Scrollbar(self.details, orient="horizontal",
-                                      command=self.details.xview)
-        self.y_scroll = ttk.Scrollbar(self.details, orient="vertical",
-                                      command=self.details.yview)
-        self.x_scroll.pack(side="bottom", fill="x")
-        self.y_scroll.pack(side="right", fill="y")
-        self.details.configure(xscrollcommand=self.x_scroll.set,
-                       yscrollcommand=self.y_scroll.set)
+        self.configure(text="Full Detail List")
+        self.table.load()
 
-    def load_full_data(self):
+    def refresh_data(self):
         """
-        Load and display the full 'All Details' list.
+        Refresh the rows on screen after a write, keeping the current page.
 
-        Fetches all combined details via the BLL and populates the tree view.
-        Uses alternating row tags ("odd"/"even") for readability and sets the
-        label frame title to "Full Detail List".
+        Only the rows that changed are redrawn, so the selection and the
+        scroll position survive. Search results give way to the full list.
         """
-        self.details.delete(*self.details.get_children())
         self.configure(text="Full Detail List")
-        records = get_all_details(self.server)
-        self.details.tag_configure("odd", background="white")
-        self.details.tag_configure("even", background="#E6E6E6")
-        for i, r in enumerate(records):
-            if i % 2 != 0:
-                self.details.insert(parent="", index="end", values=r, tags=("odd",))
-            else:
-                self.details.insert(parent="", index="end", values=r, tags=("even",))
+        self.table.refresh()
 
     def clear_search_form(self):
         """Clear the search inputs (datetime and room)."""
@@ -259,50 +252,54 @@ class AllDetailsFrame(ttk.LabelFrame):
                 self.clear_search_form()
                 return
 
-            res = get_searched_details(self.server, dtime, room)
-            # Room is not on the rooms table
-
-            # Result messages mapper for getting searched details
-            mes_mapper = {
-                None: [f"Failed Search: reservation does not exist since"
-                      f" {room} is not on rooms table", False],
-                0: [f"Failed Search: {room} is not reserved at {dtime}.", False],
-                True: [f"Successful Search: the reservation detail of {room} at "
-                       f"{dtime} is found on the reservations table.", True]
-            }
-
-            if res is None:
-                mes = mes_mapper.get(None)
-                self.log.add_message(mes[0], mes[1])
-                self.clear_search_form()
-                return
-
-            # Room is on rooms table but has no reservation made
-            if res == 0:
-                mes = mes_mapper.get(0)
-                self.log.add_message(mes[0], mes[1])
-
-            else:
-                # Room is on rooms table and has reservation made
-                self.details.delete(*self.details.get_children())
-                self.configure(text="Search Results List")
-                for i, r in enumerate(res):
-                    if i % 2 != 0:
-                        self.details.insert(parent="", index="end",
-                                                 values=r,
-                                                 tags=("odd",))
-                    else:
-                        self.details.insert(parent="", index="end",
-                                                 values=r,
-                                                 tags=("even",))
-                mes = mes_mapper.get(True)
-                self.log.add_message(mes[0], mes[1])
+            run_task(self.runner, get_searched_details, self.server,
+                     dtime, room,
+                     on_done=lambda res: self.show_searched_data(
+                         dtime, room, res),
+                     owner=self)
         else:
             messagebox.showwarning("Warning Message:",
                                    "Date and Time and Room cannot be empty.")
 
         self.clear_search_form()
 
+    def show_searched_data(self, dtime, room, res):
+        """
+        Display the result of a details search.
+
+        Args:
+            dtime (datetime): The searched begin date and time.
+            room (str): The searched room name.
+            res (list | int | None): Matching rows, 0 if the room has no
+                reservation at that time, or None if the room does not exist.
+        """
+        # Result messages mapper for getting searched details
+        mes_mapper = {
+            None: [f"Failed Search: reservation does not exist since"
+                  f" {room} is not on rooms table", False],
+            0: [f"Failed Search: {room} is not reserved at {dtime}.", False],
+            True: [f"Successful Search: the reservation detail of {room} at "
+                   f"{dtime} is found on the reservations table.", True]
+        }
+
+        # Room is not on the rooms table
+        if res is None:
+            mes = mes_mapper.get(None)
+            self.log.add_message(mes[0], mes[1])
+            return
+
+        # Room is on rooms table but has no reservation made
+        if res == 0:
+            mes = mes_mapper.get(0)
+            self.log.add_message(mes[0], mes[1])
+
+        else:
+            # Room is on rooms table and has reservation made
+            self.configure(text="Search Results List")
+            self.table.show_rows(res)
+            mes = mes_mapper.get(True)
+            self.log.add_message(mes[0], mes[1])
+
 
 # Advanced feature CSV (export the all details view into csv file) ===========
     def export_csv(self):
@@ -1,9 +1,12 @@
 import re
 import tkinter as tk
 from tkinter import ttk, messagebox
-from ..widgets import Button, ButtonEntryFrame
+from operator import itemgetter
+from ..widgets import Button, ButtonEntryFrame, PagedTable
+from ..widgets.paged_table import keyset_source
 from ..logs import ActionLogFrame
-from ...bll import get_all_diners, get_searched_diner, add_diner, delete_diner
+from ..tasks import run_task
+from ...bll import get_diners_page, get_searched_diner, add_diner, delete_diner
 # For Diners Table ----------------------------
 class DinersFrame(ttk.LabelFrame):
     """
@@ -15,11 +18,13 @@ class DinersFrame(ttk.LabelFrame):
     the shared `ActionLogFrame`.
 
     Attributes:
+        TABLES (tuple[str]): Tables the rows come from. A write to any of
+            them makes the screen stale.
         server (dict): Database connection configuration passed from the dashboard.
         log (ActionLogFrame): Log panel to display success/error messages.
+        runner (TaskRunner | None): Runs the BLL loads in the background.
         diners (ttk.Treeview): Tree view showing diner rows (ID, name, phone).
-        x_scroll (ttk.Scrollbar | None): Horizontal scrollbar for the tree view.
-        y_scroll (ttk.Scrollbar | None): Vertical scrollbar for the tree view.
+        table (PagedTable): Pages rows from the database into the tree view.
         button_frame (ttk.Frame): Container for the list/delete buttons row.
         full_btn (Button): Triggers full list reload.
         delete_btn (Button): Deletes the selected diner.
@@ -34,12 +39,17 @@ class DinersFrame(ttk.LabelFrame):
         parent (tk.Widget): Parent container.
         server (dict): Database connection details used by BLL calls.
         logs (ActionLogFrame): Shared action log instance.
+        runner (TaskRunner, optional): Dashboard task runner for loading
+            data off the Tk thread. Without it, data loads synchronously.
     """
-    def __init__(self, parent, server, logs:ActionLogFrame):
+    TABLES = ("diners",)
+
+    def __init__(self, parent, server, logs:ActionLogFrame, runner=None):
         super().__init__(parent, text="Full Diners List",
                          style="Custom.TLabelframe")
         self.server = server
         self.log = logs
+        self.runner = runner
 
         # Grid layout (4 rows and 4 columns)
         self.rowconfigure(0, weight=2, minsize=150)
@@ -54,9 +64,13 @@ class DinersFrame(ttk.LabelFrame):
 
         # Display diners tree view ----------------------
         # First row
-        self.diners = ttk.Treeview(self, padding=(0, 0, 10, 10))
-        self.diners.grid(row=0, column=0, columnspan=4, padx=10, pady=10,
-                         sticky="nsew")
+        self.table = PagedTable(
+            self, keyset_source(get_diners_page, self.server),
+            runner=self.runner,
+            key_row=itemgetter(0))
+        self.table.grid(row=0, column=0, columnspan=4, padx=10, pady=10,
+                        sticky="nsew")
+        self.diners = self.table.tree
         self.diners["columns"] = ("ID", "Diner Name", "Phone")
 
         self.diners.column("#0", width=0, stretch=False)
@@ -68,9 +82,6 @@ class DinersFrame(ttk.LabelFrame):
         self.diners.heading("ID", text="ID", anchor="center")
         self.diners.heading("Diner Name", text="Diner Name", anchor="center")
         self.diners.heading("Phone", text="Phone", anchor="center")
-        self.x_scroll = None
-        self.y_scroll = None
-        self.create_scroll_bars()
         self.load_full_data()
 
         # Display action buttons  ----------------------
@@ -122,36 +133,25 @@ class DinersFrame(ttk.LabelFrame):
                                 font=("Helvetica", 8))
         self.notice.grid(row=1, column=2, columnspan=2, pady=2)
 
-    def create_scroll_bars(self):
-        """Attach horizontal/vertical scrollbars to the diners tree view."""
-        # Scroll bars configuration
-        self.x_scroll = ttk.Scrollbar(self.diners, orient="horizontal",
-                                      command=self.diners.xview)
-        self.y_scroll = ttk.Scrollbar(self.diners, orient="vertical",
-                                      command=self.diners.yview)
-        self.x_scroll.pack(side="bottom", fill="x")
-        self.y_scroll.pack(side="right", fill="y")
-        self.diners.configure(xscrollcommand=self.x_scroll.set,
-                       yscrollcommand=self.y_scroll.set)
-
     def load_full_data(self):
         """
         Load and display the full diners list.
 
-        Fetches all diners via the BLL and populates the tree view. Applies
-        alternating row tags ("odd"/"even") for readability and updates the
-        label frame title to "Full Diners List".
+        Shows the first page of rows in the paged tree view and sets
+        the label frame title to "Full Diners List".
+        """
+        self.configure(text="Full Diners List")
+        self.table.load()
+
+    def refresh_data(self):
+        """
+        Refresh the rows on screen after a write, keeping the current page.
+
+        Only the rows that changed are redrawn, so the selection and the
+        scroll position survive. Search results give way to the full list.
         """
-        self.diners.delete(*self.diners.get_children())
         self.configure(text="Full Diners List")
-        guests = get_all_diners(self.server)
-        self.diners.tag_configure("odd", background="white")
-        self.diners.tag_configure("even", background="#E6E6E6")
-        for i, p in enumerate(guests):
-            if i % 2 != 0:
-                self.diners.insert(parent="", index="end", values=p, tags=("odd",))
-            else:
-                self.diners.insert(parent="", index="end", values=p, tags=("even",))
+        self.table.refresh()
 
     def load_searched_data(self):
         """
@@ -171,41 +171,45 @@ class DinersFrame(ttk.LabelFrame):
         """
         name = self.search_name.get_input().strip().title()
         if name != "":
-            res = get_searched_diner(self.server, name)
-            if res is not None:
-                self.diners.delete(*self.diners.get_children())
-                self.configure(text="Search Results List")
-                for i, r in enumerate(res):
-                    if i % 2 != 0:
-                        self.diners.insert(parent="", index="end", values=r,
-                                           tags=("odd",))
-                    else:
-                        self.diners.insert(parent="", index="end", values=r,
-                                           tags=("even",))
-
-                self.log.add_message(f"Successful Search: {name} is on the diners table.")
-            else:
-                self.log.add_message(f"Failed Search: {name} is not on the "
-                                     f"diners table.", False)
+            run_task(self.runner, get_searched_diner, self.server, name,
+                     on_done=lambda res: self.show_searched_data(name, res),
+                     owner=self)
         else:
             messagebox.showwarning("Warning Message:", "Diner name "
                                                        "cannot be empty.")
         self.search_name.delete_input()
 
+    def show_searched_data(self, name, res):
+        """
+        Display the result of a diner search.
+
+        Args:
+            name (str): The searched diner name.
+            res (list | None): Matching rows, or None if no diner matched.
+        """
+        if res is not None:
+            self.configure(text="Search Results List")
+            self.table.show_rows(res)
+
+            self.log.add_message(f"Successful Search: {name} is on the diners table.")
+        else:
+            self.log.add_message(f"Failed Search: {name} is not on the "
+                                 f"diners table.", False)
+
     def delete_diner(self):
         """
         Delete the currently selected diner.
 
         Prompts for confirmation, then calls the BLL to delete by diner name
         (selected row). Logs a success or error message, and refreshes the
-        full list to reflect changes.
+        list on screen to reflect changes.
 
         User Feedback:
             - Warns if no row is selected.
             - Confirmation dialog before deletion.
 
         Side Effects:
-            - Reloads the full diners list after attempting deletion.
+            - Refreshes the diners list after attempting deletion.
             - Clears the search input at the end.
         """
         selected = self.diners.focus()
@@ -229,8 +233,8 @@ class DinersFrame(ttk.LabelFrame):
                 res = mes_map.get(mes)
                 self.log.add_message(res[0], res[1])
 
-            # Load full list to reflect change and clear focus
-            self.load_full_data()
+            # Refresh the rows on screen to reflect the change
+            self.refresh_data()
         else:
             messagebox.showwarning("Warning Message",
                                    "Please select a record before clicking "
@@ -248,7 +252,7 @@ class DinersFrame(ttk.LabelFrame):
         Validate inputs and add a new diner.
 
         Validates the add-form inputs and calls the BLL to insert a diner.
-        On success, reloads the full list and logs the result. On error,
+        On success, refreshes the list and logs the result. On error,
         logs an appropriate message and clears the form.
 
         Validation:
@@ -303,7 +307,7 @@ class DinersFrame(ttk.LabelFrame):
 
         mes3 = mes_map.get(res)
         if res is True:
-            self.load_full_data()
+            self.refresh_data()
 
         self.log.add_message(mes3[0], mes3[1])
         self.clear_record()
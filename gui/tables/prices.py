@@ -1,19 +1,25 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+from operator import itemgetter
+from ..formatting import price_values
 from ..logs import ActionLogFrame
-from ..widgets import Button, ButtonEntryFrame
-from ...bll import get_all_prices, get_searched_class, add_class, update_class
+from ..tasks import run_task
+from ..widgets import Button, ButtonEntryFrame, PagedTable
+from ..widgets.paged_table import keyset_source
+from ...bll import get_prices_page, get_searched_class, add_class, update_class
 # For Prices Table ----------------------------
 class PricesFrame(ttk.LabelFrame):
     """
     The panel for listing, searching, adding, and updating class prices.
 
     Attributes:
+        TABLES (tuple[str]): Tables the rows come from. A write to any of
+            them makes the screen stale.
         server (dict): Database connection configuration passed from the dashboard.
         log (ActionLogFrame): Log panel to display success/error messages.
+        runner (TaskRunner | None): Runs the BLL loads in the background.
         prices (ttk.Treeview): Tree view showing rows (ID, class name, cost per person).
-        x_scroll (ttk.Scrollbar | None): Horizontal scrollbar for the tree view.
-        y_scroll (ttk.Scrollbar | None): Vertical scrollbar for the tree view.
+        table (PagedTable): Pages rows from the database into the tree view.
         button_frame (ttk.Frame): Container for the list/search controls row.
         full_btn (Button): Button that reloads the full price list.
         search_name (ButtonEntryFrame): Search input + button for class name.
@@ -32,12 +38,17 @@ class PricesFrame(ttk.LabelFrame):
         parent (tk.Widget): Parent container.
         server (dict): Database connection details used by BLL calls.
         logs (ActionLogFrame): Shared action log instance.
+        runner (TaskRunner, optional): Dashboard task runner for loading
+            data off the Tk thread. Without it, data loads synchronously.
     """
-    def __init__(self, parent, server, logs:ActionLogFrame):
+    TABLES = ("prices",)
+
+    def __init__(self, parent, server, logs:ActionLogFrame, runner=None):
         super().__init__(parent, text="Full Prices List",
                          style="Custom.TLabelframe")
         self.server = server
         self.log = logs
+        self.runner = runner
 
         # Grid layout (4 rows and 4 columns)
         self.rowconfigure(0, weight=2, minsize=150)
@@ -51,9 +62,13 @@ class PricesFrame(ttk.LabelFrame):
 
         # Display prices tree view ----------------------
         # First row
-        self.prices = ttk.Treeview(self, padding=(0, 0, 10, 10))
-        self.prices.grid(row=0, column=0, columnspan=4, padx=10, pady=10,
-                         sticky="nsew")
+        self.table = PagedTable(
+            self, keyset_source(get_prices_page, self.server),
+            runner=self.runner, format_row=price_values,
+            key_row=itemgetter(0))
+        self.table.grid(row=0, column=0, columnspan=4, padx=10, pady=10,
+                        sticky="nsew")
+        self.prices = self.table.tree
         self.prices["columns"] = ("ID", "Class Name", "Cost Per Person")
 
         self.prices.column("#0", width=0, stretch=False)
@@ -65,9 +80,6 @@ class PricesFrame(ttk.LabelFrame):
         self.prices.heading("ID", text="ID", anchor="center")
         self.prices.heading("Class Name", text="Class Name", anchor="center")
         self.prices.heading("Cost Per Person", text="Cost Per Person", anchor="center")
-        self.x_scroll = None
-        self.y_scroll = None
-        self.create_scroll_bars()
         self.load_full_data()
 
         # Display action buttons  ----------------------
@@ -154,40 +166,25 @@ class PricesFrame(ttk.LabelFrame):
                                  font=("Helvetica", 8))
         self.notice2.grid(row=2, column=0, columnspan=5, pady=2)
 
-    def create_scroll_bars(self):
+    def load_full_data(self):
         """
-        Attach horizontal/vertical scrollbars to the prices tree view.
+        Load and display the full prices list.
 
-        Configures the tree view to use the created scrollbars.
+        Shows the first page of rows in the paged tree view and sets
+        the label frame title to "Full Prices List".
         """
-        # Scroll bars configuration
-        self.x_scroll = ttk.Scrollbar(self.prices, orient="horizontal",
-                                      command=self.prices.xview)
-        self.y_scroll = ttk.Scrollbar(self.prices, orient="vertical",
-                                      command=self.prices.yview)
-        self.x_scroll.pack(side="bottom", fill="x")
-        self.y_scroll.pack(side="right", fill="y")
-        self.prices.configure(xscrollcommand=self.x_scroll.set,
-                       yscrollcommand=self.y_scroll.set)
+        self.configure(text="Full Prices List")
+        self.table.load()
 
-    def load_full_data(self):
+    def refresh_data(self):
         """
-        Load and display the full prices list.
+        Refresh the rows on screen after a write, keeping the current page.
 
-        Fetches all class prices via the BLL and populates the tree view.
-        Uses alternating row tags ("odd"/"even") for readability and sets
-        the label frame title to "Full Prices List".
+        Only the rows that changed are redrawn, so the selection and the
+        scroll position survive. Search results give way to the full list.
         """
-        self.prices.delete(*self.prices.get_children())
         self.configure(text="Full Prices List")
-        prices = get_all_prices(self.server)
-        self.prices.tag_configure("odd", background="white")
-        self.prices.tag_configure("even", background="#E6E6E6")
-        for i, p in enumerate(prices):
-            if i % 2 != 0:
-                self.prices.insert(parent="", index="end", values=p, tags=("odd",))
-            else:
-                self.prices.insert(parent="", index="end", values=p, tags=("even",))
+        self.table.refresh()
 
     def load_searched_data(self):
         """
@@ -206,28 +203,32 @@ class PricesFrame(ttk.LabelFrame):
         """
         name = self.search_name.get_input().strip().title()
         if name != "":
-            res = get_searched_class(self.server, name)
-            if res is not None:
-                self.prices.delete(*self.prices.get_children())
-                self.configure(text="Search Results List")
-                for i, r in enumerate(res):
-                    if i % 2 != 0:
-                        self.prices.insert(parent="", index="end", values=r,
-                                           tags=("odd",))
-                    else:
-                        self.prices.insert(parent="", index="end", values=r,
-                                           tags=("even",))
-
-                self.log.add_message(f"Successful Search: {name} class is on the prices table.")
-            else:
-                self.log.add_message(f"Failed Search: {name} class is not on the "
-                                     f"prices table.", False)
+            run_task(self.runner, get_searched_class, self.server, name,
+                     on_done=lambda res: self.show_searched_data(name, res),
+                     owner=self)
         else:
             messagebox.showwarning("Warning Message:", "Class name "
                                                        "cannot be empty.")
         # Clear search box
         self.search_name.delete_input()
 
+    def show_searched_data(self, name, res):
+        """
+        Display the result of a class search.
+
+        Args:
+            name (str): The searched class name.
+            res (list | None): Matching rows, or None if no class matched.
+        """
+        if res is not None:
+            self.configure(text="Search Results List")
+            self.table.show_rows(res)
+
+            self.log.add_message(f"Successful Search: {name} class is on the prices table.")
+        else:
+            self.log.add_message(f"Failed Search: {name} class is not on the "
+                                 f"prices table.", False)
+
     def clear_record_for_add(self):
         """Clear the add-class form inputs (name and price)."""
         self.name_entry.delete(0, tk.END)
@@ -243,7 +244,7 @@ class PricesFrame(ttk.LabelFrame):
         Validate inputs and add a new price class.
 
         Validates the add-form inputs and calls the BLL to insert a class.
-        On success, reloads the full list and logs the result. On error,
+        On success, refreshes the list and logs the result. On error,
         logs an appropriate message and clears the form.
 
         Validation:
@@ -299,7 +300,7 @@ class PricesFrame(ttk.LabelFrame):
         mes3 = mes_map.get(res)
 
         if res is True:
-            self.load_full_data()
+            self.refresh_data()
 
         self.log.add_message(mes3[0], mes3[1])
         self.clear_record_for_add()
@@ -400,7 +401,7 @@ class PricesFrame(ttk.LabelFrame):
             mes5 = mes_map.get(res)
 
             if res is True:
-                self.load_full_data()
+                self.refresh_data()
             self.log.add_message(mes5[0], mes5[1])
 
         else:
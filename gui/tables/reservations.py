@@ -1,10 +1,14 @@
 import tkinter as tk
 from datetime import datetime
 from tkinter import ttk, messagebox
-from ..widgets import Button
+from operator import itemgetter
+from ..widgets import Button, PagedTable
+from ..widgets.paged_table import keyset_source
 from ..logs import ActionLogFrame
-from ...bll import get_all_reservations, get_searched_reservation
-from ...bll import cancel_reservation, add_reservation
+from ..tasks import run_task
+from ...bll import get_reservations_page, get_searched_reservation
+from ...bll import cancel_reservation, add_reservation, get_service_policy
+from ..formatting import service_hours_text, closing_time_text, duration_text
 # For Reservations Table ----------------------------
 class ReservationsFrame(ttk.LabelFrame):
     """
@@ -18,11 +22,13 @@ class ReservationsFrame(ttk.LabelFrame):
     All successes and errors are written to the shared `ActionLogFrame`.
 
     Attributes:
+        TABLES (tuple[str]): Tables the rows come from. A write to any of
+            them makes the screen stale.
         server (dict): Database connection configuration from the dashboard.
         log (ActionLogFrame): Log panel to display success/error messages.
+        runner (TaskRunner | None): Runs the BLL loads in the background.
         reservations (ttk.Treeview): Grid of (Date and Time, Room, Diner, Total).
-        x_scroll (ttk.Scrollbar | None): Horizontal scrollbar for the tree view.
-        y_scroll (ttk.Scrollbar | None): Vertical scrollbar for the tree view.
+        table (PagedTable): Pages rows from the database into the tree view.
         button_frame (ttk.Frame): Container for list/delete controls.
         full_btn (Button): Reloads the full reservations list.
         delete_btn (Button): Deletes the selected reservation.
@@ -36,19 +42,25 @@ class ReservationsFrame(ttk.LabelFrame):
         add_guests_entry (ttk.Entry): Add form group size input.
         add_btn (ttk.Button): Submits the add-reservation action.
         notice1 (ttk.Label): Format hint for search datetime.
-        notice2 (ttk.Label): Business rules hint for add form.
+        notice2 (ttk.Label): Business rules hint for add form, built from
+            the service hours of the database.
         notice3 (ttk.Label): Duration/required-fields hint for add form.
 
     Args:
         parent (tk.Widget): Parent container.
         server (dict): Database connection details used by BLL calls.
         logs (ActionLogFrame): Shared action log instance.
+        runner (TaskRunner, optional): Dashboard task runner for loading
+            data off the Tk thread. Without it, data loads synchronously.
     """
-    def __init__(self, parent, server, logs:ActionLogFrame):
+    TABLES = ("reservations", "diners", "rooms", "prices", "service_hours")
+
+    def __init__(self, parent, server, logs:ActionLogFrame, runner=None):
         super().__init__(parent, text="Full Reservations List",
                          style="Custom.TLabelframe")
         self.server = server
         self.log = logs
+        self.runner = runner
 
         # Grid layout (4 rows and 4 columns)
         self.rowconfigure(0, weight=2, minsize=150)
@@ -63,9 +75,13 @@ class ReservationsFrame(ttk.LabelFrame):
 
         # Display reservations tree view ----------------------
         # First row
-        self.reservations = ttk.Treeview(self, padding=(0, 0, 10, 10))
-        self.reservations.grid(row=0, column=0, columnspan=4, padx=10, pady=10,
-                         sticky="nsew")
+        self.table = PagedTable(
+            self, keyset_source(get_reservations_page, self.server),
+            runner=self.runner,
+            key_row=itemgetter(0, 1))
+        self.table.grid(row=0, column=0, columnspan=4, padx=10, pady=10,
+                        sticky="nsew")
+        self.reservations = self.table.tree
         self.reservations["columns"] = ("Date and Time", "Room Name",
                                      "Diner Name", "Total Diners")
 
@@ -81,9 +97,6 @@ class ReservationsFrame(ttk.LabelFrame):
         self.reservations.heading("Diner Name", text="Diner Name", anchor="center")
         self.reservations.heading("Total Diners", text="Total Diners", anchor="center")
 
-        self.x_scroll = None
-        self.y_scroll = None
-        self.create_scroll_bars()
         self.load_full_data()
 
         # Display action buttons  ----------------------
@@ -187,58 +200,62 @@ class ReservationsFrame(ttk.LabelFrame):
                                      style="Special.TButton")
         self.add_btn.grid(row=1, column=4, sticky="ew", padx=15)
 
-        self.notice2 = ttk.Label(self.add_frame,
-        text="All reservation times must be made between "
-            "17:00 to 21:30 and at least two days prior. Store closes at 23:00. ",
-        font=("Helvetica", 8))
+        # The rules come from the service policy, see `show_policy`
+        self.notice2 = ttk.Label(self.add_frame, text="",
+                                 font=("Helvetica", 8))
 
         self.notice2.grid(row=2, column=0, columnspan=5, pady=2)
         self.notice3 = ttk.Label(self.add_frame,
-                                 text="Each Omakase experience lasts 1.5 hours. "
-                                      "All the input fields must be filled.",
+                                 text="All the input fields must be filled.",
                                  font=("Helvetica", 8))
         self.notice3.grid(row=3, column=0, columnspan=5, pady=2)
+        self.load_policy()
 
 
 
-    def create_scroll_bars(self):
-        """
-        Attach horizontal/vertical scrollbars to the reservations tree view.
+    def load_policy(self):
+        """Fetch the service hours and durations for the add form hints."""
+        run_task(self.runner, get_service_policy, self.server,
+                 on_done=self.show_policy, owner=self)
 
-        Configures the tree view to use the created scrollbars.
+    def show_policy(self, policy):
+        """
+        Show the booking rules of the service policy in the add form.
 
-        Side Effects:
-            Modifies `self.reservations` to connect x/y scroll commands.
-            Creates and assigns `self.x_scroll` and `self.y_scroll`.
+        Args:
+            policy (ServicePolicy): Service hours and durations.
         """
-        # Scroll bars configuration
-        self.x_scroll = ttk.Scrollbar(self.reservations, orient="horizontal",
-                                      command=self.reservations.xview)
-        self.y_scroll = ttk.Scrollbar(self.reservations, orient="vertical",
-                                      command=self.reservations.yview)
-        self.x_scroll.pack(side="bottom", fill="x")
-        self.y_scroll.pack(side="right", fill="y")
-        self.reservations.configure(xscrollcommand=self.x_scroll.set,
-                       yscrollcommand=self.y_scroll.set)
+        text = (f"All reservation times must be within the service hours "
+                f"({service_hours_text(policy)}) and at least two days "
+                f"prior.")
+        closing = closing_time_text(policy)
+        if closing is not None:
+            text += f" Store closes at {closing}."
+        self.notice2.configure(text=text)
+        self.notice3.configure(text=f"{duration_text(policy)} "
+                                    f"All the input fields must be filled.")
 
     def load_full_data(self):
         """
         Load and display the full reservations list.
 
-        Fetches all reservations via the BLL and populates the tree view.
-        Uses alternating row tags ("odd"/"even") for readability and sets the
-        label frame title to "Full Reservations List".
+        Shows the first page of rows in the paged tree view and sets
+        the label frame title to "Full Reservations List".
+        """
+        self.configure(text="Full Reservations List")
+        self.table.load()
+
+    def refresh_data(self):
+        """
+        Refresh the rows on screen after a write, keeping the current page.
+
+        Only the rows that changed are redrawn, so the selection and the
+        scroll position survive. Search results give way to the full list.
         """
-        self.reservations.delete(*self.reservations.get_children())
         self.configure(text="Full Reservations List")
-        records = get_all_reservations(self.server)
-        self.reservations.tag_configure("odd", background="white")
-        self.reservations.tag_configure("even", background="#E6E6E6")
-        for i, r in enumerate(records):
-            if i % 2 != 0:
-                self.reservations.insert(parent="", index="end", values=r, tags=("odd",))
-            else:
-                self.reservations.insert(parent="", index="end", values=r, tags=("even",))
+        self.table.refresh()
+        # Service hours or durations may have changed as well
+        self.load_policy()
 
     def clear_search_form(self):
         """Clear the search inputs (datetime and room)."""
@@ -286,48 +303,54 @@ class ReservationsFrame(ttk.LabelFrame):
                 self.clear_search_form()
                 return
 
-            res = get_searched_reservation(self.server, dtime, room)
+            run_task(self.runner, get_searched_reservation, self.server,
+                     dtime, room,
+                     on_done=lambda res: self.show_searched_data(
+                         dtime, room, res),
+                     owner=self)
+        else:
+            messagebox.showwarning("Warning Message:",
+                                   "Date and Time and Room cannot be empty.")
 
-            # Result messages mapper
-            mes_mapper = {
-                None:[f"Failed Search: reservation does not exist since {room} is"
-                      f" not on rooms table",False],
-                0: [f"Failed Search: {room} is not reserved at {dtime}.",False],
-                True: [f"Successful Search: the reservation of {room} at "
-                       f"{dtime} is found on the reservations table.", True]
-            }
+        self.clear_search_form()
 
-            # Room is not on the rooms table
-            if res is None:
-                mes = mes_mapper.get(None)
-                self.log.add_message(mes[0], mes[1])
-                self.clear_search_form()
-                return
+    def show_searched_data(self, dtime, room, res):
+        """
+        Display the result of a reservation search.
 
-             # Room is on rooms table but has no reservation made
-            if res == 0:
-                mes = mes_mapper.get(0)
-                self.log.add_message(mes[0], mes[1])
+        Args:
+            dtime (datetime): The searched begin date and time.
+            room (str): The searched room name.
+            res (list | int | None): Matching rows, 0 if the room has no
+                reservation at that time, or None if the room does not exist.
+        """
+        # Result messages mapper
+        mes_mapper = {
+            None:[f"Failed Search: reservation does not exist since {room} is"
+                  f" not on rooms table",False],
+            0: [f"Failed Search: {room} is not reserved at {dtime}.",False],
+            True: [f"Successful Search: the reservation of {room} at "
+                   f"{dtime} is found on the reservations table.", True]
+        }
+
+        # Room is not on the rooms table
+        if res is None:
+            mes = mes_mapper.get(None)
+            self.log.add_message(mes[0], mes[1])
+            return
+
+        # Room is on rooms table but has no reservation made
+        if res == 0:
+            mes = mes_mapper.get(0)
+            self.log.add_message(mes[0], mes[1])
 
-            else:
-                # Room is on rooms table and has reservation made
-                self.reservations.delete(*self.reservations.get_children())
-                self.configure(text="Search Results List")
-                for i, r in enumerate(res):
-                    if i % 2 != 0:
-                        self.reservations.insert(parent="", index="end", values=r,
-                                              tags=("odd",))
-                    else:
-                        self.reservations.insert(parent="", index="end", values=r,
-                                              tags=("even",))
-
-                mes = mes_mapper.get(True)
-                self.log.add_message(mes[0], mes[1])
         else:
-            messagebox.showwarning("Warning Message:",
-                                   "Date and Time and Room cannot be empty.")
+            # Room is on rooms table and has reservation made
+            self.configure(text="Search Results List")
+            self.table.show_rows(res)
 
-        self.clear_search_form()
+            mes = mes_mapper.get(True)
+            self.log.add_message(mes[0], mes[1])
 
     def delete_reservation(self):
         """
@@ -335,7 +358,7 @@ class ReservationsFrame(ttk.LabelFrame):
 
         Prompts for confirmation, then calls the BLL to delete by
         (datetime, room) from the selected row. Logs success or failure
-        and reloads the full list to reflect changes.
+        and refreshes the list to reflect changes.
 
         User Feedback:
             - Warns if no row is selected.
@@ -368,8 +391,8 @@ class ReservationsFrame(ttk.LabelFrame):
                 res = cancel_reservation(self.server, selected_dtime, selected_room)
                 mes = mes_mapper.get(res)
                 self.log.add_message(mes[0], mes[1])
-            # Load full list to reflect change and clear focus
-            self.load_full_data()
+            # Refresh the rows on screen to reflect the change
+            self.refresh_data()
         else:
             messagebox.showwarning("Warning Message",
                                    "Please select a record before clicking "
@@ -387,7 +410,7 @@ class ReservationsFrame(ttk.LabelFrame):
         Validate inputs and add a new reservation.
 
         Validates and converts inputs, then calls the BLL to insert a new
-        reservation. On success, reloads the full list and logs the result.
+        reservation. On success, refreshes the list and logs the result.
 
         Validation:
             - All fields are required (datetime, room, diner, total).
@@ -396,8 +419,8 @@ class ReservationsFrame(ttk.LabelFrame):
             - Total diners must parse to an integer.
             - Business rules are enforced in BLL:
                 * Reservations must be ≥ 2 days in advance.
-                * Allowed times: 17:00 - 21:30 (store closes at 23:00).
-                * Duration is 1.5 hours; overlaps are rejected.
+                * Allowed times follow the service hours of the weekday.
+                * Duration follows the room's class; overlaps are rejected.
 
         Side Effects:
             - On success, refreshes the tree view.
@@ -453,13 +476,14 @@ class ReservationsFrame(ttk.LabelFrame):
 
         # Add reservation by calling BLL method
         res = add_reservation(self.server, dtime, room_input, diner_input, guest_num)
+        hours = service_hours_text(get_service_policy(self.server))
 
         # Result messages mapper for adding reservation
         mes_mapper2 = {
             True: [f"Successful to add reservation: {diner_input} has booked  "
                   f"{room_input} room with the group of {guest_num} at {dtime}.", True],
             -1: ["Failed to add reservation: the reserved time must be at least two"
-                " days prior within available hours(17:00 - 21:30).", False],
+                f" days prior within available hours ({hours}).", False],
             -2: ["Failed to add reservation: the group of diners must be one"
                 " or more people. ", False],
             -3: [f"Failed to add reservation: the diner {diner_input} is "
@@ -480,7 +504,7 @@ class ReservationsFrame(ttk.LabelFrame):
 
         if res is True:
             # Successfully added
-            self.load_full_data()
+            self.refresh_data()
         mes4 = mes_mapper2.get(res)
         self.log.add_message(mes4[0], mes4[1])
         self.clear_add_record()
@@ -1,7 +1,10 @@
 from tkinter import ttk, PhotoImage, Label
 from pathlib import Path
+from operator import itemgetter
 from ..logs import ActionLogFrame
-from ...bll import get_all_revenues
+from ..widgets import PagedTable
+from ..widgets.paged_table import offset_source
+from ...bll import get_revenues_range
 # For Total Revenue By Class View --------------------
 class RevenuesFrame(ttk.LabelFrame):
     """
@@ -12,11 +15,13 @@ class RevenuesFrame(ttk.LabelFrame):
     fill remaining space in the panel.
 
     Attributes:
+        TABLES (tuple[str]): Tables the rows come from. A write to any of
+            them makes the screen stale.
         server (dict): Database connection configuration from the dashboard.
         log (ActionLogFrame): Log panel to display success/error messages.
+        runner (TaskRunner | None): Runs the BLL loads in the background.
         revenues (ttk.Treeview): Table widget with class/revenue info.
-        x_scroll (ttk.Scrollbar | None): Horizontal scrollbar for the tree view.
-        y_scroll (ttk.Scrollbar | None): Vertical scrollbar for the tree view.
+        table (PagedTable): Pages rows from the database into the tree view.
         bg (PhotoImage): Background image resource for decoration.
         bg_label (Label): Label widget holding the background image.
 
@@ -24,12 +29,17 @@ class RevenuesFrame(ttk.LabelFrame):
         parent (tk.Widget): Parent container.
         server (dict): Database connection details used by BLL calls.
         logs (ActionLogFrame): Shared action log instance.
+        runner (TaskRunner, optional): Dashboard task runner for loading
+            data off the Tk thread. Without it, data loads synchronously.
     """
-    def __init__(self, parent, server, logs:ActionLogFrame):
+    TABLES = ("reservations", "diners", "rooms", "prices")
+
+    def __init__(self, parent, server, logs:ActionLogFrame, runner=None):
         super().__init__(parent, text="Full Details List",
                          style="Custom.TLabelframe")
         self.server = server
         self.log = logs
+        self.runner = runner
 
         # Grid layout (4 rows and 4 columns)
         self.rowconfigure(0, weight=1, minsize=200)
@@ -43,9 +53,13 @@ class RevenuesFrame(ttk.LabelFrame):
 
         # Display all revenues tree view ----------------------
         # First row
-        self.revenues = ttk.Treeview(self, padding=(0, 0, 10, 10))
-        self.revenues.grid(row=0, column=0, columnspan= 4, padx=10, pady=10,
-                           sticky="nsew")
+        self.table = PagedTable(
+            self, offset_source(get_revenues_range, self.server),
+            runner=self.runner,
+            key_row=itemgetter(0))
+        self.table.grid(row=0, column=0, columnspan=4, padx=10, pady=10,
+                        sticky="nsew")
+        self.revenues = self.table.tree
         self.revenues["columns"] = ("Class Name", "Total Diners",
                                     "Total Revenue", "Rolling Total")
 
@@ -61,9 +75,6 @@ class RevenuesFrame(ttk.LabelFrame):
         self.revenues.heading("Total Revenue", text="Total Revenue", anchor="center")
         self.revenues.heading("Rolling Total", text="Rolling Total", anchor="center")
 
-        self.x_scroll = None
-        self.y_scroll = None
-        self.create_scroll_bars()
         self.load_full_data()
 
         # Second and Third row - display image
@@ -74,43 +85,22 @@ class RevenuesFrame(ttk.LabelFrame):
         self.bg_label.grid(row=1, column=1, rowspan=2, columnspan=2, padx=10, pady=10)
 
 
-    def create_scroll_bars(self):
+    def load_full_data(self):
         """
-        Attach horizontal/vertical scrollbars to the revenue tree view.
-
-        Configures the tree view to use the created scrollbars.
+        Load and display the full 'Total Revenue by Class' list.
 
-        Side Effects:
-            Modifies `self.revenues` to connect x/y scroll commands.
-            Creates and assigns `self.x_scroll` and `self.y_scroll`.
+        Shows the first page of rows in the paged tree view and sets
+        the label frame title to "Full Revenue List".
         """
-        # Scroll bars configuration
-        self.x_scroll = ttk.Scrollbar(self.revenues, orient="horizontal",
-                                      command=self.revenues.xview)
-        self.y_scroll = ttk.Scrollbar(self.revenues, orient="vertical",
-                                      command=self.revenues.yview)
-        self.x_scroll.pack(side="bottom", fill="x")
-        self.y_scroll.pack(side="right", fill="y")
-        self.revenues.configure(xscrollcommand=self.x_scroll.set,
-                               yscrollcommand=self.y_scroll.set)
+        self.configure(text="Full Revenue List")
+        self.table.load()
 
-    def load_full_data(self):
+    def refresh_data(self):
         """
-        Load and display the full 'Total Revenue by Class' list.
+        Refresh the rows on screen after a write, keeping the current page.
 
-        Fetches aggregated revenue data from the BLL and populates the tree view.
-        Uses alternating row tags ("odd"/"even") for readability and updates the
-        label frame title to "Full Revenue List".
+        Only the rows that changed are redrawn, so the selection and the
+        scroll position survive. Search results give way to the full list.
         """
-        self.revenues.delete(*self.revenues.get_children())
         self.configure(text="Full Revenue List")
-        incomes = get_all_revenues(self.server)
-        self.revenues.tag_configure("odd", background="white")
-        self.revenues.tag_configure("even", background="#E6E6E6")
-        for i, r in enumerate(incomes):
-            if i % 2 != 0:
-                self.revenues.insert(parent="", index="end", values=r,
-                                    tags=("odd",))
-            else:
-                self.revenues.insert(parent="", index="end", values=r,
-                                    tags=("even",))
\ No newline at end of file
+        self.table.refresh()
@@ -1,8 +1,11 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from ..widgets import Button, ButtonEntryFrame
+from operator import itemgetter
+from ..widgets import Button, ButtonEntryFrame, PagedTable
+from ..widgets.paged_table import keyset_source
 from ..logs import ActionLogFrame
-from ...bll import get_all_rooms, get_searched_room, add_room, update_room
+from ..tasks import run_task
+from ...bll import get_rooms_page, get_searched_room, add_room, update_room
 # For Rooms Table ----------------------------
 class RoomsFrame(ttk.LabelFrame):
     """
@@ -16,11 +19,13 @@ class RoomsFrame(ttk.LabelFrame):
     All successes and errors are written to the shared `ActionLogFrame`.
 
     Attributes:
+        TABLES (tuple[str]): Tables the rows come from. A write to any of
+            them makes the screen stale.
         server (dict): Database connection configuration passed from the dashboard.
         log (ActionLogFrame): Log panel to display success/error messages.
+        runner (TaskRunner | None): Runs the BLL loads in the background.
         rooms (ttk.Treeview): Tree view showing rows (Room, Staff, Class, HasTV).
-        x_scroll (ttk.Scrollbar | None): Horizontal scrollbar for the tree view.
-        y_scroll (ttk.Scrollbar | None): Vertical scrollbar for the tree view.
+        table (PagedTable): Pages rows from the database into the tree view.
         button_frame (ttk.Frame): Container for the list/search controls row.
         full_btn (Button): Button that reloads the full rooms list.
         search_name (ButtonEntryFrame): Search input + button for room name.
@@ -43,12 +48,17 @@ class RoomsFrame(ttk.LabelFrame):
         parent (tk.Widget): Parent container.
         server (dict): Database connection details used by BLL calls.
         logs (ActionLogFrame): Shared action log instance.
+        runner (TaskRunner, optional): Dashboard task runner for loading
+            data off the Tk thread. Without it, data loads synchronously.
     """
-    def __init__(self, parent, server, logs:ActionLogFrame):
+    TABLES = ("rooms", "prices")
+
+    def __init__(self, parent, server, logs:ActionLogFrame, runner=None):
         super().__init__(parent, text="Full Rooms List",
                          style="Custom.TLabelframe")
         self.server = server
         self.log = logs
+        self.runner = runner
 
         # Grid layout (4 rows and 4 columns)
         self.rowconfigure(0, weight=2, minsize=150)
@@ -62,9 +72,13 @@ class RoomsFrame(ttk.LabelFrame):
 
         # Display rooms tree view ----------------------
         # First row
-        self.rooms = ttk.Treeview(self, padding=(0, 0, 10, 10))
-        self.rooms.grid(row=0, column=0, columnspan=4, padx=10, pady=10,
-                         sticky="nsew")
+        self.table = PagedTable(
+            self, keyset_source(get_rooms_page, self.server),
+            runner=self.runner,
+            key_row=itemgetter(0))
+        self.table.grid(row=0, column=0, columnspan=4, padx=10, pady=10,
+                        sticky="nsew")
+        self.rooms = self.table.tree
         self.rooms["columns"] = ("Room", "Staff", "Class", "HasTV")
 
         self.rooms.column("#0", width=0, stretch=False)
@@ -79,9 +93,6 @@ class RoomsFrame(ttk.LabelFrame):
         self.rooms.heading("Class", text="Class", anchor="center")
         self.rooms.heading("HasTV", text="HasTV", anchor="center")
 
-        self.x_scroll = None
-        self.y_scroll = None
-        self.create_scroll_bars()
         self.load_full_data()
 
         # Display action buttons  ----------------------
@@ -196,40 +207,25 @@ class RoomsFrame(ttk.LabelFrame):
                                  font=("Helvetica", 8))
         self.notice2.grid(row=3, column=0, columnspan=5, pady=2)
 
-    def create_scroll_bars(self):
+    def load_full_data(self):
         """
-        Attach horizontal/vertical scrollbars to the rooms tree view.
+        Load and display the full rooms list.
 
-        Configures the tree view to use the created scrollbars.
+        Shows the first page of rows in the paged tree view and sets
+        the label frame title to "Full Rooms List".
         """
-        # Scroll bars configuration
-        self.x_scroll = ttk.Scrollbar(self.rooms, orient="horizontal",
-                                      command=self.rooms.xview)
-        self.y_scroll = ttk.Scrollbar(self.rooms, orient="vertical",
-                                      command=self.rooms.yview)
-        self.x_scroll.pack(side="bottom", fill="x")
-        self.y_scroll.pack(side="right", fill="y")
-        self.rooms.configure(xscrollcommand=self.x_scroll.set,
-                       yscrollcommand=self.y_scroll.set)
+        self.configure(text="Full Rooms List")
+        self.table.load()
 
-    def load_full_data(self):
+    def refresh_data(self):
         """
-        Load and display the full rooms list.
+        Refresh the rows on screen after a write, keeping the current page.
 
-        Fetches all rooms via the BLL and populates the tree view.
-        Uses alternating row tags ("odd"/"even") for readability and
-        sets the label frame title to "Full Rooms List".
+        Only the rows that changed are redrawn, so the selection and the
+        scroll position survive. Search results give way to the full list.
         """
-        self.rooms.delete(*self.rooms.get_children())
         self.configure(text="Full Rooms List")
-        rooms = get_all_rooms(self.server)
-        self.rooms.tag_configure("odd", background="white")
-        self.rooms.tag_configure("even", background="#E6E6E6")
-        for i, r in enumerate(rooms):
-            if i % 2 != 0:
-                self.rooms.insert(parent="", index="end", values=r, tags=("odd",))
-            else:
-                self.rooms.insert(parent="", index="end", values=r, tags=("even",))
+        self.table.refresh()
 
     def load_searched_data(self):
         """
@@ -248,29 +244,32 @@ class RoomsFrame(ttk.LabelFrame):
         """
         name = self.search_name.get_input().strip().title()
         if name != "":
-            res = get_searched_room(self.server, name)
-
-            if res is not None:
-                self.rooms.delete(*self.rooms.get_children())
-                self.configure(text="Search Results List")
-                for i, r in enumerate(res):
-                    if i % 2 != 0:
-                        self.rooms.insert(parent="", index="end", values=r,
-                                           tags=("odd",))
-                    else:
-                        self.rooms.insert(parent="", index="end", values=r,
-                                           tags=("even",))
-
-                self.log.add_message(f"Successful Search: {name} room is on the rooms table.")
-            else:
-                self.log.add_message(f"Failed Search: {name} room is not on the "
-                                     f"rooms table.", False)
+            run_task(self.runner, get_searched_room, self.server, name,
+                     on_done=lambda res: self.show_searched_data(name, res),
+                     owner=self)
         else:
             messagebox.showwarning("Warning Message:", "Room name "
                                                        "cannot be empty.")
         # Clear search box
         self.search_name.delete_input()
 
+    def show_searched_data(self, name, res):
+        """
+        Display the result of a room search.
+
+        Args:
+            name (str): The searched room name.
+            res (list | None): Matching rows, or None if no room matched.
+        """
+        if res is not None:
+            self.configure(text="Search Results List")
+            self.table.show_rows(res)
+
+            self.log.add_message(f"Successful Search: {name} room is on the rooms table.")
+        else:
+            self.log.add_message(f"Failed Search: {name} room is not on the "
+                                 f"rooms table.", False)
+
     def clear_record_for_add(self):
         """
         Clear the add-room form inputs.
@@ -297,7 +296,7 @@ class RoomsFrame(ttk.LabelFrame):
         Validate inputs and add a new room.
 
         Validates the add-form inputs and calls the BLL to insert a room.
-        On success, reloads the full list and logs the result. On error,
+        On success, refreshes the list and logs the result. On error,
         logs an appropriate message and clears the form.
 
         Validation:
@@ -346,7 +345,7 @@ class RoomsFrame(ttk.LabelFrame):
         res = add_room(self.server, name, tv, class_name)
         mes2 = mes_mapper.get(res)
         if res is True:
-            self.load_full_data()
+            self.refresh_data()
 
         self.log.add_message(mes2[0], mes2[1])
         self.clear_record_for_add()
@@ -441,7 +440,7 @@ class RoomsFrame(ttk.LabelFrame):
             mes3 = mes_map.get(res)
             if res is True:
                 # Successfully update
-                self.load_full_data()
+                self.refresh_data()
             self.log.add_message(mes3[0], mes3[1])
 
         else:
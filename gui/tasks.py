@@ -0,0 +1,197 @@
+"""
+Table frames load their data through a `TaskRunner` owned by the dashboard.
+The BLL call runs on the shared DAL thread pool (through the `AsyncBridge`)
+and its result is handed back to the Tk thread, so slow queries no longer
+freeze the window. Switching screens cancels every task of the old screen:
+tasks that did not start yet are dropped and results that still arrive are
+ignored.
+
+With an `on_timing` hook, every task is also timed: the BLL call counts
+its statements and connections (`bll.run_tracked`), and the callback is
+timed together with the redraw Tk does right after it. The dashboard's
+performance panel shows these timings.
+"""
+
+import time
+from collections import namedtuple
+from ..bll import run_tracked
+
+# Timing of one background task; times in milliseconds
+#   name: BLL function (or page source) that ran
+#   finished: `time.time()` when the screen was drawn
+#   total_ms: from submitting the task to the drawn screen
+#   call_ms: the BLL call on the worker thread
+#   db_ms: statements sent to MySQL, including fetching their rows
+#   queries: number of those statements
+#   checkouts: connections taken from the pool
+#   connections: new connections opened among them
+#   connect_ms: time spent getting connections
+#   render_ms: callback on the Tk thread plus the redraw after it
+#   rows: rows put in tree views by the callback, or None
+TaskTiming = namedtuple("TaskTiming", [
+    "name", "finished", "total_ms", "call_ms", "db_ms", "queries",
+    "checkouts", "connections", "connect_ms", "render_ms", "rows"])
+
+
+class TaskRunner:
+    """
+    Dispatch BLL calls off the Tk thread and track which are in flight.
+
+    Every task belongs to the current generation. `cancel_all` starts a
+    new generation, so results of older tasks are discarded when they
+    arrive instead of being drawn on a screen that is no longer shown.
+
+    Attributes:
+        bridge (AsyncBridge): Runs the calls and delivers their results.
+        on_busy (Callable[[bool], None] | None): Called with True when the
+            first task starts and with False when the last one ends.
+        on_timing (Callable[[TaskTiming], None] | None): Receives the
+            timing of every task that delivered a result, on the Tk thread.
+
+    Args:
+        bridge (AsyncBridge): The application's bridge.
+        on_busy (Callable[[bool], None], optional): Busy indicator hook.
+        on_timing (Callable[[TaskTiming], None], optional): Timing hook.
+    """
+    def __init__(self, bridge, on_busy=None, on_timing=None):
+        self.bridge = bridge
+        self.on_busy = on_busy
+        self.on_timing = on_timing
+        self._generation = 0
+        self._next_id = 0
+        # task id -> future of the running call
+        self._active = {}
+        # Rows drawn by the callback being delivered
+        self._rows = None
+
+    @property
+    def busy(self):
+        """bool: Whether any task of the current generation is running."""
+        return bool(self._active)
+
+    def run(self, func, *args, on_done=None, on_error=None, owner=None,
+            name=None):
+        """
+        Run `func(*args)` in the background and call back on the Tk thread.
+
+        Args:
+            func (Callable): The BLL function to run.
+            *args: Arguments for `func`.
+            on_done (Callable[[Any], None], optional): Receives the result.
+            on_error (Callable[[BaseException], None], optional): Receives
+                the exception. Without it, Tk reports the error.
+            owner (tk.Misc, optional): Widget the callbacks belong to; they
+                are skipped if it was destroyed meanwhile.
+            name (str, optional): Name in the timings. Defaults to the
+                name of `func`.
+
+        Returns:
+            int: The task id.
+        """
+        self._next_id += 1
+        task_id = self._next_id
+        generation = self._generation
+        timed = self.on_timing is not None
+        submitted = time.perf_counter()
+
+        def finish(callback, value):
+            if generation != self._generation:
+                return  # cancelled by a screen switch
+            self._end(task_id)
+            if owner is not None and not owner.winfo_exists():
+                return
+            stats = None
+            if timed and not isinstance(value, BaseException):
+                value, stats = value
+            self._rows = None
+            begin = time.perf_counter()
+            if callback is not None:
+                callback(value)
+            elif isinstance(value, BaseException):
+                self.bridge.root.report_callback_exception(
+                    type(value), value, value.__traceback__)
+            if stats is not None:
+                self._report(name or func.__name__, stats, submitted, begin,
+                             self._rows)
+
+        # Timed calls return `(result, stats)`, unpacked in `finish`
+        call = (run_tracked, func) if timed else (func,)
+        future = self.bridge.call(
+            *call, *args,
+            on_done=lambda res: finish(on_done, res),
+            on_error=lambda err: finish(on_error, err))
+        self._start(task_id, future)
+        return task_id
+
+    def note_rows(self, count):
+        """
+        Count rows drawn by the callback being delivered.
+
+        Called by the tree views, so the timing of the task can tell how
+        much drawing its result caused.
+
+        Args:
+            count (int): Rows put in a tree view.
+        """
+        self._rows = (self._rows or 0) + count
+
+    def cancel_all(self):
+        """Cancel every task of the current screen and clear the busy state."""
+        self._generation += 1
+        futures = list(self._active.values())
+        self._active.clear()
+        for future in futures:
+            future.cancel()
+        if futures and self.on_busy is not None:
+            self.on_busy(False)
+
+    def _start(self, task_id, future):
+        """Record a running task and raise the busy flag on the first one."""
+        self._active[task_id] = future
+        if len(self._active) == 1 and self.on_busy is not None:
+            self.on_busy(True)
+
+    def _report(self, name, stats, submitted, begin, rows):
+        """
+        Send the timing of a delivered task once Tk has redrawn.
+
+        Tk draws changed widgets when it is idle, so the timing waits for
+        the next idle callback to include that drawing.
+        """
+        def settled():
+            end = time.perf_counter()
+            if self.on_timing is None:
+                return
+            self.on_timing(TaskTiming(
+                name, time.time(), round((end - submitted) * 1000, 3),
+                stats.elapsed_ms, round(stats.db_ms, 3), stats.queries,
+                stats.checkouts, stats.connections,
+                round(stats.connect_ms, 3), round((end - begin) * 1000, 3),
+                rows))
+        self.bridge.root.after_idle(settled)
+
+    def _end(self, task_id):
+        """Forget a finished task and lower the busy flag after the last one."""
+        if self._active.pop(task_id, None) is not None:
+            if not self._active and self.on_busy is not None:
+                self.on_busy(False)
+
+
+def run_task(runner, func, *args, on_done, owner=None):
+    """
+    Run a BLL call through a runner, or synchronously without one.
+
+    Lets the table frames work both inside the dashboard (with a runner)
+    and on their own (for example in a quick manual test).
+
+    Args:
+        runner (TaskRunner | None): The dashboard's runner.
+        func (Callable): The BLL function to run.
+        *args: Arguments for `func`.
+        on_done (Callable[[Any], None]): Receives the result.
+        owner (tk.Misc, optional): Widget the callback belongs to.
+    """
+    if runner is None:
+        on_done(func(*args))
+    else:
+        runner.run(func, *args, on_done=on_done, owner=owner)
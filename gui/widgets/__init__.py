@@ -1,5 +1,6 @@
 from .login_entry import LoginEntry
 from .button import Button
 from .button_entry import ButtonEntryFrame
+from .paged_table import PagedTable
 
-__all__ = ["LoginEntry", "Button", "ButtonEntryFrame"]
+__all__ = ["LoginEntry", "Button", "ButtonEntryFrame", "PagedTable"]
@@ -0,0 +1,286 @@
+from tkinter import ttk
+from ..tasks import run_task
+# Paged Treeview ====================================
+class PagedTable(ttk.Frame):
+    """
+    A `ttk.Treeview` that shows one page of rows at a time.
+
+    Rows are fetched page by page from the database, so the number of
+    tree items (and the time to draw them) stays bounded by `page_size`
+    however large the table grows. Prev/Next buttons move between pages.
+
+    Pages come from a `fetch(token, limit)` callable that returns
+    `(rows, next_token)`: `token` is None for the first page and
+    `next_token` is None on the last one. The token is opaque to the
+    widget, so OFFSET (`offset_source`) and keyset (`keyset_source`)
+    sources both work.
+
+    With a `key_row` function, a page that is shown again (e.g. after a
+    write) is diffed against the rows on screen by key: only inserted,
+    changed and removed rows touch the tree view, and the selection and
+    scroll position are kept.
+
+    The owning frame configures the columns and headings of `tree`
+    like for a plain Treeview.
+
+    Attributes:
+        tree (ttk.Treeview): The tree view holding the current page.
+        x_scroll (ttk.Scrollbar): Horizontal scrollbar for the tree view.
+        y_scroll (ttk.Scrollbar): Vertical scrollbar for the tree view.
+        nav (ttk.Frame): Container for the page navigation.
+        prev_btn (ttk.Button): Shows the previous page.
+        page_label (ttk.Label): Current page number.
+        next_btn (ttk.Button): Shows the next page.
+        fetch (Callable | None): Page source, see above.
+        page_size (int): Rows per page.
+        format_row (Callable): Turns a row into tree view values.
+        key_row (Callable | None): Returns the unique key of a row.
+        runner (TaskRunner | None): Runs fetches off the Tk thread.
+
+    Args:
+        parent (tk.Widget): Parent container.
+        fetch (Callable, optional): Page source. Can be set later.
+        page_size (int): Rows per page. Defaults to 200.
+        format_row (Callable, optional): Row formatter. Defaults to
+            showing the row as is.
+        key_row (Callable, optional): Row key, e.g. `itemgetter(0)` for
+            the id column. Without it, every page is redrawn in full.
+        runner (TaskRunner, optional): Dashboard task runner.
+        padding (tuple): Padding of the tree view.
+    """
+    def __init__(self, parent, fetch=None, page_size=200, format_row=None,
+                 key_row=None, runner=None, padding=(0, 0, 10, 10)):
+        super().__init__(parent)
+        self.fetch = fetch
+        self.page_size = page_size
+        self.format_row = format_row or (lambda row: row)
+        self.key_row = key_row
+        self.runner = runner
+        # Start token of every page up to the current one
+        self._starts = []
+        self._next = None
+        # Increases with every request so late pages are ignored
+        self._request = 0
+        # What is on screen: the page token, keys in display order,
+        # key -> item id and item id -> (values, tag)
+        self._shown = None
+        self._order = []
+        self._items = {}
+        self._drawn = {}
+
+        # Grid layout (2 rows and 1 column)
+        self.rowconfigure(0, weight=1)
+        self.rowconfigure(1, weight=0)
+        self.columnconfigure(0, weight=1)
+
+        self.tree = ttk.Treeview(self, padding=padding)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.tree.tag_configure("odd", background="white")
+        self.tree.tag_configure("even", background="#E6E6E6")
+
+        # Scroll bars configuration
+        self.x_scroll = ttk.Scrollbar(self.tree, orient="horizontal",
+                                      command=self.tree.xview)
+        self.y_scroll = ttk.Scrollbar(self.tree, orient="vertical",
+                                      command=self.tree.yview)
+        self.x_scroll.pack(side="bottom", fill="x")
+        self.y_scroll.pack(side="right", fill="y")
+        self.tree.configure(xscrollcommand=self.x_scroll.set,
+                            yscrollcommand=self.y_scroll.set)
+
+        # Page navigation
+        self.nav = ttk.Frame(self)
+        self.nav.grid(row=1, column=0, pady=(4, 0))
+        self.prev_btn = ttk.Button(self.nav, text="< Prev",
+                                   command=self.prev_page)
+        self.prev_btn.grid(row=0, column=0, padx=5)
+        self.page_label = ttk.Label(self.nav, text="", font=("Helvetica", 9))
+        self.page_label.grid(row=0, column=1, padx=5)
+        self.next_btn = ttk.Button(self.nav, text="Next >",
+                                   command=self.next_page)
+        self.next_btn.grid(row=0, column=2, padx=5)
+        self._update_nav()
+
+    def load(self):
+        """Fetch and show the first page."""
+        self._starts = [None]
+        self._fetch_page()
+
+    def refresh(self):
+        """Fetch the current page again, e.g. after a write."""
+        if not self._starts:
+            self.load()
+        else:
+            self._fetch_page()
+
+    def next_page(self):
+        """Fetch and show the next page, if there is one."""
+        if self._next is None:
+            return
+        self._starts.append(self._next)
+        self._fetch_page()
+
+    def prev_page(self):
+        """Fetch and show the previous page, if there is one."""
+        if len(self._starts) <= 1:
+            return
+        self._starts.pop()
+        self._fetch_page()
+
+    def show_rows(self, rows):
+        """
+        Show a fixed list of rows (e.g. search results) without paging.
+
+        Args:
+            rows (list): Rows to display.
+        """
+        self._request += 1
+        self._starts = []
+        self._next = None
+        # Search results never count as the page already on screen
+        self._shown = object()
+        self._render(rows, keep_view=False)
+        self._update_nav()
+
+    def _fetch_page(self):
+        """Request the page starting at the last start token."""
+        self._request += 1
+        request = self._request
+        token = self._starts[-1]
+        run_task(self.runner, self.fetch, token, self.page_size,
+                 on_done=lambda res: self._show_page(request, token, res),
+                 owner=self)
+
+    def _show_page(self, request, token, result):
+        """Display a fetched page unless a newer request replaced it."""
+        if request != self._request:
+            return
+        rows, self._next = result
+        same_page = token == self._shown
+        self._shown = token
+        self._render(rows, keep_view=same_page)
+        self._update_nav()
+
+    def _render(self, rows, keep_view):
+        """
+        Show the given rows in the tree view.
+
+        Args:
+            rows (list): Rows to display, in order.
+            keep_view (bool): Whether the rows replace the same page, so
+                the scroll position should stay where it is.
+        """
+        new = [(self.key_row(r) if self.key_row else None,
+                tuple(self.format_row(r))) for r in rows]
+        keys = [key for key, _ in new]
+        if self.key_row is None or len(set(keys)) != len(keys):
+            self._redraw(new)
+        else:
+            self._apply_diff(new)
+        if not keep_view:
+            self.tree.yview_moveto(0)
+        if self.runner is not None:
+            self.runner.note_rows(len(rows))
+
+    def _redraw(self, new):
+        """Replace every tree view item."""
+        self.tree.delete(*self.tree.get_children())
+        # The items are not keyed, so the next diff starts from scratch
+        self._order, self._items, self._drawn = None, {}, {}
+        for i, (key, values) in enumerate(new):
+            tag = "odd" if i % 2 != 0 else "even"
+            self.tree.insert(parent="", index="end", values=values,
+                             tags=(tag,))
+
+    def _apply_diff(self, new):
+        """
+        Bring the tree view in line with the new rows item by item.
+
+        Rows are matched by key. Removed rows are deleted, new rows are
+        inserted at their position and only rows whose values or stripe
+        changed are updated, so unchanged items (and the selection on
+        them) stay untouched.
+        """
+        if self._order is None:
+            self.tree.delete(*self.tree.get_children())
+            self._order = []
+        keys = [key for key, _ in new]
+        wanted = set(keys)
+        removed = [k for k in self._order if k not in wanted]
+        if removed:
+            self.tree.delete(*[self._items[k] for k in removed])
+            for k in removed:
+                self._drawn.pop(self._items.pop(k))
+        # Rows ordered by key keep their relative order; anything else
+        # needs its items moved into place
+        kept = [k for k in keys if k in self._items]
+        reorder = kept != [k for k in self._order if k in wanted]
+
+        for i, (key, values) in enumerate(new):
+            tag = "odd" if i % 2 != 0 else "even"
+            iid = self._items.get(key)
+            if iid is None:
+                iid = self.tree.insert(parent="", index=i, values=values,
+                                       tags=(tag,))
+                self._items[key] = iid
+            else:
+                if reorder:
+                    self.tree.move(iid, "", i)
+                if self._drawn[iid] != (values, tag):
+                    self.tree.item(iid, values=values, tags=(tag,))
+            self._drawn[iid] = (values, tag)
+        self._order = keys
+
+    def _update_nav(self):
+        """Enable the navigation buttons that lead somewhere."""
+        paged = bool(self._starts)
+        self.page_label.configure(
+            text=f"Page {len(self._starts)}" if paged else "")
+        self.prev_btn.state(["!disabled"] if len(self._starts) > 1
+                            else ["disabled"])
+        self.next_btn.state(["!disabled"] if self._next is not None
+                            else ["disabled"])
+
+
+def offset_source(get_range, server):
+    """
+    Build a page source for `PagedTable` from a LIMIT/OFFSET getter.
+
+    One extra row is requested to find out whether a next page exists.
+
+    Args:
+        get_range (Callable): BLL getter taking `(server, offset, limit)`.
+        server (dict): Database connection details.
+
+    Returns:
+        Callable: `fetch(token, limit)` returning `(rows, next_token)`.
+    """
+    def fetch(offset, limit):
+        offset = offset or 0
+        rows = get_range(server, offset, limit + 1)
+        next_offset = offset + limit if len(rows) > limit else None
+        return rows[:limit], next_offset
+    # Timings show the BLL getter instead of the closure
+    fetch.__name__ = get_range.__name__
+    return fetch
+
+
+def keyset_source(get_page, server):
+    """
+    Build a page source for `PagedTable` from a keyset getter.
+
+    The `after_key` returned with each page is used as the token of the
+    next one, so deep pages cost the same as the first.
+
+    Args:
+        get_page (Callable): BLL getter taking `(server, after_key, limit)`
+            and returning `(rows, next_key)`.
+        server (dict): Database connection details.
+
+    Returns:
+        Callable: `fetch(token, limit)` returning `(rows, next_token)`.
+    """
+    def fetch(after_key, limit):
+        return get_page(server, after_key, limit)
+    fetch.__name__ = get_page.__name__
+    return fetch
@@ -0,0 +1,81 @@
+import unittest
+from omakase.dal.instrumentation import (
+    RingBufferSink, TimedCursor, add_sink, remove_sink, track_request)
+
+
+# Stand-in for the C-extension cursor ====================================
+class ProcCursor:
+    """
+    A cursor whose `stored_results()` can be read only once, like the
+    C-extension cursor of mysql-connector.
+
+    Args:
+        results (list[list[tuple]]): Rows of each result set.
+    """
+    def __init__(self, results):
+        self._results = results
+        self._stored_results = []
+        self.rowcount = -1
+
+    def callproc(self, procname, args=()):
+        self._stored_results = [ResultSet(rows) for rows in self._results]
+        return args
+
+    def stored_results(self):
+        results, self._stored_results = self._stored_results, []
+        return iter(results)
+
+    def close(self):
+        return True
+
+
+class ResultSet:
+    """One result set of `ProcCursor`."""
+    def __init__(self, rows):
+        self._rows = list(rows)
+        self.rowcount = len(self._rows)
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+
+class TimedCursorProcTest(unittest.TestCase):
+    """Procedure results must reach the DAL while instrumentation is on."""
+
+    def test_rows_come_back_under_track_request(self):
+        diners = [(1, "Ann", "555"), (2, "Bo", "556")]
+        cursor = TimedCursor(ProcCursor([diners]), 0.0)
+        with track_request("get_all_diners") as stats:
+            cursor.callproc("get_all_diners")
+            rows = [row for res in cursor.stored_results()
+                    for row in res.fetchall()]
+            cursor.close()
+        self.assertEqual(rows, diners)
+        self.assertEqual(stats.queries, 1)
+        self.assertEqual(stats.rows, 2)
+
+    def test_procedure_status_is_read_with_a_sink(self):
+        sink = RingBufferSink()
+        add_sink(sink)
+        try:
+            cursor = TimedCursor(ProcCursor([[(1,)]]), 0.0)
+            cursor.callproc("book_reservation", ["2025-01-01 18:00", "A",
+                                                 "Ann", 2])
+            code = False
+            for res in cursor.stored_results():
+                code = res.fetchone()[0]
+            cursor.close()
+        finally:
+            remove_sink(sink)
+        self.assertEqual(code, 1)
+        event = sink.events()[-1]
+        self.assertEqual((event.kind, event.statement, event.rows),
+                         ("proc", "book_reservation", 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,16 @@
+from .bulk import bulk_load, clear_load_data, read_classes
+from .replay import Operation, build_stream, read_loaded, replay_stream
+from .workload import PriceClass, Workload, generate_workload
+
+__all__ = [
+    "PriceClass",
+    "Workload",
+    "generate_workload",
+    "read_classes",
+    "bulk_load",
+    "clear_load_data",
+    "Operation",
+    "read_loaded",
+    "build_stream",
+    "replay_stream"
+]
@@ -0,0 +1,89 @@
+"""
+Command line entry point of the workload generator.
+
+Run it from the parent of this repo; connection values come from `.env`
+like the GUI's defaults:
+
+    python -m omakase.tools.loadgen load --reservations 100000
+    python -m omakase.tools.loadgen replay --operations 5000 --workers 16
+    python -m omakase.tools.loadgen clear
+"""
+
+import argparse
+import json
+import sys
+from ...dal import configure_pool, get_service_policy
+from ...gui.config import server_defaults
+from .bulk import bulk_load, clear_load_data, read_classes
+from .replay import build_stream, read_loaded, replay_stream
+from .workload import generate_workload
+
+
+def _load(args, server):
+    """Generate a workload and bulk-load it."""
+    workload = generate_workload(get_service_policy(server),
+                                 read_classes(server), args.reservations,
+                                 args.diners, args.rooms, args.seed)
+    return bulk_load(server, workload)
+
+
+def _replay(args, server):
+    """Replay a booking and cancel stream against the loaded rows."""
+    diners, rooms, booked = read_loaded(server)
+    stream = build_stream(get_service_policy(server), diners, rooms, booked,
+                          args.operations, args.rate, args.cancel_share,
+                          args.days, args.seed)
+    # Keep one idle connection per worker between operations
+    configure_pool(size=max(5, args.workers))
+    return replay_stream(server, stream, args.workers, args.paced)
+
+
+def _clear(args, server):
+    """Remove every generated row."""
+    clear_load_data(server)
+    return {"cleared": True}
+
+
+def main(argv=None):
+    """Parse the command line, run a subcommand and print its report."""
+    parser = argparse.ArgumentParser(prog="python -m omakase.tools.loadgen")
+    parser.add_argument("--seed", type=int, default=2025,
+                        help="random seed (default 2025)")
+    parser.add_argument("--output", help="also write the report to this file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    load = commands.add_parser("load", help="generate and bulk-load rows")
+    load.add_argument("--reservations", type=int, default=10_000)
+    load.add_argument("--diners", type=int,
+                      help="default: one per 8 reservations")
+    load.add_argument("--rooms", type=int,
+                      help="default: one per 2,000 reservations")
+    load.set_defaults(handler=_load)
+
+    stream = commands.add_parser("replay", help="replay concurrent traffic")
+    stream.add_argument("--operations", type=int, default=1_000)
+    stream.add_argument("--workers", type=int, default=8)
+    stream.add_argument("--rate", type=float, default=50.0,
+                        help="average arrivals per second (default 50)")
+    stream.add_argument("--paced", action="store_true",
+                        help="submit at arrival times instead of at once")
+    stream.add_argument("--cancel-share", type=float, default=0.2)
+    stream.add_argument("--days", type=int, default=30,
+                        help="open days to book in (default 30)")
+    stream.set_defaults(handler=_replay)
+
+    clear = commands.add_parser("clear", help="remove the generated rows")
+    clear.set_defaults(handler=_clear)
+
+    args = parser.parse_args(argv)
+    report = args.handler(args, server_defaults())
+    text = json.dumps(report, indent=2, default=str)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Bulk loading of generated workloads.
+
+Rows are written with `executemany`, which mysql-connector sends as one
+multi-row INSERT per batch, and committed every `BATCH_SIZE` rows. This
+keeps the load fast without `LOAD DATA LOCAL INFILE`, which both the
+server and the client would have to allow. The triggers (end times,
+overlap guard, revenue totals, version counters) still run for every row.
+"""
+
+import datetime
+import time
+from ...dal import DBconnection, clear_caches, clear_indexes
+from .workload import PREFIX, PriceClass
+
+# Rows per multi-row INSERT and per commit
+BATCH_SIZE = 1000
+
+
+def read_classes(server):
+    """
+    Read the price classes of a database, cheapest first.
+
+    Args:
+        server (dict): Connection kwargs for `mysql.connector.connect`.
+
+    Returns:
+        list[PriceClass]: The classes with their experience durations.
+    """
+    db = DBconnection(server)
+    cur = db.execute_query("SELECT id, class, durationMinutes FROM prices "
+                           "ORDER BY costPerPerson, id")
+    classes = [PriceClass(class_id, name, datetime.timedelta(minutes=minutes))
+               for (class_id, name, minutes) in cur.fetchall()]
+    cur.close()
+    db.disconnect()
+    return classes
+
+
+def clear_load_data(server):
+    """
+    Delete every generated room and diner.
+
+    Their reservations and allergies go with them through the cascading
+    foreign keys.
+
+    Args:
+        server (dict): Connection kwargs for `mysql.connector.connect`.
+    """
+    db = DBconnection(server)
+    for query in ("DELETE FROM rooms WHERE room LIKE %s",
+                  "DELETE FROM diners WHERE diner LIKE %s"):
+        cur = db.execute_query(query, [PREFIX + "%"])
+        cur.close()
+    db.commit()
+    db.disconnect()
+    clear_caches()
+    clear_indexes()
+
+
+def _insert_many(db, query, rows):
+    """Insert `rows` with `executemany`, committing every `BATCH_SIZE` rows."""
+    cur = db.cursor()
+    for i in range(0, len(rows), BATCH_SIZE):
+        cur.executemany(query, rows[i:i + BATCH_SIZE])
+        db.commit()
+    cur.close()
+
+
+def bulk_load(server, workload):
+    """
+    Replace the generated rows of a database with a workload.
+
+    Args:
+        server (dict): Connection kwargs for `mysql.connector.connect`.
+        workload (Workload): Rows from `generate_workload`.
+
+    Returns:
+        dict: Rows loaded per table and the elapsed `seconds`.
+    """
+    started = time.perf_counter()
+    clear_load_data(server)
+    db = DBconnection(server)
+    _insert_many(db, "INSERT INTO rooms (room, TVProvided, staff, classId) "
+                     "VALUES (%s, %s, %s, %s)", workload.rooms)
+    _insert_many(db, "INSERT INTO diners (diner, phone) VALUES (%s, %s)",
+                 workload.diners)
+    cur = db.execute_query("SELECT diner, id FROM diners WHERE diner LIKE %s",
+                           [PREFIX + "%"])
+    diner_ids = dict(cur.fetchall())
+    cur.close()
+    _insert_many(db, "INSERT INTO allergies (dinerId, `type`, `level`) "
+                     "VALUES (%s, %s, %s)",
+                 [(diner_ids[diner], kind, level)
+                  for (diner, kind, level) in workload.allergies])
+    _insert_many(db, "INSERT INTO reservations "
+                     "(dateAndTime, room, dinerId, totalDiners) "
+                     "VALUES (%s, %s, %s, %s)",
+                 [(dtime, room, diner_ids[diner], group)
+                  for (dtime, room, diner, group) in workload.reservations])
+    db.disconnect()
+    clear_caches()
+    clear_indexes()
+    return {
+        "rooms": len(workload.rooms),
+        "diners": len(workload.diners),
+        "allergies": len(workload.allergies),
+        "reservations": len(workload.reservations),
+        "seconds": round(time.perf_counter() - started, 2),
+    }
@@ -0,0 +1,178 @@
+"""
+Concurrent replay of booking and cancel traffic against the BLL.
+
+A stream is a list of operations drawn from the workload shape: bookings
+by the generated diners in the generated rooms, mixed with cancellations
+of generated reservations that are still upcoming. Arrivals come in
+bursts, like the evening rush. `replay_stream` submits the stream to N worker
+threads, either as fast as possible or at the recorded arrival times,
+and reports the outcome codes and latencies per operation kind.
+"""
+
+import datetime
+import threading
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from ... import bll
+from ...benchmarks.suite import percentile
+from ...dal import DBconnection
+from .workload import PREFIX, Generator, open_days
+
+# One request: kind is "book" or "cancel"; `at` is the arrival time in
+# seconds from the start of the stream
+Operation = namedtuple("Operation",
+                       ["at", "kind", "dtime", "room", "diner", "group"])
+
+# Share of the time spent in bursts, and how much busier bursts are
+BURST_SHARE = 0.2
+BURST_FACTOR = 4
+
+
+def read_loaded(server):
+    """
+    Read the generated diners, rooms and upcoming reservations.
+
+    Args:
+        server (dict): Connection kwargs for `mysql.connector.connect`.
+
+    Returns:
+        tuple[list[str], list[str], list[tuple[datetime.datetime, str]]]:
+        Diner names in load order (most frequent first), room names, and
+        `(dtime, room)` of the reservations that can still be cancelled.
+    """
+    db = DBconnection(server)
+    cur = db.execute_query("SELECT diner FROM diners WHERE diner LIKE %s "
+                           "ORDER BY id", [PREFIX + "%"])
+    diners = [name for (name,) in cur.fetchall()]
+    cur.close()
+    cur = db.execute_query("SELECT room FROM rooms WHERE room LIKE %s "
+                           "ORDER BY room", [PREFIX + "%"])
+    rooms = [name for (name,) in cur.fetchall()]
+    cur.close()
+    cur = db.execute_query("SELECT dateAndTime, room FROM reservations "
+                           "WHERE room LIKE %s AND dateAndTime > %s "
+                           "ORDER BY dateAndTime, room",
+                           [PREFIX + "%", datetime.datetime.now()])
+    booked = cur.fetchall()
+    cur.close()
+    db.disconnect()
+    return diners, rooms, booked
+
+
+def build_stream(policy, diners, rooms, booked, operations, rate=50.0,
+                 cancel_share=0.2, days=30, seed=2025):
+    """
+    Draw a stream of booking and cancel requests.
+
+    Args:
+        policy (ServicePolicy): Service hours to book in.
+        diners (list[str]): Diner names, most frequent first.
+        rooms (list[str]): Room names.
+        booked (list[tuple[datetime.datetime, str]]): Reservations that
+            may be cancelled; each is cancelled at most once.
+        operations (int): Length of the stream.
+        rate (float): Average arrivals per second. Defaults to 50.
+        cancel_share (float): Share of cancellations while there are
+            reservations left to cancel. Defaults to 0.2.
+        days (int): Open days, from three days ahead, to book in.
+        seed (int): Random seed; equal seeds give equal streams.
+
+    Returns:
+        list[Operation]: Operations in arrival order.
+
+    Raises:
+        ValueError: Without diners or rooms to book.
+    """
+    if not diners or not rooms:
+        raise ValueError("no generated diners or rooms, load a workload first")
+    gen = Generator(policy, diners, rooms, {}, seed)
+    rng = gen.rng
+    first = datetime.date.today() + datetime.timedelta(days=3)
+    open_dates = open_days(policy, first, days)
+    cancels = list(booked)
+    rng.shuffle(cancels)
+
+    stream = []
+    at = 0.0
+    for _ in range(operations):
+        # Quiet and rush periods alternate
+        burst = rng.random() < BURST_SHARE
+        at += rng.expovariate(rate * (BURST_FACTOR if burst else 1))
+        if cancels and rng.random() < cancel_share:
+            dtime, room = cancels.pop()
+            stream.append(Operation(at, "cancel", dtime, room, None, None))
+        else:
+            stream.append(Operation(at, "book", gen.start(open_dates),
+                                    gen.room(), gen.diner(), gen.group()))
+    return stream
+
+
+def _summary(samples):
+    """Summarize `(latency_ms, outcome)` samples of one operation kind."""
+    latencies = [ms for (ms, _) in samples]
+    if not latencies:
+        return {"count": 0, "outcomes": {}}
+    return {
+        "count": len(samples),
+        "outcomes": dict(Counter(outcome for (_, outcome) in samples)),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+    }
+
+
+def replay_stream(server, stream, workers=8, paced=False):
+    """
+    Run a stream against the BLL with concurrent worker threads.
+
+    Outcomes are the BLL result codes as strings ("True", "-7", ...), or
+    the exception class name when a call raised.
+
+    Args:
+        server (dict): Connection parameters for the database.
+        stream (list[Operation]): Operations from `build_stream`.
+        workers (int): Number of worker threads. Defaults to 8.
+        paced (bool): Submit each operation at its arrival time instead
+            of as fast as possible. Defaults to False.
+
+    Returns:
+        dict: Elapsed `seconds`, `throughput` (operations per second) and
+        a summary per kind: count, outcomes and p50/p95/p99 latency.
+    """
+    samples = {"book": [], "cancel": []}
+    lock = threading.Lock()
+
+    def run(op):
+        start = time.perf_counter()
+        try:
+            if op.kind == "book":
+                result = bll.add_reservation(server, op.dtime, op.room,
+                                             op.diner, op.group)
+            else:
+                result = bll.cancel_reservation(server, op.dtime, op.room)
+            outcome = str(result)
+        except Exception as e:
+            outcome = type(e).__name__
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            samples[op.kind].append((elapsed, outcome))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers,
+                            thread_name_prefix="loadgen") as pool:
+        for op in stream:
+            if paced:
+                delay = op.at - (time.perf_counter() - started)
+                if delay > 0:
+                    time.sleep(delay)
+            pool.submit(run, op)
+    seconds = time.perf_counter() - started
+    return {
+        "operations": len(stream),
+        "workers": workers,
+        "seconds": round(seconds, 3),
+        "throughput": round(len(stream) / seconds, 1) if seconds else None,
+        "book": _summary(samples["book"]),
+        "cancel": _summary(samples["cancel"]),
+    }
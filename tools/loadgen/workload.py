@@ -0,0 +1,250 @@
+"""
+Synthetic workloads shaped like real booking traffic.
+
+Generated rows follow the rules of `ProjectStarter.sql` and of
+`bll.reservations_service.add_reservation`:
+    - diner names are unique and phones look like "555-123-4567",
+    - allergies use the `type` and `level` enums, one row per type,
+    - every room belongs to an existing price class,
+    - reservations start within the service hours, at least two days
+      ahead, with a positive group size, and never overlap another
+      booking of the same room or diner.
+
+The shape mimics a busy omakase bar: most bookings fall in the middle of
+the evening and on Fridays and Saturdays, a few regulars account for a
+large share of the bookings, some diners list several allergies, and the
+cheaper classes have more rooms than the premium ones.
+
+All names start with `PREFIX`, so generated rows can be removed again.
+"""
+
+import datetime
+import math
+import random
+from itertools import accumulate
+from collections import namedtuple
+from ...dal.interval_index import IntervalIndex
+
+PREFIX = "Load "
+ALLERGY_TYPES = ("Dairy", "Shellfish", "Nuts", "Eggs", "Sesame", "Wheat",
+                 "Soy", "Other")
+ALLERGY_LEVELS = ("Sensitive", "Mild", "Severe")
+# Relative popularity of group sizes 1..6
+GROUP_WEIGHTS = (5, 40, 15, 25, 5, 10)
+# Relative traffic per weekday, Monday first
+DAY_WEIGHTS = (0.6, 0.7, 0.8, 1.0, 1.6, 1.7, 1.1)
+# Share of diners with allergies, and how many types they list
+ALLERGIC_SHARE = 0.3
+ALLERGY_COUNT_WEIGHTS = (6, 3, 1)
+# Skew of diner popularity; higher means fewer, busier regulars
+REPEAT_SKEW = 0.7
+# Fraction of the room slots the generated reservations fill
+OCCUPANCY = 0.6
+# Distance between two candidate start times
+SLOT_STEP = datetime.timedelta(minutes=30)
+# Tries to place one reservation before it is dropped
+ATTEMPTS = 8
+
+# A price class of the target database
+PriceClass = namedtuple("PriceClass", ["id", "name", "duration"])
+# Rows to load; diners and reservations refer to diners by name
+Workload = namedtuple("Workload",
+                      ["diners", "allergies", "rooms", "reservations"])
+
+
+def _evening_weights(starts):
+    """Weight the starts of one evening, peaking in the middle."""
+    n = len(starts)
+    return [1 + min(i, n - 1 - i) for i in range(n)]
+
+
+class Generator:
+    """
+    Draws diners, rooms, start times and allergies in the workload shape.
+
+    Attributes:
+        policy (ServicePolicy): Service hours to place bookings in.
+        diners (list[str]): Diner names, most frequent first.
+        rooms (list[str]): Room names.
+        rng (random.Random): Source of randomness.
+
+    Args:
+        policy (ServicePolicy): Service hours to place bookings in.
+        diners (list[str]): Diner names, most frequent first.
+        rooms (list[str]): Room names.
+        durations (dict[str, datetime.timedelta]): Duration per room.
+        seed (int): Random seed.
+    """
+    def __init__(self, policy, diners, rooms, durations, seed=2025):
+        self.policy = policy
+        self.diners = list(diners)
+        self.rooms = list(rooms)
+        self.rng = random.Random(seed)
+        self._durations = durations
+        # Cumulative weights make every draw a bisect instead of a sum
+        self._diner_weights = list(accumulate(
+            1 / (rank ** REPEAT_SKEW)
+            for rank in range(1, len(self.diners) + 1)))
+        self._days = None
+        self._day_weights = None
+        self._starts = {}
+
+    def duration(self, room):
+        """Return the experience duration of a room."""
+        return self._durations.get(room, self.policy.duration(room))
+
+    def room(self):
+        """Draw a room."""
+        return self.rng.choice(self.rooms)
+
+    def diner(self):
+        """Draw a diner, favouring the regulars."""
+        return self.rng.choices(self.diners,
+                                cum_weights=self._diner_weights)[0]
+
+    def group(self):
+        """Draw a group size."""
+        return self.rng.choices(range(1, 7), GROUP_WEIGHTS)[0]
+
+    def start(self, days):
+        """
+        Draw a start time among `days`, favouring weekends and mid-evening.
+
+        Args:
+            days (list[datetime.date]): Open days to choose from.
+
+        Returns:
+            datetime.datetime: The start time.
+        """
+        if days is not self._days:
+            self._days = days
+            self._day_weights = list(accumulate(
+                DAY_WEIGHTS[d.weekday()] for d in days))
+        day = self.rng.choices(days, cum_weights=self._day_weights)[0]
+        weekday = day.weekday()
+        if weekday not in self._starts:
+            # Times of day and their weights, the same every week
+            starts = [s.time() for s in self.policy.starts(day, SLOT_STEP)]
+            weights = list(accumulate(_evening_weights(starts)))
+            self._starts[weekday] = (starts, weights)
+        starts, weights = self._starts[weekday]
+        start = self.rng.choices(starts, cum_weights=weights)[0]
+        return datetime.datetime.combine(day, start)
+
+    def allergies(self, diner):
+        """Draw the allergy rows of one diner (usually none)."""
+        if self.rng.random() >= ALLERGIC_SHARE:
+            return []
+        count = self.rng.choices(range(1, 4), ALLERGY_COUNT_WEIGHTS)[0]
+        return [(diner, kind, self.rng.choice(ALLERGY_LEVELS))
+                for kind in self.rng.sample(ALLERGY_TYPES, count)]
+
+
+def _phone(number):
+    """Return a unique phone number in the `ddd-ddd-dddd` format."""
+    return f"555-{number // 10000:03d}-{number % 10000:04d}"
+
+
+def _room_rows(rng, classes, count):
+    """Draw `(room, tv, staff, class_id)` rows, favouring cheap classes."""
+    weights = [1 / (i + 1) for i in range(len(classes))]
+    picked = rng.choices(classes, weights, k=count)
+    return [(f"{PREFIX}Room {i:03d}", rng.randint(0, 1), "Staff", c.id)
+            for i, c in enumerate(picked, start=1)], picked
+
+
+def open_days(policy, first, count):
+    """
+    List the next `count` days with service hours from `first` on.
+
+    Args:
+        policy (ServicePolicy): Service hours.
+        first (datetime.date): First candidate day.
+        count (int): Number of open days wanted.
+
+    Returns:
+        list[datetime.date]: Open days in ascending order.
+
+    Raises:
+        ValueError: If the service hours leave every weekday closed.
+    """
+    if not policy.hours:
+        raise ValueError("no service hours to place reservations in")
+    days = []
+    day = first
+    while len(days) < count:
+        if policy.starts(day, SLOT_STEP):
+            days.append(day)
+        day += datetime.timedelta(days=1)
+    return days
+
+
+def generate_workload(policy, classes, reservations, diners=None, rooms=None,
+                      seed=2025):
+    """
+    Generate a workload of about `reservations` bookings.
+
+    The booking period is sized so the rooms are about `OCCUPANCY` full.
+    Requests that still collide after `ATTEMPTS` tries are dropped, so
+    the result can hold slightly fewer reservations than asked for.
+
+    Args:
+        policy (ServicePolicy): Service hours of the target database.
+        classes (list[PriceClass]): Its price classes, cheapest first.
+        reservations (int): Number of reservations wanted.
+        diners (int, optional): Number of diners. Defaults to one per
+            8 reservations, at least 50.
+        rooms (int, optional): Number of rooms. Defaults to one per
+            2,000 reservations, between 8 and 300.
+        seed (int): Random seed; equal seeds give equal workloads.
+
+    Returns:
+        Workload: `diners` as `(name, phone)`, `allergies` as `(diner,
+        type, level)`, `rooms` as `(room, tv, staff, class_id)` and
+        `reservations` as `(dtime, room, diner, group)` rows, the latter
+        sorted by time.
+
+    Raises:
+        ValueError: Without price classes or service hours.
+    """
+    if not classes:
+        raise ValueError("the database has no price classes")
+    diners = diners or max(50, reservations // 8)
+    rooms = rooms or max(8, min(300, reservations // 2000))
+    rng = random.Random(seed)
+    room_rows, picked = _room_rows(rng, list(classes), rooms)
+    durations = {row[0]: c.duration for row, c in zip(room_rows, picked)}
+    names = [f"{PREFIX}Diner {i:06d}" for i in range(1, diners + 1)]
+    gen = Generator(policy, names, list(durations), durations, seed)
+
+    diner_rows = [(name, _phone(i)) for i, name in enumerate(names, start=1)]
+    allergy_rows = [row for name in names for row in gen.allergies(name)]
+
+    # Size the period so the rooms end up about OCCUPANCY full
+    first = datetime.date.today() + datetime.timedelta(days=3)
+    days = open_days(policy, first, 7)
+    per_day = max(len(policy.starts(d, policy.longest)) for d in days)
+    day_count = math.ceil(reservations / (rooms * per_day * OCCUPANCY))
+    days = open_days(policy, first, max(1, day_count))
+
+    by_room = IntervalIndex(policy.longest)
+    by_diner = IntervalIndex(policy.longest)
+    booked = []
+    for _ in range(reservations):
+        diner = gen.diner()
+        for _ in range(ATTEMPTS):
+            start = gen.start(days)
+            room = gen.room()
+            end = start + gen.duration(room)
+            if by_room.overlaps(room, start, end):
+                continue
+            if by_diner.overlaps(diner, start, end):
+                # Regulars are often busy; try someone else
+                diner = gen.diner()
+                continue
+            by_room.add(room, start, end)
+            by_diner.add(diner, start, end)
+            booked.append((start, room, diner, gen.group()))
+            break
+    booked.sort()
+    return Workload(diner_rows, allergy_rows, room_rows, booked)